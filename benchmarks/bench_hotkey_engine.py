@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark režie HotkeyEngine na jeden stisk klávesy
+
+Zaregistruje mnoho zkratek (kombinace i double-press sekvence) a přehraje
+syntetický proud událostí přímo do HotkeyEngine.process_event - bez
+skutečného keyboard hooku.
+
+Spuštění:
+    python benchmarks/bench_hotkey_engine.py [počet_zkratek] [počet_stisků]
+"""
+from __future__ import annotations
+
+import random
+import string
+import sys
+import time
+from collections import namedtuple
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from transka.hotkey_engine import HotkeyEngine  # noqa: E402
+
+KeyEvent = namedtuple("KeyEvent", "event_type name time")
+
+MODIFIER_COMBOS = ["ctrl", "alt", "ctrl+alt", "ctrl+shift", "alt+shift", "ctrl+alt+shift"]
+KEYS = list(string.ascii_lowercase + string.digits) + [f"f{i}" for i in range(1, 13)]
+
+
+def build_engine(binding_count: int, fired: list) -> HotkeyEngine:
+    """Vytvoří engine s binding_count zkratkami (polovina double-press)"""
+    engine = HotkeyEngine(sequence_timeout=0.5)
+    # Bez skutečného hooku - události se předávají ručně
+    engine._ensure_hooked = lambda: None
+
+    rng = random.Random(42)
+    for i in range(binding_count):
+        combo = f"{rng.choice(MODIFIER_COMBOS)}+{rng.choice(KEYS)}"
+        if i % 2:
+            combo += "+" + combo.rsplit("+", 1)[1]
+        engine.add(f"binding_{i}", combo, lambda i=i: fired.append(i))
+    return engine
+
+
+def generate_events(keystrokes: int):
+    """Syntetický proud: modifikátor dolů, klávesa dolů/nahoru, modifikátor nahoru"""
+    rng = random.Random(7)
+    now = 0.0
+    events = []
+    for _ in range(keystrokes):
+        now += rng.uniform(0.05, 0.3)
+        modifier = rng.choice(["ctrl", "alt", "shift", None])
+        key = rng.choice(KEYS)
+        if modifier:
+            events.append(KeyEvent("down", modifier, now))
+        events.append(KeyEvent("down", key, now))
+        events.append(KeyEvent("up", key, now + 0.01))
+        if modifier:
+            events.append(KeyEvent("up", modifier, now + 0.02))
+    return events
+
+
+def main() -> None:
+    binding_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    keystrokes = int(sys.argv[2]) if len(sys.argv) > 2 else 200_000
+
+    for count in sorted({3, 100, binding_count}):
+        fired: list = []
+        engine = build_engine(count, fired)
+        events = generate_events(keystrokes)
+
+        start = time.perf_counter()
+        for event in events:
+            engine.process_event(event)
+        elapsed = time.perf_counter() - start
+
+        per_event_us = elapsed / len(events) * 1e6
+        print(
+            f"zkratek={count:>6}  událostí={len(events):>8}  "
+            f"{per_event_us:6.3f} µs/událost  spuštěno={len(fired)}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,407 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark 3-step workflow hlavní zkratky bez GUI
+
+Opakovaně projde celý cyklus HIDDEN → SHOWN → TRANSLATED → HIDDEN přes
+TranslationWorkflow.advance() - stejnou cestu, jakou volá hotkey v aplikaci.
+Místo Tk běží ruční smyčka událostí (FakeRoot), schránka i textová pole jsou
+v paměti a překladač je nastavitelný fake. Skutečný je MainThreadDispatcher,
+ChunkedTextLoader, Clipboard i worker vlákna překladu.
+
+Měří latenci jednotlivých kroků (p50/p95/p99/max), počet vláken a růst
+paměti přes tisíce cyklů - regrese v hotkey cestě se tak projeví v číslech.
+
+Spuštění:
+    python benchmarks/bench_workflow.py [--cycles 2000] [--chars 200]
+        [--latency-ms 0] [--jitter-ms 0] [--error-rate 0] [--trace-memory]
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import heapq
+import itertools
+import random
+import sys
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import transka.translation_workflow as workflow_module  # noqa: E402
+from transka.base_translator import BaseTranslator, UsageInfo  # noqa: E402
+from transka.clipboard import Clipboard  # noqa: E402
+from transka.dispatcher import MainThreadDispatcher  # noqa: E402
+from transka.metrics import Metrics  # noqa: E402
+from transka.translation_workflow import TranslationWorkflow, WorkflowState  # noqa: E402
+
+
+class FakeRoot:
+    """Náhrada tk.Tk - after/after_idle časovače spouštěné ručně přes pump()"""
+
+    def __init__(self):
+        self._timers: List[Tuple[float, int, str, Callable, tuple]] = []
+        self._cancelled: set = set()
+        self._ids = itertools.count()
+        self._clipboard = ""
+
+    def after(self, ms: int, callback: Callable, *args) -> str:
+        seq = next(self._ids)
+        after_id = f"after#{seq}"
+        heapq.heappush(self._timers, (time.perf_counter() + ms / 1000.0, seq, after_id, callback, args))
+        return after_id
+
+    def after_idle(self, callback: Callable, *args) -> str:
+        return self.after(0, callback, *args)
+
+    def after_cancel(self, after_id: str) -> None:
+        self._cancelled.add(after_id)
+
+    def pump(self) -> float:
+        """Spustí splatné časovače; vrátí dobu do dalšího (s)"""
+        now = time.perf_counter()
+        while self._timers and self._timers[0][0] <= now:
+            _, _, after_id, callback, args = heapq.heappop(self._timers)
+            if after_id in self._cancelled:
+                self._cancelled.discard(after_id)
+                continue
+            callback(*args)
+        return self._timers[0][0] - time.perf_counter() if self._timers else 0.001
+
+    def run_until(self, predicate: Callable[[], bool], timeout: float = 10.0) -> bool:
+        """Točí smyčku událostí, dokud neplatí predicate (jako mainloop)"""
+        deadline = time.perf_counter() + timeout
+        while not predicate():
+            if time.perf_counter() > deadline:
+                return False
+            wait = self.pump()
+            if not predicate():
+                time.sleep(min(max(wait, 0.0), 0.0005))
+        return True
+
+    # Tk schránka
+    def clipboard_clear(self) -> None:
+        self._clipboard = ""
+
+    def clipboard_append(self, text: str) -> None:
+        self._clipboard += text
+
+    def clipboard_get(self) -> str:
+        return self._clipboard
+
+
+class FakeText:
+    """Náhrada ScrolledText - podmnožina API, kterou používají loader a workflow"""
+
+    def __init__(self, root: FakeRoot):
+        self.root = root
+        self.content = ""
+        self.marks: Dict[str, int] = {}
+        self.modified = False
+        self.state = "normal"
+
+    def _index(self, index: str) -> int:
+        if index in self.marks:
+            return self.marks[index]
+        if index == "1.0":
+            return 0
+        return len(self.content)  # "end", "end-1c"
+
+    def insert(self, index: str, text: str) -> None:
+        pos = self._index(index)
+        self.content = self.content[:pos] + text + self.content[pos:]
+        for name, mark in self.marks.items():
+            if mark >= pos:
+                self.marks[name] = mark + len(text)
+        self.modified = True
+
+    def delete(self, first: str, last: str = None) -> None:
+        start, end = self._index(first), self._index(last or first)
+        self.content = self.content[:start] + self.content[end:]
+        self.marks = {name: min(mark, start) if mark > start else mark for name, mark in self.marks.items()}
+        self.modified = True
+
+    def get(self, first: str, last: str = None) -> str:
+        return self.content[self._index(first):self._index(last or "end")]
+
+    def edit_modified(self, flag: Optional[bool] = None):
+        if flag is None:
+            return self.modified
+        self.modified = bool(flag)
+
+    def mark_set(self, name: str, index: str) -> None:
+        self.marks[name] = self._index(index)
+
+    def mark_gravity(self, name: str, gravity: str) -> None:
+        pass
+
+    def mark_unset(self, name: str) -> None:
+        self.marks.pop(name, None)
+
+    def cget(self, option: str):
+        return self.state
+
+    def config(self, **options) -> None:
+        self.state = options.get("state", self.state)
+
+    configure = config
+
+    def after(self, ms: int, callback: Callable, *args) -> str:
+        return self.root.after(ms, callback, *args)
+
+    def after_idle(self, callback: Callable, *args) -> str:
+        return self.root.after_idle(callback, *args)
+
+    def after_cancel(self, after_id: str) -> None:
+        self.root.after_cancel(after_id)
+
+    def clipboard_clear(self) -> None:
+        self.root.clipboard_clear()
+
+    def clipboard_append(self, text: str) -> None:
+        self.root.clipboard_append(text)
+
+    def clipboard_get(self) -> str:
+        return self.root.clipboard_get()
+
+    def bind(self, *args, **kwargs) -> None:
+        pass
+
+    def focus(self) -> None:
+        pass
+
+
+class FakeTranslator(BaseTranslator):
+    """Překladač s nastavitelnou latencí a chybovostí"""
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0, seed: int = 1):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.calls = 0
+
+    def is_configured(self) -> bool:
+        return True
+
+    def translate(self, text: str, source_lang: str = "CS", target_lang: str = "EN-US"):
+        with self._lock:
+            self.calls += 1
+            delay = self.latency + self._rng.uniform(0, self.jitter)
+            fail = self._rng.random() < self.error_rate
+        if delay:
+            time.sleep(delay)
+        if fail:
+            return None, "Service unavailable (fake)"
+        return f"[{target_lang}] {text}", None
+
+    def get_usage(self):
+        return UsageInfo(0, 0, "Fake"), None
+
+    def get_available_languages(self):
+        return [], []
+
+    def update_api_key(self, api_key: str) -> None:
+        pass
+
+    @property
+    def service_name(self) -> str:
+        return "Fake"
+
+
+class _SilentMessagebox:
+    """Chybové dialogy workflow se v benchmarku jen počítají"""
+
+    shown = 0
+
+    @classmethod
+    def showerror(cls, *args, **kwargs) -> None:
+        cls.shown += 1
+
+    @classmethod
+    def askyesno(cls, *args, **kwargs) -> bool:
+        cls.shown += 1
+        return False
+
+
+def _app_snapshot() -> tracemalloc.Snapshot:
+    """Snapshot alokací bez vzorků samotného benchmarku"""
+    return tracemalloc.take_snapshot().filter_traces([
+        tracemalloc.Filter(False, __file__),
+        tracemalloc.Filter(False, tracemalloc.__file__),
+    ])
+
+
+def percentiles(values: List[float]) -> str:
+    """p50/p95/p99/max v ms"""
+    if not values:
+        return "-"
+    ordered = sorted(values)
+
+    def pick(q: float) -> float:
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000
+
+    return (
+        f"p50={pick(0.50):8.3f}  p95={pick(0.95):8.3f}  "
+        f"p99={pick(0.99):8.3f}  max={ordered[-1] * 1000:8.3f} ms"
+    )
+
+
+def make_text(cycle: int, chars: int) -> str:
+    """Vstup cyklu - každý cyklus jiný text (inkrementální překlad nic nepřevezme)"""
+    sentence = f"Věta číslo {cycle} pro benchmark hotkey workflow. "
+    return (sentence * (chars // len(sentence) + 1))[:chars]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--cycles", type=int, default=2000, help="Počet cyklů HIDDEN → SHOWN → TRANSLATED → HIDDEN")
+    parser.add_argument("--warmup", type=int, default=50, help="Cykly před začátkem měření")
+    parser.add_argument("--chars", type=int, default=200, help="Délka vstupního textu")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Latence fake překladače")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Náhodný rozptyl latence")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Podíl neúspěšných překladů")
+    parser.add_argument("--chunk-size", type=int, default=16384, help="Velikost dávky ChunkedTextLoader")
+    parser.add_argument("--trace-memory", action="store_true", help="Sledovat alokace přes tracemalloc (zpomaluje)")
+    args = parser.parse_args()
+
+    # Chybové dialogy by v benchmarku blokovaly
+    workflow_module.messagebox = _SilentMessagebox
+
+    root = FakeRoot()
+    input_widget, output_widget = FakeText(root), FakeText(root)
+    metrics = Metrics(enabled=True)
+    # FakeRoot.after je volatelné z jiných vláken jako after() ve vláknovém Tcl
+    dispatcher = MainThreadDispatcher(root, metrics=metrics, wake_from_threads=True)
+    dispatcher.start()
+    translator = FakeTranslator(args.latency_ms / 1000.0, args.jitter_ms / 1000.0, args.error_rate)
+
+    statuses: List[str] = []
+    workflow = TranslationWorkflow(
+        translator=translator,
+        source_lang="CS",
+        target_lang="EN-US",
+        input_widget=input_widget,
+        output_widget=output_widget,
+        status_callback=lambda text, color: statuses.append(text),
+        usage_update_callback=lambda: None,
+        metrics=metrics,
+        dispatcher=dispatcher,
+        clipboard=Clipboard(output_widget, backend="tk", metrics=metrics),
+        chunk_size=args.chunk_size
+    )
+
+    def translation_settled() -> bool:
+        last = statuses[-1] if statuses else ""
+        if last.startswith("Chyba"):
+            return True
+        return last.startswith("Přeloženo") and not workflow.output_loader.loading
+
+    steps: Dict[str, List[float]] = {"show": [], "translate_call": [], "translate_visible": [], "copy_hide": []}
+    thread_peak = threading.active_count()
+    failures = 0
+    timeouts = 0
+
+    def run_cycle(cycle: int, record: bool) -> None:
+        nonlocal thread_peak, failures, timeouts
+        text = make_text(cycle, args.chars)
+
+        # Krok 1: HIDDEN → SHOWN
+        start = time.perf_counter()
+        workflow.advance(root, show_window=lambda: None, hide_window=lambda: None)
+        shown = time.perf_counter()
+        root.pump()
+
+        # Uživatel nahradí text (po chybě překladu zůstává vstup v poli)
+        input_widget.delete("1.0", "end")
+        input_widget.insert("1.0", text)
+
+        # Krok 2: SHOWN → TRANSLATED (výsledek doručí worker přes dispatcher)
+        statuses.clear()
+        called_at = time.perf_counter()
+        workflow.advance(root, show_window=lambda: None, hide_window=lambda: None)
+        returned_at = time.perf_counter()
+        thread_peak = max(thread_peak, threading.active_count())
+        if not root.run_until(translation_settled):
+            timeouts += 1
+        visible_at = time.perf_counter()
+
+        # Krok 3: TRANSLATED → HIDDEN (kopie do schránky, vymazání polí)
+        copy_start = time.perf_counter()
+        workflow.advance(root, show_window=lambda: None, hide_window=lambda: None)
+        copy_end = time.perf_counter()
+        root.pump()
+
+        if workflow.get_state() != WorkflowState.HIDDEN:
+            raise RuntimeError(f"Cyklus {cycle}: workflow skončil ve stavu {workflow.get_state().name}")
+        translated = statuses and statuses[-1].startswith("Přeloženo")
+        if translated and root.clipboard_get() != f"[EN-US] {text}".strip():
+            failures += 1
+
+        if record:
+            steps["show"].append(shown - start)
+            steps["translate_call"].append(returned_at - called_at)
+            steps["translate_visible"].append(visible_at - called_at)
+            steps["copy_hide"].append(copy_end - copy_start)
+
+    for cycle in range(args.warmup):
+        run_cycle(cycle, record=False)
+
+    gc.collect()
+    threads_before = threading.active_count()
+    objects_before = len(gc.get_objects())
+    if args.trace_memory:
+        tracemalloc.start()
+    first_snapshot: Optional[tracemalloc.Snapshot] = None
+
+    started = time.perf_counter()
+    for cycle in range(args.warmup, args.warmup + args.cycles):
+        run_cycle(cycle, record=True)
+        if args.trace_memory and first_snapshot is None:
+            first_snapshot = _app_snapshot()
+    elapsed = time.perf_counter() - started
+
+    # Doběhnutí worker vláken posledního cyklu
+    time.sleep(0.05)
+    gc.collect()
+    threads_after = threading.active_count()
+    objects_after = len(gc.get_objects())
+
+    print(
+        f"cyklů={args.cycles}  znaků={args.chars}  latence={args.latency_ms:.1f}±{args.jitter_ms:.1f} ms  "
+        f"chybovost={args.error_rate:.2f}  celkem={elapsed:.2f} s  ({args.cycles / elapsed:.0f} cyklů/s)"
+    )
+    print("\nKroky (od volání advance):")
+    for name, values in steps.items():
+        print(f"  {name:<18} {percentiles(values)}")
+
+    snapshot = metrics.snapshot()
+    print("\nFáze workflow (Metrics, průměr):")
+    for (stage, backend), data in sorted(snapshot["histograms"].items()):
+        if data["count"]:
+            print(f"  {stage:<18} {data['sum'] / data['count'] * 1000:8.3f} ms  (n={data['count']})")
+
+    print("\nZdroje:")
+    print(f"  vlákna            před={threads_before}  po={threads_after}  špička={thread_peak}")
+    print(f"  objekty (gc)      před={objects_before}  po={objects_after}  rozdíl={objects_after - objects_before:+d}")
+    if first_snapshot is not None:
+        diff = _app_snapshot().compare_to(first_snapshot, "lineno")
+        growth = sum(stat.size_diff for stat in diff)
+        per_1000 = growth / max(1, args.cycles - 1) * 1000
+        print(f"  tracemalloc       {growth / 1024:+.1f} KiB celkem  ({per_1000 / 1024:+.2f} KiB / 1000 cyklů)")
+        for stat in diff[:3]:
+            if stat.size_diff > 0:
+                frame = stat.traceback[0]
+                print(f"    {frame.filename}:{frame.lineno}  {stat.size_diff / 1024:+.1f} KiB")
+        tracemalloc.stop()
+    print(f"  chybná schránka   {failures}  timeouty={timeouts}  chybové dialogy={_SilentMessagebox.shown}")
+
+    dispatcher.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -5,14 +5,31 @@ DeepL Translator - Desktop aplikace pro rychlý překlad
 __version__ = "1.0.0"
 
 # Hlavní exports pro použití jako knihovna
-from transka.deepl_translator import DeepLTranslator
-from transka.google_translator import GoogleTranslator
 from transka.base_translator import BaseTranslator, UsageInfo
 from transka.config import Config
 
+# Backendy se importují až při prvním přístupu (deepl/googletrans jsou těžké závislosti)
+_LAZY_EXPORTS = {
+    "DeepLTranslator": "transka.deepl_translator",
+    "GoogleTranslator": "transka.google_translator",
+    "LibreTranslateTranslator": "transka.libretranslate_translator",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module 'transka' has no attribute '{name}'")
+    import importlib
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
 __all__ = [
     "DeepLTranslator",
     "GoogleTranslator",
+    "LibreTranslateTranslator",
     "BaseTranslator",
     "UsageInfo",
     "Config",
@@ -3,43 +3,193 @@
 Transka - Desktop aplikace pro rychlý překlad
 """
 import tkinter as tk
-from tkinter import messagebox
+from tkinter import messagebox, filedialog
 import threading
+import time
 import sys
 import os
+import logging
+from pathlib import Path
+from typing import Any, Callable, Optional
 
 from transka.config import Config
-from transka.deepl_translator import DeepLTranslator
-from transka.google_translator import GoogleTranslator
+from transka.logging_setup import setup_logging
+from transka.backends import create_backend, load_backend
 from transka.base_translator import BaseTranslator, UsageInfo
 from transka.theme_manager import ThemeManager
 from transka.translation_workflow import TranslationWorkflow
 from transka.hotkey_manager import HotkeyManager
+from transka.hotkey_process import ProcessHotkeyBackend
+from transka.hotkey_engine import HotkeyEngine
 from transka.tray_manager import TrayManager
 from transka.gui_builder_v2 import GUIBuilderV2
+from transka.metrics import Metrics, MetricsExporter
+from transka.middleware import build_pipeline, get_backend
+from transka.router import RoutingTranslator
+from transka.translator_process import ProcessTranslator
+from transka.config_watcher import ConfigWatcher
+from transka.dispatcher import MainThreadDispatcher
+from transka.clipboard import Clipboard
+from transka.clipboard_watch import ClipboardWatcher, ClipboardPrefetcher
+from transka.watchdog import UIWatchdog
+from transka.profiler import SamplingProfiler
+from transka.diagnostics import MemoryDiagnostics
+from transka.history import TranslationHistory
+from transka.budget import BudgetScheduler, INTERACTIVE
+from transka.offline_queue import OfflineQueue, QueuedRequest
+from transka.documents import (
+    DocumentTranslator, DocumentJob, DOCUMENT_EXTENSIONS,
+    STATUS_DONE, STATUS_ERROR, STATUS_TRANSLATING, STATUS_DOWNLOADING
+)
 from transka.theme import COLORS
 
+# Logging setup
+logger = logging.getLogger(__name__)
+
 
 class TranslatorApp:
     """Hlavní aplikace pro překlad"""
 
+    # Klíče konfigurace, jejichž změna vyžaduje nové sestavení překladače
+    TRANSLATOR_KEYS = {
+        "translator_service",
+        "deepl_server_url",
+        "translator_process",
+        "translator_process_workers",
+        "translator_process_timeout",
+        "api_key",
+        "libretranslate_url",
+        "libretranslate_api_key",
+        "libretranslate_timeout",
+        "router_backends",
+        "router_size_buckets",
+        "router_objectives",
+        "router_quality",
+        "router_latency_budget",
+        "router_alpha",
+        "router_explore",
+        "translator_pipeline",
+        "cache_max_entries",
+        "retry_attempts",
+        "retry_backoff",
+        "rate_limit_per_second",
+    }
+
+    # Výchozí velikost okna (šířka, výška)
+    WINDOW_SIZE = (800, 720)
+
+    # Cílová latence hotkey → viditelné okno (s)
+    SHOW_LATENCY_BUDGET = 0.05
+
     def __init__(self):
         self.config = Config()
+
+        # Logování přes frontu - soubory zapisuje samostatné vlákno, ne Tk / hook vlákno
+        self.logging = setup_logging(
+            self.config.log_file,
+            level=self.config.log_level,
+            max_bytes=self.config.log_max_bytes,
+            backup_count=self.config.log_backup_count,
+            perf_file=self.config.perf_log_file
+        )
+
+        # Metriky latence (při vypnutí nulová režie)
+        self.metrics = Metrics(enabled=self.config.metrics_enabled)
+        self.metrics_exporter = MetricsExporter(
+            self.metrics,
+            self.config.metrics_file,
+            export_format=self.config.metrics_format,
+            interval=self.config.metrics_interval
+        )
+        self.metrics_exporter.start()
+
         self.translator = self._create_translator()
 
+        # Rozpočet znaků podle třídy požadavků + předpověď vyčerpání kvóty
+        self.budget = BudgetScheduler(
+            self.config.budget_ledger_file,
+            limits=self.config.budget_limits,
+            reset_day=self.config.budget_reset_day
+        )
+
+        # Offline fronta pro překlady, které selhaly na dočasné chybě
+        self.offline_queue: Optional[OfflineQueue] = None
+        if self.config.offline_queue_enabled:
+            self.offline_queue = OfflineQueue(
+                self.config.offline_queue_file,
+                translator_provider=lambda: self.translator,
+                on_result=lambda request, result, error: self.dispatcher.post(
+                    self._on_queued_result, request, result, error
+                ),
+                budget=self.budget
+            )
+
+        # Překlad dokumentů přes DeepL document API (na pozadí, více souběžně)
+        self.documents = DocumentTranslator(
+            client_provider=lambda: load_backend("deepl").from_config(self.config),
+            budget=self.budget,
+            max_concurrent=self.config.documents_max_concurrent,
+            timeout=self.config.documents_timeout,
+            on_update=lambda job: self.dispatcher.post_coalesced(("document", job.id), self._on_document_update, job)
+        )
+
         # Tkinter okno
         self.root = tk.Tk()
         self.root.title("Transka")
         # Větší okno pro lepší UX s většími input/output poli
-        self.root.geometry("800x720")
+        self.root.geometry("{}x{}".format(*self.WINDOW_SIZE))
         self._setup_window_icon()
 
+        # Jediná cesta z cizích vláken (hotkey hook, tray, workery) do Tk vlákna
+        self.dispatcher = MainThreadDispatcher(self.root, metrics=self.metrics)
+        self.dispatcher.start()
+
+        # Hlídání zaseknutí mainloopu (loguje stack blokujícího volání)
+        self.ui_watchdog: Optional[UIWatchdog] = None
+        if self.config.ui_watchdog_enabled:
+            self.ui_watchdog = UIWatchdog(
+                self.root,
+                threshold_ms=self.config.ui_stall_threshold_ms,
+                metrics=self.metrics
+            )
+            self.ui_watchdog.start()
+
+        # Profilování na vyžádání z tray menu (výsledek zapisuje vlákno profileru)
+        self.profiler = SamplingProfiler(
+            self.config.profiler_dir,
+            interval=self.config.profiler_interval_ms / 1000.0,
+            top_n=self.config.profiler_top_n,
+            on_finished=lambda path: self.dispatcher.post(self._on_profile_written, path)
+        )
+
+        # Diagnostika paměti z tray menu (snapshoty tracemalloc, diff proti základu)
+        self.diagnostics = MemoryDiagnostics(
+            self.config.diagnostics_dir,
+            top_n=self.config.diagnostics_top_n,
+            on_report=lambda path: self.dispatcher.post(self._on_diagnostics_written, path)
+        )
+        if self.config.diagnostics_trace_on_start:
+            self.diagnostics.start_tracing()
+
+        # Schránka přes Tk (bez spouštění procesů pro každou kopii)
+        self.clipboard = Clipboard(self.root, backend=self.config.clipboard_backend, metrics=self.metrics)
+
         # Theme Manager
         self.theme_manager = ThemeManager(self.root)
         self.theme_manager.apply_theme()
         fonts = self.theme_manager.get_fonts()
 
         # GUI Builder V2 (s tabs)
+        # Historie překladů (zápis na pozadí, hotkey cestu nezdržuje)
+        self.history: Optional[TranslationHistory] = None
+        if self.config.history_enabled:
+            self.history = TranslationHistory(
+                self.config.history_file,
+                max_entries=self.config.history_max_entries,
+                max_age_days=self.config.history_max_age_days
+            )
+            self.history.start()
+
         self.gui_builder = GUIBuilderV2(
             self.root,
             fonts,
@@ -48,7 +198,8 @@ class TranslatorApp:
             self.config.hotkey_main,
             self.config,
             self.translator,
-            parent_app=self
+            parent_app=self,
+            history=self.history
         )
 
         # Skrytí okna při startu
@@ -59,9 +210,12 @@ class TranslatorApp:
         widgets = self.gui_builder.build(
             on_translate=self._translate,
             on_clear=self._clear,
+            on_translate_document=self._translate_document,
             on_save_settings=self._save_settings,
             on_test_api=self._test_api,
-            on_close=self._hide_window
+            on_close=self._hide_window,
+            on_history_copy=self._copy_from_history,
+            on_history_restore=self._restore_from_history
         )
 
         # Uložení důležitých widgetů
@@ -80,31 +234,91 @@ class TranslatorApp:
             input_widget=self.input_text,
             output_widget=self.output_text,
             status_callback=self._update_status,
-            usage_update_callback=self._update_usage
+            usage_update_callback=self._update_usage,
+            metrics=self.metrics,
+            dispatcher=self.dispatcher,
+            clipboard=self.clipboard,
+            chunk_size=self.config.text_chunk_size,
+            preview_limit=self.config.text_preview_limit,
+            history=self.history,
+            incremental=self.config.incremental_translation,
+            budget=self.budget,
+            offline_queue=self.offline_queue
         )
 
+        # Multi-target: panely a souběžný překlad do dalších jazyků
+        self._apply_multi_targets()
+
+        # Vložení velkého textu ze schránky (Ctrl+V) po dávkách - UI nezamrzne
+        self.workflow.input_loader.bind_paste(self.clipboard.paste)
+
         # Window events
         self._setup_window_events()
 
-        # Hotkey Manager
+        # Předpočítaný layout i pozice okna - zobrazení pak jen deiconify
+        self._window_size = self.WINDOW_SIZE
+        self._window_geometry: Optional[str] = None
+        self._screen_size = (0, 0)
+        self._show_requested_at: Optional[float] = None
+        self.root.update_idletasks()
+        self._get_window_geometry()
+
+        # Hotkey Manager - callbacky se z hook vlákna pouze zařadí do fronty
         self.hotkey_manager = HotkeyManager(
             main_hotkey=self.config.hotkey_main,
             swap_hotkey=self.config.hotkey_swap,
             clear_hotkey=self.config.hotkey_clear,
-            workflow_callback=self._handle_main_hotkey,
-            swap_callback=self._swap_languages,
-            clear_callback=self._clear_input
+            workflow_callback=self._on_main_hotkey_pressed,
+            swap_callback=self.dispatcher.wrap(self._swap_languages),
+            clear_callback=self.dispatcher.wrap(self._clear_input),
+            backend=self._create_hotkey_backend()
         )
         self.hotkey_manager.register_hotkeys()
 
         # System Tray Manager
         self.tray_manager = TrayManager(
             app_name="Transka",
-            on_show=self._show_window,
-            on_quit=self._quit_app
+            on_show=self.dispatcher.wrap(self._show_window),
+            on_quit=self.dispatcher.wrap(self._quit_app),
+            extra_items=[
+                (self._profiling_menu_text, self.dispatcher.wrap(self._toggle_profiling)),
+                ("Paměť: nastavit základ", self.dispatcher.wrap(self._set_memory_baseline)),
+                ("Paměť: zpráva proti základu", self.dispatcher.wrap(self._write_memory_report)),
+            ]
         )
         self.tray_manager.start()
 
+        # Drainer fronty až s hotovým dispatcherem a tray ikonou (doručení výsledků)
+        if self.offline_queue is not None:
+            self.offline_queue.start()
+
+        # Hot reload konfigurace při změně souborů jinými nástroji
+        self.config_watcher = ConfigWatcher(
+            self.config,
+            on_change=self._on_config_files_changed,
+            poll_interval=self.config.config_watch_interval
+        )
+        if self.config.config_watch_enabled:
+            self.config_watcher.start()
+
+        # Prefetch překladu zkopírovaného textu (opt-in)
+        self.clipboard_watcher: Optional[ClipboardWatcher] = None
+        if self.config.clipboard_prefetch_enabled:
+            prefetcher = ClipboardPrefetcher(
+                translator_provider=lambda: self.translator,
+                languages_provider=lambda: (self.config.source_lang, self.config.target_lang),
+                budget=self.budget,
+                max_chars=self.config.clipboard_prefetch_max_chars
+            )
+            self.clipboard_watcher = ClipboardWatcher(
+                self.root,
+                self.clipboard,
+                self.dispatcher,
+                on_text=prefetcher.on_clipboard_text,
+                poll_interval=self.config.clipboard_watch_interval
+            )
+            self.clipboard_watcher.start()
+
         # Aktualizace usage při startu
         self._update_usage()
 
@@ -116,23 +330,65 @@ class TranslatorApp:
                 icon_img = tk.PhotoImage(file=icon_path)
                 self.root.iconphoto(True, icon_img)
         except Exception as e:
-            print(f"Nelze načíst ikonu: {e}")
+            logger.warning(f"Nelze načíst ikonu: {e}")
 
     def _create_translator(self) -> BaseTranslator:
-        """Vytvoří instance překladače podle konfigurace"""
-        service = self.config.translator_service.lower()
-        if service == "google":
-            return GoogleTranslator()
+        """Vytvoří překladač podle konfigurace a obalí ho middleware pipeline"""
+        if self.config.translator_process:
+            # Backend ve worker procesu, middleware pipeline zůstává tady
+            backend = ProcessTranslator.from_config(self.config, on_ready=self._on_translator_process_ready)
         else:
-            return DeepLTranslator(self.config.api_key)
+            backend = create_backend(self.config.translator_service, self.config)
+
+        return build_pipeline(backend, self.config.translator_pipeline, self.config, self.metrics)
+
+    def _on_translator_process_ready(self):
+        """Worker proces nahlásil stav backendu (čtecí vlákno) - obnova UI v hlavním vlákně"""
+        dispatcher = getattr(self, "dispatcher", None)
+        if dispatcher is not None:
+            dispatcher.post_coalesced("translator_ready", self._refresh_translator_state)
+
+    def _refresh_translator_state(self):
+        """Obnoví název překladače a počítadlo znaků podle aktuálního stavu backendu"""
+        self.translator_label.config(text=self._get_translator_display())
+        self._update_usage()
+
+    def _save_router_stats(self):
+        """Uloží statistiky routeru "auto" (nový router na ně naváže)"""
+        backend = get_backend(self.translator)
+        if isinstance(backend, RoutingTranslator):
+            backend.save_stats()
+
+    def _close_translator_process(self):
+        """Ukončí worker proces starého překladače (rozpracované požadavky nechá doběhnout)"""
+        backend = get_backend(self.translator)
+        if isinstance(backend, ProcessTranslator):
+            threading.Thread(
+                target=backend.close,
+                args=(backend.timeout,),
+                name="translator-close",
+                daemon=True
+            ).start()
+
+    def _create_hotkey_backend(self):
+        """Vytvoří backend zkratek podle konfigurace (engine/keyboard, v procesu/mimo)"""
+        use_engine = self.config.hotkey_engine == "engine"
+        if self.config.hotkey_process:
+            timeout = self.config.hotkey_sequence_timeout if use_engine else None
+            return ProcessHotkeyBackend(self.metrics, sequence_timeout=timeout)
+        if use_engine:
+            return HotkeyEngine(self.config.hotkey_sequence_timeout)
+        return None
 
     def _get_translator_display(self) -> str:
         """Vrátí název aktivního překladače"""
         service = self.config.translator_service.upper()
         if service == "GOOGLE":
             return "🔵 Google Translate"
-        else:
+        elif service == "DEEPL":
             return "🟢 DeepL"
+        else:
+            return f"🟣 {self.translator.service_name}"
 
     def _get_language_display(self) -> str:
         """Vrátí formátovaný string s aktuálními jazyky"""
@@ -147,70 +403,90 @@ class TranslatorApp:
         # Keyboard shortcuts pro tab switching
         self.root.bind("<Control-Key-1>", lambda e: self.gui_builder.switch_to_translation_tab())
         self.root.bind("<Control-Key-2>", lambda e: self.gui_builder.switch_to_settings_tab())
+        self.root.bind("<Control-Key-3>", lambda e: self.gui_builder.switch_to_history_tab())
+
+        # Cache geometrie + měření latence zobrazení
+        self.root.bind("<Configure>", self._on_root_configure)
+        self.root.bind("<Map>", self._on_root_map)
 
-    def _handle_main_hotkey(self):
+    def _on_root_configure(self, event):
+        """Změna velikosti okna zneplatní cache geometrie"""
+        if event.widget is not self.root:
+            return
+        size = (event.width, event.height)
+        if size != self._window_size and event.width > 1 and event.height > 1:
+            self._window_size = size
+            self._window_geometry = None
+
+    def _on_root_map(self, event):
+        """Okno je viditelné - zaznamená latenci od stisku zkratky"""
+        if event.widget is not self.root or self._show_requested_at is None:
+            return
+        latency = time.perf_counter() - self._show_requested_at
+        self._show_requested_at = None
+        self.metrics.observe("show_latency", latency)
+        if latency > self.SHOW_LATENCY_BUDGET:
+            self.metrics.inc("show_over_budget")
+            logger.debug(f"Zobrazení okna trvalo {latency * 1000:.1f} ms (cíl {self.SHOW_LATENCY_BUDGET * 1000:.0f} ms)")
+
+    def _get_window_geometry(self) -> str:
+        """Vrátí geometrii vycentrovaného okna (přepočet jen při změně velikosti/obrazovky)"""
+        screen_size = (self.root.winfo_screenwidth(), self.root.winfo_screenheight())
+        if self._window_geometry is None or screen_size != self._screen_size:
+            window_width, window_height = self._window_size
+            x = (screen_size[0] - window_width) // 2
+            y = (screen_size[1] - window_height) // 2
+            self._screen_size = screen_size
+            self._window_geometry = f"{window_width}x{window_height}+{x}+{y}"
+        return self._window_geometry
+
+    def _on_main_hotkey_pressed(self):
+        """Hook vlákno - zaznamená čas stisku a předá zkratku do hlavního vlákna"""
+        self.dispatcher.post(self._handle_main_hotkey, time.perf_counter())
+
+    def _handle_main_hotkey(self, pressed_at: Optional[float] = None):
         """
         Zpracuje hlavní klávesovou zkratku (3-step workflow s smart detection)
 
-        State 0 (HIDDEN) → zobraz okno → State 1 (SHOWN)
-        State 1 (SHOWN):
-          - JE přeložený text v output? → zkopíruj a zavři (skip překladu)
-          - NENÍ přeložený text? → přelož text → State 2 (TRANSLATED)
-        State 2 (TRANSLATED) → zkopíruj, vymaž, zavři, restore fokus → State 0 (HIDDEN)
+        Stavový automat je v TranslationWorkflow.advance() - aplikace dodává
+        jen zobrazení a skrytí okna (benchmark ho tak může řídit bez GUI).
+
+        Args:
+            pressed_at: Čas stisku zkratky (perf_counter) pro měření latence zobrazení
         """
-        state = self.workflow.get_state()
-
-        if state == TranslationWorkflow.STATE_HIDDEN:
-            # Krok 1: Otevře okno (vždy na Translation tab)
-            self._show_window()
-            self.gui_builder.switch_to_translation_tab()  # Force Translation tab
-            self.workflow.set_state(TranslationWorkflow.STATE_SHOWN)
-
-        elif state == TranslationWorkflow.STATE_SHOWN:
-            # Smart detection: Pokud už existuje přeložený text (např. z Ctrl+Enter),
-            # přeskoč překlad a rovnou zkopíruj + zavři
-            translated_text = self.output_text.get("1.0", "end-1c").strip()
-
-            if translated_text:
-                # Existuje přeložený text → zkopíruj a zavři (jako krok 3)
-                self.workflow.copy_translation_and_clear()
-                self._hide_window()
-                self.workflow.restore_previous_window()
-                self.workflow.reset_state()
-            else:
-                # Žádný přeložený text → normální překlad (krok 2)
-                self.workflow.translate_with_display(self.root)
-                self.workflow.set_state(TranslationWorkflow.STATE_TRANSLATED)
-
-        elif state == TranslationWorkflow.STATE_TRANSLATED:
-            # Krok 3: Zkopíruje, vymaže, zavře
-            self.workflow.copy_translation_and_clear()
-            self._hide_window()
-            self.workflow.restore_previous_window()
-            self.workflow.reset_state()
+        with self.metrics.span("hotkey", self.translator.service_name):
+            self.workflow.advance(
+                self.root,
+                show_window=lambda: self._show_translation_window(pressed_at),
+                hide_window=self._hide_window
+            )
+
+    def _show_translation_window(self, requested_at: Optional[float] = None):
+        """Zobrazí okno vždy na Translation tabu (krok 1 workflow)"""
+        self._show_window(requested_at)
+        self.gui_builder.switch_to_translation_tab()
+
+    def _show_window(self, requested_at: Optional[float] = None):
+        """
+        Zobrazí překladové okno vycentrované na střed obrazovky
+
+        Geometrie je předpočítaná (bez update_idletasks a dotazů na velikost
+        při každém zobrazení) a nastaví se ještě před deiconify.
 
-    def _show_window(self):
-        """Zobrazí překladové okno a vycentruje ho na střed obrazovky"""
+        Args:
+            requested_at: Čas požadavku (perf_counter) - latence se měří do <Map>
+        """
         if not self.is_visible:
+            self._show_requested_at = requested_at or time.perf_counter()
+
             # Uložení předchozího okna pro restore fokus
             self.workflow.save_previous_window()
 
+            self.root.geometry(self._get_window_geometry())
             self.root.deiconify()
-
-            # Centrování okna
-            self.root.update_idletasks()
-            window_width = self.root.winfo_width()
-            window_height = self.root.winfo_height()
-            screen_width = self.root.winfo_screenwidth()
-            screen_height = self.root.winfo_screenheight()
-
-            x = (screen_width - window_width) // 2
-            y = (screen_height - window_height) // 2
-
-            self.root.geometry(f"{window_width}x{window_height}+{x}+{y}")
             self.root.lift()
-            self.root.focus_force()
-            self.input_text.focus()
+            # Fokus aplikace i input pole v jednom kroku
+            self.input_text.focus_force()
             self.is_visible = True
 
     def _hide_window(self):
@@ -228,14 +504,51 @@ class TranslatorApp:
         """Vymaže textová pole"""
         self.workflow.clear_all()
 
+    def _translate_document(self):
+        """Vybere dokumenty a odešle je k překladu přes DeepL (tlačítko Dokument)"""
+        if not self.config.api_key:
+            messagebox.showwarning("Překlad dokumentů", "Překlad dokumentů vyžaduje DeepL API klíč (Nastavení).")
+            return
+
+        patterns = " ".join(f"*{ext}" for ext in DOCUMENT_EXTENSIONS)
+        paths = filedialog.askopenfilenames(
+            parent=self.root,
+            title="Přeložit dokumenty (DeepL)",
+            filetypes=[("Dokumenty", patterns), ("Všechny soubory", "*.*")]
+        )
+        if not paths:
+            return
+
+        for path in paths:
+            self.documents.submit(Path(path), self.config.source_lang, self.config.target_lang)
+        self._update_status(f"📄 Odesílám dokumenty ({len(paths)})...", COLORS["status_working"])
+
+    def _on_document_update(self, job: DocumentJob):
+        """Průběh překladu dokumentu (hlavní vlákno)"""
+        name = job.source_path.name
+        if job.status == STATUS_DONE:
+            self._update_status(f"📄 Přeloženo: {job.output_path.name}", COLORS["status_ready"])
+            self.tray_manager.notify("Transka - dokument přeložen", str(job.output_path))
+            self._update_usage()
+        elif job.status == STATUS_ERROR:
+            self._update_status(f"📄 {name}: {job.error}", COLORS["status_error"])
+            self.tray_manager.notify("Transka - překlad dokumentu selhal", f"{name}: {job.error}")
+        elif job.status == STATUS_TRANSLATING:
+            remaining = f" (zbývá ~{job.seconds_remaining} s)" if job.seconds_remaining else ""
+            self._update_status(f"📄 {name}: překládám{remaining}", COLORS["status_working"])
+        elif job.status == STATUS_DOWNLOADING:
+            self._update_status(f"📄 {name}: stahuji", COLORS["status_working"])
+        else:
+            self._update_status(f"📄 {name}: nahrávám", COLORS["status_working"])
+
     def _swap_languages(self):
         """Prohodí zdrojový a cílový jazyk (Ctrl+S+S)"""
         # Swap jazyků v config
         old_source = self.config.source_lang
         old_target = self.config.target_lang
 
-        self.config.set("source_lang", old_target)
-        self.config.set("target_lang", old_source)
+        # Jedna odložená změna (zápis na disk proběhne mimo UI vlákno)
+        self.config.update({"source_lang": old_target, "target_lang": old_source})
 
         # Aktualizace workflow
         self.workflow.update_languages(self.config.source_lang, self.config.target_lang)
@@ -251,8 +564,8 @@ class TranslatorApp:
 
     def _clear_input(self):
         """Vymaže pouze input pole (Ctrl+C+C)"""
-        # Vymaže input pole
-        self.input_text.delete("1.0", "end")
+        # Vymaže input pole (i rozpracované vkládání velkého textu)
+        self.workflow.input_loader.clear()
 
         # Fokus na input pole (pokud je okno viditelné)
         if self.is_visible:
@@ -268,12 +581,25 @@ class TranslatorApp:
         """Aktualizuje status label"""
         self.status_label.config(text=text, foreground=color)
 
+    def _set_usage_label(self, text: str, color: str):
+        """Aktualizuje usage label (pouze v hlavním vlákně)"""
+        self.usage_label.config(text=text, foreground=color)
+
     def _update_usage(self):
         """Aktualizuje počítadlo znaků"""
+        backend = get_backend(self.translator)
+        if isinstance(backend, ProcessTranslator) and not backend.ready:
+            # Worker proces ještě startuje - zavolá se znovu po "ready" (_refresh_translator_state)
+            return
+
         def update_thread():
             usage_info, error = self.translator.get_usage()
 
             if usage_info:
+                self.budget.update_quota(usage_info)
+                forecast = self.budget.format_forecast()
+                usage_text = usage_info.formatted_usage + (f" · {forecast}" if forecast else "")
+
                 # Kontrola limitu
                 if usage_info.character_count >= self.config.usage_warning_threshold:
                     color = COLORS["status_error"]
@@ -282,30 +608,26 @@ class TranslatorApp:
                 else:
                     color = COLORS["status_ready"]
 
-                self.root.after(
-                    0,
-                    lambda: self.usage_label.config(
-                        text=usage_info.formatted_usage,
-                        foreground=color
-                    )
+                self.dispatcher.post_coalesced(
+                    "usage",
+                    self._set_usage_label,
+                    usage_text,
+                    color
                 )
 
                 # Varování při dosažení prahu
                 if usage_info.is_near_limit:
-                    self.root.after(
-                        0,
-                        lambda: messagebox.showwarning(
-                            "Varování",
-                            f"Blížíte se limitu API!\n\n{usage_info.formatted_usage}"
-                        )
+                    self.dispatcher.post(
+                        messagebox.showwarning,
+                        "Varování",
+                        f"Blížíte se limitu API!\n\n{usage_info.formatted_usage}"
                     )
             elif error:
-                self.root.after(
-                    0,
-                    lambda: self.usage_label.config(
-                        text=f"Usage: {error}",
-                        foreground=COLORS["status_error"]
-                    )
+                self.dispatcher.post_coalesced(
+                    "usage",
+                    self._set_usage_label,
+                    f"Usage: {error}",
+                    COLORS["status_error"]
                 )
 
         if self.translator.is_configured():
@@ -314,42 +636,95 @@ class TranslatorApp:
     def _on_settings_saved(self):
         """Callback po uložení nastavení"""
         # Re-kreovat překladač
+        self._save_router_stats()
+        self._close_translator_process()
         self.translator = self._create_translator()
         self.workflow.update_translator(self.translator)
         self.workflow.update_languages(self.config.source_lang, self.config.target_lang)
+        self._apply_multi_targets()
 
         # Aktualizace GUI
         self.translator_label.config(text=self._get_translator_display())
         self.lang_label.config(text=self._get_language_display())
         self._update_usage()
 
+    def _on_config_files_changed(self, new_config, api_key: str):
+        """Callback watcheru (watcher vlákno) - aplikace proběhne v hlavním vlákně"""
+        self.dispatcher.post(self._apply_reloaded_config, new_config, api_key)
+
+    def _apply_reloaded_config(self, new_config, api_key: str):
+        """Aplikuje pouze změněné části externě upravené konfigurace"""
+        changed = self.config.apply_snapshot(new_config, api_key)
+        if not changed:
+            return
+
+        # Přeregistrace pouze změněných zkratek
+        if "hotkey_main" in changed:
+            self.hotkey_manager.update_main_hotkey(self.config.hotkey_main)
+        if "hotkey_swap" in changed:
+            self.hotkey_manager.update_swap_hotkey(self.config.hotkey_swap)
+        if "hotkey_clear" in changed:
+            self.hotkey_manager.update_clear_hotkey(self.config.hotkey_clear)
+
+        # Překladač se sestavuje znovu jen při změně služby, klíče nebo pipeline
+        if changed & self.TRANSLATOR_KEYS:
+            self._save_router_stats()
+            self._close_translator_process()
+            self.translator = self._create_translator()
+            self.workflow.update_translator(self.translator)
+            self.translator_label.config(text=self._get_translator_display())
+            self._update_usage()
+
+        if changed & {"source_lang", "target_lang"}:
+            self.workflow.update_languages(self.config.source_lang, self.config.target_lang)
+            self.lang_label.config(text=self._get_language_display())
+
+        if changed & {"multi_target_enabled", "multi_targets", "target_lang"}:
+            self._apply_multi_targets()
+
+        if "log_level" in changed:
+            self.logging.set_level(self.config.log_level)
+
+        if changed & {"budget_limits", "budget_reset_day"}:
+            # Změna na místě - všichni odběratelé sdílí jednu instanci (a jeden zapisovatel ledgeru)
+            self.budget.configure(self.config.budget_limits, self.config.budget_reset_day)
+
+        self.gui_builder.reload_settings_values()
+        self._update_status("🔁 Konfigurace znovu načtena", COLORS["status_ready"])
+
     def _save_settings(self):
         """Uloží nastavení z Settings tab"""
         settings = self.gui_builder.get_settings_values()
 
+        try:
+            threshold = int(settings["usage_warning_threshold"])
+        except ValueError:
+            messagebox.showerror("Chyba", "Neplatná hodnota pro práh varování")
+            return
+
+        # Původní zkratky (pro porovnání před přepsáním configu)
+        old_main_hotkey = self.config.hotkey_main
+        old_swap_hotkey = self.config.hotkey_swap
+        old_clear_hotkey = self.config.hotkey_clear
+
         # API klíč
         new_api_key = settings["api_key"]
         if new_api_key != self.config.api_key:
             self.config.set_api_key(new_api_key)
             self.translator.update_api_key(new_api_key)
 
-        # Ostatní nastavení
-        self.config.set("translator_service", settings["translator_service"])
-        self.config.set("source_lang", settings["source_lang"])
-        self.config.set("target_lang", settings["target_lang"])
-        self.config.set("hotkey_main", settings["hotkey_main"])
-        self.config.set("hotkey_swap", settings["hotkey_swap"])
-        self.config.set("hotkey_clear", settings["hotkey_clear"])
-
-        try:
-            threshold = int(settings["usage_warning_threshold"])
-            self.config.set("usage_warning_threshold", threshold)
-        except ValueError:
-            messagebox.showerror("Chyba", "Neplatná hodnota pro práh varování")
-            return
+        # Ostatní nastavení - jeden odložený zápis
+        self.config.update({
+            "translator_service": settings["translator_service"],
+            "source_lang": settings["source_lang"],
+            "target_lang": settings["target_lang"],
+            "hotkey_main": settings["hotkey_main"],
+            "hotkey_swap": settings["hotkey_swap"],
+            "hotkey_clear": settings["hotkey_clear"],
+            "usage_warning_threshold": threshold,
+        })
 
         # Okamžitá aplikace změn - hlavní zkratka
-        old_main_hotkey = self.config.hotkey_main
         new_main_hotkey = settings["hotkey_main"]
 
         if old_main_hotkey != new_main_hotkey:
@@ -359,7 +734,6 @@ class TranslatorApp:
                 return
 
         # Okamžitá aplikace změn - swap zkratka
-        old_swap_hotkey = self.config.hotkey_swap
         new_swap_hotkey = settings["hotkey_swap"]
 
         if old_swap_hotkey != new_swap_hotkey:
@@ -369,7 +743,6 @@ class TranslatorApp:
                 return
 
         # Okamžitá aplikace změn - clear zkratka
-        old_clear_hotkey = self.config.hotkey_clear
         new_clear_hotkey = settings["hotkey_clear"]
 
         if old_clear_hotkey != new_clear_hotkey:
@@ -382,7 +755,7 @@ class TranslatorApp:
         self._on_settings_saved()
 
     def _test_api(self):
-        """Test připojení k DeepL API"""
+        """Test připojení k DeepL API (síťová volání mimo UI vlákno)"""
         settings = self.gui_builder.get_settings_values()
         new_api_key = settings["api_key"]
 
@@ -390,29 +763,155 @@ class TranslatorApp:
             messagebox.showerror("Chyba", "Zadejte API klíč")
             return
 
-        # Dočasný translator pro test
-        test_translator = DeepLTranslator(new_api_key)
+        self.gui_builder.test_api_button.config(state=tk.DISABLED)
+        self._update_status("Testuji API...", COLORS["status_working"])
 
-        if not test_translator.is_configured():
-            messagebox.showerror("Chyba", "Nepodařilo se inicializovat DeepL API")
-            return
+        def test_thread():
+            # Dočasný translator pro test
+            test_translator = load_backend("deepl")(new_api_key)
+
+            if not test_translator.is_configured():
+                self.dispatcher.post(
+                    self._show_test_api_result,
+                    messagebox.showerror,
+                    "Chyba",
+                    "Nepodařilo se inicializovat DeepL API"
+                )
+                return
 
-        # Test překladu
-        result, error = test_translator.translate("Ahoj", "CS", "EN-US")
+            # Test překladu
+            result, error = test_translator.translate("Ahoj", "CS", "EN-US")
+
+            if error:
+                self.dispatcher.post(
+                    self._show_test_api_result,
+                    messagebox.showerror,
+                    "Chyba API",
+                    f"Test selhal:\n{error}"
+                )
+                return
 
-        if error:
-            messagebox.showerror("Chyba API", f"Test selhal:\n{error}")
-        else:
             usage_info, usage_error = test_translator.get_usage()
             if usage_info:
-                messagebox.showinfo(
-                    "Úspěch",
+                message = (
                     f"API klíč funguje!\n\n"
                     f"Test překladu: Ahoj → {result}\n\n"
                     f"Spotřeba: {usage_info.formatted_usage}"
                 )
             else:
-                messagebox.showinfo("Úspěch", f"API klíč funguje!\n\nTest překladu: Ahoj → {result}")
+                message = f"API klíč funguje!\n\nTest překladu: Ahoj → {result}"
+            self.dispatcher.post(self._show_test_api_result, messagebox.showinfo, "Úspěch", message)
+
+        threading.Thread(target=test_thread, name="test-api", daemon=True).start()
+
+    def _show_test_api_result(self, show: Callable[[str, str], Any], title: str, message: str):
+        """Zobrazí výsledek testu API (hlavní vlákno)"""
+        self.gui_builder.test_api_button.config(state=tk.NORMAL)
+        self._update_status("Připraveno", COLORS["text_primary"])
+        show(title, message)
+
+    def _apply_multi_targets(self):
+        """Vytvoří output panely dalších cílových jazyků podle konfigurace"""
+        languages = []
+        if self.config.multi_target_enabled:
+            for lang in self.config.multi_targets:
+                if lang != self.config.target_lang and lang not in languages:
+                    languages.append(lang)
+        panes = self.gui_builder.set_extra_output_panes(languages)
+        self.workflow.set_extra_targets(panes)
+
+    def _on_queued_result(self, request: QueuedRequest, result: Optional[str], error: Optional[str]):
+        """Doručí výsledek z offline fronty (hlavní vlákno)"""
+        if error:
+            self._update_status(f"Fronta: překlad selhal - {error}", COLORS["status_error"])
+            self.tray_manager.notify("Transka - fronta", f"Překlad z fronty selhal: {error}")
+            return
+
+        if self.history is not None:
+            self.history.record(
+                request.source_text,
+                result,
+                request.source_lang,
+                request.target_lang,
+                self.translator.service_name
+            )
+
+        if request.request_class == INTERACTIVE:
+            self.clipboard.copy(result)
+            message = f"Překlad ({request.target_lang}) z offline fronty je ve schránce"
+        else:
+            message = f"Překlad ({request.target_lang}) z offline fronty je v historii"
+        self._update_status(f"📥 {message}", COLORS["status_ready"])
+        self.tray_manager.notify("Transka", message)
+
+    def _profiling_menu_text(self) -> str:
+        """Text položky profilování v tray menu"""
+        if self.profiler.running:
+            return "Zastavit profilování"
+        return f"Spustit profilování ({self.config.profiler_duration:.0f} s)"
+
+    def _toggle_profiling(self):
+        """Spustí / zastaví sampling profiler (z tray menu)"""
+        if self.profiler.running:
+            self.profiler.stop()
+            self._update_status("⏱ Ukládám profil...", COLORS["status_working"])
+        else:
+            self.profiler.start(self.config.profiler_duration)
+            self._update_status("⏱ Profilování běží", COLORS["status_working"])
+        self.tray_manager.refresh_menu()
+
+    def _on_profile_written(self, path: Optional[Path]):
+        """Výsledek profilování je na disku (hlavní vlákno)"""
+        self.tray_manager.refresh_menu()
+        if path is None:
+            self._update_status("Profil se nepodařilo uložit", COLORS["status_error"])
+            return
+        self._update_status(f"⏱ Profil uložen: {path.name}", COLORS["status_ready"])
+        self.tray_manager.notify("Transka - profil", str(path))
+
+    def _set_memory_baseline(self):
+        """Uloží základ diagnostiky paměti (z tray menu)"""
+        self.diagnostics.set_baseline()
+        self._update_status("🧠 Základ paměti uložen", COLORS["status_ready"])
+
+    def _write_memory_report(self):
+        """Sebere údaje z Tk a spustí zprávu o paměti na pozadí (z tray menu)"""
+        def widget_chars(widget) -> int:
+            counted = widget.count("1.0", "end-1c", "chars")
+            if isinstance(counted, int):
+                return counted
+            return counted[0] if counted else 0
+
+        extra = {
+            "Čekající Tk after callbacky": len(self.root.tk.splitlist(self.root.tk.call("after", "info"))),
+            "Tcl příkazy (Python callbacky)": len(self.root.tk.splitlist(self.root.tk.call("info", "commands"))),
+            "Znaků ve vstupu": widget_chars(self.workflow.input_widget),
+            "Znaků ve výstupu": widget_chars(self.workflow.output_widget),
+        }
+        self.diagnostics.report(extra)
+        self._update_status("🧠 Měřím paměť...", COLORS["status_working"])
+
+    def _on_diagnostics_written(self, path: Optional[Path]):
+        """Zpráva o paměti je na disku (hlavní vlákno)"""
+        if path is None:
+            self._update_status("Zprávu o paměti se nepodařilo uložit", COLORS["status_error"])
+            return
+        self._update_status(f"🧠 Zpráva o paměti: {path.name}", COLORS["status_ready"])
+        self.tray_manager.notify("Transka - diagnostika", str(path))
+
+    def _copy_from_history(self, text: str):
+        """Zkopíruje překlad z historie do schránky"""
+        self.clipboard.copy(text)
+        self._update_status("📋 Překlad z historie zkopírován", COLORS["status_ready"])
+
+    def _restore_from_history(self, source_text: str, translated_text: str):
+        """Otevře záznam z historie v Překladu (hotkey pak rovnou zkopíruje)"""
+        self.gui_builder.clear_placeholder_if_active()
+        self.workflow.input_loader.load(source_text)
+        self.workflow.output_loader.load(translated_text)
+        self.gui_builder.switch_to_translation_tab()
+        self.workflow.set_state(TranslationWorkflow.STATE_SHOWN)
+        self._update_status("↩️ Obnoveno z historie", COLORS["status_ready"])
 
     def _show_settings_tab(self):
         """Zobrazí okno s Settings tabem"""
@@ -423,6 +922,26 @@ class TranslatorApp:
         """Ukončí aplikaci"""
         self.tray_manager.stop()
         self.hotkey_manager.unregister_all()
+        self.config_watcher.stop()
+        if self.ui_watchdog is not None:
+            self.ui_watchdog.stop()
+        if self.clipboard_watcher is not None:
+            self.clipboard_watcher.stop()
+        self.profiler.stop()
+        self.metrics_exporter.stop()
+        self._save_router_stats()
+        backend = get_backend(self.translator)
+        if isinstance(backend, ProcessTranslator):
+            # Zaseknutý požadavek nesmí zdržet ukončení - proces se po 1 s ukončí násilně
+            backend.close()
+        if self.offline_queue is not None:
+            self.offline_queue.stop()
+        self.documents.stop()
+        if self.history is not None:
+            self.history.close()
+        self.config.flush()
+        self.dispatcher.stop()
+        self.logging.stop()
         self.root.quit()
         sys.exit(0)
 
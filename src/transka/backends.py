@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""
+Registr překladových backendů pro aplikaci Transka
+Backendy se hledají přes entry points (skupina "transka.backends") a
+importují se líně - načte se jen modul zvoleného backendu
+"""
+from __future__ import annotations
+
+import importlib
+import threading
+import logging
+from typing import Dict, List, Type
+
+from transka.base_translator import BaseTranslator
+
+# Logging setup
+logger = logging.getLogger(__name__)
+
+# Skupina entry points pro backendy třetích stran
+ENTRY_POINT_GROUP = "transka.backends"
+
+# Vestavěné backendy ("modul:třída") - fungují i bez instalace balíčku (spuštění ze src)
+BUILTIN_BACKENDS: Dict[str, str] = {
+    "deepl": "transka.deepl_translator:DeepLTranslator",
+    "google": "transka.google_translator:GoogleTranslator",
+    "libretranslate": "transka.libretranslate_translator:LibreTranslateTranslator",
+    "auto": "transka.router:RoutingTranslator",
+}
+
+# Výchozí backend při neznámém názvu
+DEFAULT_BACKEND = "deepl"
+
+_lock = threading.Lock()
+_targets: Dict[str, str] = {}
+_loaded: Dict[str, Type[BaseTranslator]] = {}
+
+
+def _discover() -> Dict[str, str]:
+    """Najde backendy (jen metadata entry points, nic se neimportuje)"""
+    with _lock:
+        if _targets:
+            return _targets
+
+        targets = dict(BUILTIN_BACKENDS)
+        try:
+            from importlib.metadata import entry_points
+            eps = entry_points()
+            # Python 3.10+ má select(), starší verze vrací dict podle skupin
+            group = eps.select(group=ENTRY_POINT_GROUP) if hasattr(eps, "select") else eps.get(ENTRY_POINT_GROUP, [])
+            for ep in group:
+                name = ep.name.lower()
+                if name in BUILTIN_BACKENDS and ep.value != BUILTIN_BACKENDS[name]:
+                    logger.warning(f"Plugin '{ep.value}' nemůže nahradit vestavěný backend '{name}'")
+                    continue
+                targets[name] = ep.value
+        except Exception as e:
+            logger.warning(f"Nelze načíst entry points backendů: {e}")
+
+        _targets.update(targets)
+        return _targets
+
+
+def available_backends() -> List[str]:
+    """Názvy všech dostupných backendů (vestavěné první)"""
+    targets = _discover()
+    plugins = sorted(name for name in targets if name not in BUILTIN_BACKENDS)
+    return list(BUILTIN_BACKENDS) + plugins
+
+
+def load_backend(name: str) -> Type[BaseTranslator]:
+    """
+    Naimportuje třídu backendu podle názvu
+
+    Args:
+        name: Název backendu (např. "deepl", "libretranslate")
+
+    Returns:
+        Třída odvozená od BaseTranslator
+
+    Raises:
+        KeyError: Neznámý backend
+        ImportError: Backend nebo jeho závislost nelze naimportovat
+    """
+    name = name.lower()
+    cached = _loaded.get(name)
+    if cached is not None:
+        return cached
+
+    target = _discover()[name]
+    module_name, _, attr = target.partition(":")
+    cls = getattr(importlib.import_module(module_name), attr)
+    if not (isinstance(cls, type) and issubclass(cls, BaseTranslator)):
+        raise ImportError(f"Backend '{name}' ({target}) není BaseTranslator")
+
+    _loaded[name] = cls
+    return cls
+
+
+def create_backend(name: str, config) -> BaseTranslator:
+    """
+    Vytvoří backend podle názvu z konfigurace
+
+    Neznámý nebo nenačitatelný backend se nahradí DEFAULT_BACKEND, aby
+    aplikace nastartovala i s překlepem v config.json.
+
+    Args:
+        name: Název backendu
+        config: Instance Config
+
+    Returns:
+        Instance backendu (bez middleware)
+    """
+    try:
+        cls = load_backend(name)
+    except KeyError:
+        logger.error(f"Neznámý překladač '{name}', použije se {DEFAULT_BACKEND}")
+        cls = load_backend(DEFAULT_BACKEND)
+    except ImportError as e:
+        logger.error(f"Překladač '{name}' nelze načíst ({e}), použije se {DEFAULT_BACKEND}")
+        cls = load_backend(DEFAULT_BACKEND)
+    return cls.from_config(config)
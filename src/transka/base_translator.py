@@ -1,12 +1,47 @@
 # -*- coding: utf-8 -*-
 """
 Abstraktní rozhraní pro překladače
-Umožňuje snadné přepínání mezi DeepL a Google Translate
+Umožňuje snadné přepínání mezi backendy (DeepL, Google, LibreTranslate, pluginy)
 """
 from abc import ABC, abstractmethod
 from typing import Optional, Tuple, List
 from dataclasses import dataclass
 
+# Fragmenty chybových hlášek, které značí dočasný výpadek (síť, 5xx, throttling)
+TRANSIENT_ERROR_MARKERS = (
+    "timed out",
+    "timeout",
+    "connection",
+    "max retries",
+    "temporarily",
+    "too many requests",
+    "service unavailable",
+    "bad gateway",
+    "gateway timeout",
+    "internal server error",
+    "status code: 429",
+    "status code: 5",
+)
+
+
+def is_transient_error(error: Optional[str]) -> bool:
+    """
+    Rozhodne, zda chybová zpráva překladače značí dočasnou chybu
+
+    Překladače vrací chyby jako text (Tuple (výsledek, chyba)), proto se
+    klasifikuje podle obsahu zprávy. Chyby klíče nebo limitu nejsou dočasné.
+
+    Args:
+        error: Chybová zpráva z translate() / get_usage()
+
+    Returns:
+        True pokud má smysl požadavek opakovat
+    """
+    if not error:
+        return False
+    lowered = error.lower()
+    return any(marker in lowered for marker in TRANSIENT_ERROR_MARKERS)
+
 
 @dataclass
 class UsageInfo:
@@ -36,6 +71,22 @@ class UsageInfo:
 class BaseTranslator(ABC):
     """Abstraktní třída pro všechny překladače"""
 
+    @classmethod
+    def from_config(cls, config) -> "BaseTranslator":
+        """
+        Vytvoří překladač z konfigurace (používá registr backendů)
+
+        Výchozí implementace předá API klíč; backend s vlastním nastavením
+        metodu přepíše.
+
+        Args:
+            config: Instance Config
+
+        Returns:
+            Instance překladače
+        """
+        return cls(config.api_key)
+
     @abstractmethod
     def is_configured(self) -> bool:
         """Kontrola, zda je translator nakonfigurován"""
@@ -61,6 +112,34 @@ class BaseTranslator(ABC):
         """
         pass
 
+    def translate_batch(
+        self,
+        texts: List[str],
+        source_lang: str = "CS",
+        target_lang: str = "EN-US"
+    ) -> Tuple[Optional[List[str]], Optional[str]]:
+        """
+        Přeloží více textů najednou
+
+        Výchozí implementace překládá postupně po jednom; backend, jehož API
+        přijímá seznam textů, ji přepíše jedním požadavkem.
+
+        Args:
+            texts: Texty k překladu
+            source_lang: Zdrojový jazyk
+            target_lang: Cílový jazyk
+
+        Returns:
+            Tuple (přeložené texty ve stejném pořadí, chybová zpráva)
+        """
+        results = []
+        for text in texts:
+            result, error = self.translate(text, source_lang, target_lang)
+            if error:
+                return None, error
+            results.append(result)
+        return results, None
+
     @abstractmethod
     def get_usage(self) -> Tuple[Optional[UsageInfo], Optional[str]]:
         """
@@ -0,0 +1,338 @@
+# -*- coding: utf-8 -*-
+"""
+Budget Scheduler pro aplikaci Transka
+Sleduje denní spotřebu znaků podle třídy požadavků, předpovídá vyčerpání
+kvóty a podle předpovědi brzdí méně důležité požadavky
+"""
+from __future__ import annotations
+
+import datetime
+import json
+import threading
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional
+
+from transka.base_translator import UsageInfo
+from transka.config import atomic_write_text
+
+# Logging setup
+logger = logging.getLogger(__name__)
+
+# Třídy požadavků (od nejvyšší priority)
+INTERACTIVE = "interactive"
+BATCH = "batch"
+PREFETCH = "prefetch"
+
+# Výchozí limity tříd (0 = bez limitu)
+DEFAULT_LIMITS: Dict[str, Dict[str, int]] = {
+    INTERACTIVE: {"daily": 0, "monthly": 0},
+    BATCH: {"daily": 50000, "monthly": 0},
+    PREFETCH: {"daily": 20000, "monthly": 200000},
+}
+
+# Počet dní, ze kterých se počítá burn rate
+BURN_RATE_WINDOW = 7
+
+# Jak dlouho se drží denní záznamy v ledgeru
+LEDGER_RETENTION_DAYS = 62
+
+
+@dataclass
+class BudgetDecision:
+    """Rozhodnutí o požadavku"""
+    allowed: bool
+    reason: str = ""
+    retry_after: float = 0.0  # Sekundy do doby, kdy má smysl zkusit znovu (odložení)
+
+
+@dataclass
+class Forecast:
+    """Předpověď vyčerpání kvóty"""
+    burn_rate: float  # Průměr znaků za den
+    remaining: int  # Zbývající znaky kvóty
+    period_end: datetime.date  # Konec zúčtovacího období (reset kvóty)
+    exhaustion_date: Optional[datetime.date]  # None = kvóta do konce období vystačí
+
+    @property
+    def pressure(self) -> float:
+        """Poměr dnů do vyčerpání ku dnům do resetu (< 1 = kvóta nevystačí)"""
+        days_to_reset = max(1, (self.period_end - datetime.date.today()).days)
+        if self.burn_rate <= 0:
+            return float("inf")
+        return (self.remaining / self.burn_rate) / days_to_reset
+
+
+class BudgetScheduler:
+    """
+    Rozpočet znaků podle třídy požadavků + předpověď vyčerpání kvóty
+
+    Ledger (JSON) drží spotřebu po dnech a třídách a přežije restart.
+    Burn rate je průměr posledních BURN_RATE_WINDOW dnů; spolu se stavem
+    kvóty z get_usage() dává datum vyčerpání. Když předpověď ukazuje
+    vyčerpání před resetem kvóty, odkládá se nejdřív prefetch, při
+    větším tlaku i dávkové požadavky. Interaktivní překlady omezují jen
+    explicitně nastavené limity.
+
+    Souběžní odběratelé (workflow, prefetch, fronta, dokumenty) si znaky
+    rezervují přes reserve() a po dokončení je vyrovnají přes commit() -
+    rozpracované požadavky se tak započítají do limitu dřív, než se zapíšou.
+    """
+
+    def __init__(
+        self,
+        ledger_path: Path,
+        limits: Optional[Dict[str, Dict[str, int]]] = None,
+        reset_day: int = 1
+    ):
+        """
+        Inicializuje BudgetScheduler
+
+        Args:
+            ledger_path: Soubor ledgeru (JSON)
+            limits: Limity tříd {třída: {"daily": n, "monthly": n}}, 0 = bez limitu
+            reset_day: Den v měsíci, kdy se obnovuje kvóta API
+        """
+        self.ledger_path = Path(ledger_path)
+        self._lock = threading.Lock()
+        self._days: Dict[str, Dict[str, int]] = {}
+        self._quota_count: Optional[int] = None
+        self._quota_limit: Optional[int] = None
+        self._reserved: Dict[str, int] = {}  # Rozpracované rezervace podle třídy (jen v paměti)
+        self.configure(limits, reset_day)
+        self._load()
+
+    def configure(self, limits: Optional[Dict[str, Dict[str, int]]] = None, reset_day: int = 1) -> None:
+        """
+        Změní limity a den resetu za běhu (hot reload konfigurace)
+
+        Instance je sdílená všemi odběrateli (workflow, prefetch, fronta,
+        dokumenty) - ledger tak zapisuje jen jedna instance a spotřeba se
+        při změně nastavení neztratí.
+
+        Args:
+            limits: Limity tříd {třída: {"daily": n, "monthly": n}}, 0 = bez limitu
+            reset_day: Den v měsíci, kdy se obnovuje kvóta API
+        """
+        merged = {name: dict(values) for name, values in DEFAULT_LIMITS.items()}
+        for name, values in (limits or {}).items():
+            merged.setdefault(name, {}).update(values)
+        with self._lock:
+            self.limits = merged
+            self.reset_day = min(max(1, reset_day), 28)
+
+    # --- Ledger ---
+
+    def _load(self) -> None:
+        """Načte ledger z disku"""
+        if not self.ledger_path.exists():
+            return
+        try:
+            data = json.loads(self.ledger_path.read_text(encoding="utf-8"))
+            self._days = {day: dict(classes) for day, classes in data.get("days", {}).items()}
+            quota = data.get("quota") or {}
+            self._quota_count = quota.get("count")
+            self._quota_limit = quota.get("limit")
+        except (OSError, ValueError) as e:
+            logger.warning(f"Nelze načíst ledger rozpočtu {self.ledger_path}: {e}")
+
+    def _save(self) -> None:
+        """Uloží ledger (volá se pod zámkem)"""
+        cutoff = (datetime.date.today() - datetime.timedelta(days=LEDGER_RETENTION_DAYS)).isoformat()
+        self._days = {day: classes for day, classes in self._days.items() if day >= cutoff}
+        data = {
+            "days": self._days,
+            "quota": {"count": self._quota_count, "limit": self._quota_limit},
+        }
+        try:
+            atomic_write_text(self.ledger_path, json.dumps(data, indent=2))
+        except OSError as e:
+            logger.error(f"Nelze uložit ledger rozpočtu: {e}")
+
+    # --- Spotřeba ---
+
+    def check(self, request_class: str, chars: int) -> BudgetDecision:
+        """
+        Rozhodne, zda požadavek dané třídy smí proběhnout (nic nezapisuje)
+
+        Args:
+            request_class: INTERACTIVE / BATCH / PREFETCH
+            chars: Odhad počtu znaků požadavku
+
+        Returns:
+            BudgetDecision (retry_after > 0 = odložit, ne zahodit)
+        """
+        return self._decide(request_class, chars, reserve=False)
+
+    def reserve(self, request_class: str, chars: int) -> BudgetDecision:
+        """
+        Jako check(), ale povolené znaky rovnou rezervuje
+
+        Rozhodnutí a rezervace proběhnou pod jedním zámkem - souběžné
+        požadavky si nemůžou rozebrat stejný zbytek rozpočtu. Každou
+        povolenou rezervaci je nutné vyrovnat přes commit().
+
+        Args:
+            request_class: INTERACTIVE / BATCH / PREFETCH
+            chars: Odhad počtu znaků požadavku (rezervuje se jen při allowed)
+
+        Returns:
+            BudgetDecision
+        """
+        return self._decide(request_class, chars, reserve=True)
+
+    def commit(self, request_class: str, reserved: int, chars: int) -> None:
+        """
+        Uvolní rezervaci a zaznamená skutečně odeslané znaky
+
+        Args:
+            request_class: Třída z reserve()
+            reserved: Rezervovaný počet znaků
+            chars: Skutečně odeslané znaky (0 = chyba, zásah cache)
+        """
+        with self._lock:
+            pending = self._reserved.get(request_class, 0) - reserved
+            self._reserved[request_class] = max(0, pending)
+        self.record(request_class, chars)
+
+    def _decide(self, request_class: str, chars: int, reserve: bool) -> BudgetDecision:
+        """Rozhodnutí o požadavku včetně rozpracovaných rezervací"""
+        limits = self.limits.get(request_class, {})
+        today = datetime.date.today()
+        # Předpověď bere zámek sama - spočítá se předem
+        forecast = self.forecast() if request_class != INTERACTIVE else None
+
+        with self._lock:
+            pending = self._reserved.get(request_class, 0)
+            spent_today = self._days.get(today.isoformat(), {}).get(request_class, 0) + pending
+            spent_period = self._spent_in_period(request_class, today) + pending
+            reserved_total = sum(self._reserved.values())
+
+            daily = limits.get("daily", 0)
+            monthly = limits.get("monthly", 0)
+            if daily and spent_today + chars > daily:
+                return BudgetDecision(False, f"Denní rozpočet ({request_class}) vyčerpán", _seconds_to_midnight())
+
+            if monthly and spent_period + chars > monthly:
+                retry_after = (self._period_end(today) - today).days * 86400.0 + _seconds_to_midnight()
+                return BudgetDecision(False, f"Měsíční rozpočet ({request_class}) vyčerpán", retry_after)
+
+            # Předpověď - méně důležité třídy se brzdí, když kvóta nevystačí do resetu
+            if forecast is not None:
+                if forecast.remaining - reserved_total < chars:
+                    return BudgetDecision(False, "Kvóta API vyčerpána", 0.0)
+                threshold = 1.0 if request_class == PREFETCH else 0.5
+                if forecast.pressure < threshold:
+                    return BudgetDecision(
+                        False,
+                        f"Odloženo - kvóta podle předpovědi dojde {forecast.exhaustion_date:%d.%m.}",
+                        _seconds_to_midnight()
+                    )
+
+            if reserve:
+                self._reserved[request_class] = pending + chars
+        return BudgetDecision(True)
+
+    def record(self, request_class: str, chars: int) -> None:
+        """Zaznamená skutečně odeslané znaky"""
+        if chars <= 0:
+            return
+        today = datetime.date.today().isoformat()
+        with self._lock:
+            day = self._days.setdefault(today, {})
+            day[request_class] = day.get(request_class, 0) + chars
+            if self._quota_count is not None:
+                # Průběžný odhad do příští aktualizace z get_usage()
+                self._quota_count += chars
+            self._save()
+
+    def update_quota(self, usage: UsageInfo) -> None:
+        """Aktualizuje stav kvóty z get_usage()"""
+        with self._lock:
+            self._quota_count = usage.character_count
+            self._quota_limit = usage.character_limit
+            self._save()
+
+    # --- Předpověď ---
+
+    def burn_rate(self) -> float:
+        """Průměrná spotřeba znaků za den (všechny třídy)"""
+        today = datetime.date.today()
+        with self._lock:
+            if not self._days:
+                return 0.0
+            first = min(datetime.date.fromisoformat(day) for day in self._days)
+            window = max(1, min(BURN_RATE_WINDOW, (today - first).days + 1))
+            total = 0
+            for offset in range(window):
+                day = (today - datetime.timedelta(days=offset)).isoformat()
+                total += sum(self._days.get(day, {}).values())
+        return total / window
+
+    def forecast(self) -> Optional[Forecast]:
+        """
+        Předpoví datum vyčerpání kvóty
+
+        Returns:
+            Forecast, nebo None pokud kvóta není známá (např. Google bez limitu)
+        """
+        with self._lock:
+            count, limit = self._quota_count, self._quota_limit
+        if count is None or not limit:
+            return None
+
+        today = datetime.date.today()
+        remaining = max(0, limit - count)
+        burn = self.burn_rate()
+        period_end = self._period_end(today)
+
+        exhaustion = None
+        if burn > 0:
+            exhaustion = today + datetime.timedelta(days=int(remaining / burn))
+            if exhaustion >= period_end:
+                exhaustion = None
+        elif remaining == 0:
+            exhaustion = today
+        return Forecast(burn, remaining, period_end, exhaustion)
+
+    def format_forecast(self) -> str:
+        """Krátký text pro UI (prázdný, pokud předpověď není k dispozici)"""
+        forecast = self.forecast()
+        if forecast is None or forecast.burn_rate <= 0:
+            return ""
+        if forecast.exhaustion_date is None:
+            return f"vystačí do {forecast.period_end:%d.%m.}"
+        return f"⚠ dojde ~{forecast.exhaustion_date:%d.%m.}"
+
+    # --- Období ---
+
+    def _period_end(self, today: datetime.date) -> datetime.date:
+        """Datum příštího resetu kvóty"""
+        if today.day < self.reset_day:
+            return today.replace(day=self.reset_day)
+        year, month = (today.year + 1, 1) if today.month == 12 else (today.year, today.month + 1)
+        return datetime.date(year, month, self.reset_day)
+
+    def _period_start(self, today: datetime.date) -> datetime.date:
+        """Datum posledního resetu kvóty"""
+        if today.day >= self.reset_day:
+            return today.replace(day=self.reset_day)
+        year, month = (today.year - 1, 12) if today.month == 1 else (today.year, today.month - 1)
+        return datetime.date(year, month, self.reset_day)
+
+    def _spent_in_period(self, request_class: str, today: datetime.date) -> int:
+        """Spotřeba třídy od posledního resetu kvóty (volá se pod zámkem)"""
+        start = self._period_start(today).isoformat()
+        return sum(
+            classes.get(request_class, 0)
+            for day, classes in self._days.items()
+            if day >= start
+        )
+
+
+def _seconds_to_midnight() -> float:
+    """Sekundy do půlnoci (nový denní rozpočet)"""
+    now = datetime.datetime.now()
+    midnight = datetime.datetime.combine(now.date() + datetime.timedelta(days=1), datetime.time())
+    return (midnight - now).total_seconds()
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""
+Clipboard pro aplikaci Transka
+Kopírování a čtení schránky přes běžící Tk (bez spouštění xclip/xsel procesů),
+pyperclip pouze jako fallback
+"""
+from __future__ import annotations
+
+import time
+import logging
+from typing import Optional
+
+import tkinter as tk
+
+from transka.metrics import Metrics
+
+# Logging setup
+logger = logging.getLogger(__name__)
+
+
+class Clipboard:
+    """
+    Schránka nad Tk interpretem aplikace
+
+    Tk pracuje se schránkou přímo (Win32 API / X11 selection), takže kopie
+    nestojí spuštění procesu jako pyperclip na Linuxu. Metody se smí
+    volat jen z hlavního (Tk) vlákna - ostatní vlákna používají dispatcher.
+    """
+
+    def __init__(self, widget: tk.Misc, backend: str = "tk", metrics: Optional[Metrics] = None):
+        """
+        Inicializuje Clipboard
+
+        Args:
+            widget: Libovolný Tk widget (root) - přístup ke schránce
+            backend: "tk" (výchozí) nebo "pyperclip"
+            metrics: Volitelné metriky (latence kopírování)
+        """
+        self.widget = widget
+        self.backend = backend
+        self.metrics = metrics or Metrics(enabled=False)
+
+    def copy(self, text: str) -> None:
+        """Zkopíruje text do schránky"""
+        start = time.perf_counter()
+        used = self.backend
+        if self.backend == "tk":
+            try:
+                self.widget.clipboard_clear()
+                self.widget.clipboard_append(text)
+            except tk.TclError as e:
+                logger.debug(f"Tk schránka selhala, používám pyperclip: {e}")
+                used = "pyperclip"
+                self._pyperclip_copy(text)
+        else:
+            self._pyperclip_copy(text)
+        self.metrics.observe("clipboard_copy", time.perf_counter() - start, used)
+
+    def paste(self) -> str:
+        """
+        Přečte text ze schránky
+
+        Returns:
+            Text ve schránce nebo prázdný string (prázdná / netextová schránka)
+        """
+        start = time.perf_counter()
+        used = self.backend
+        text = ""
+        if self.backend == "tk":
+            try:
+                text = self.widget.clipboard_get()
+            except tk.TclError:
+                # Prázdná nebo netextová schránka - žádný fallback proces
+                text = ""
+        else:
+            text = self._pyperclip_paste()
+        self.metrics.observe("clipboard_paste", time.perf_counter() - start, used)
+        return text
+
+    @staticmethod
+    def _pyperclip_copy(text: str) -> None:
+        """Fallback kopírování přes pyperclip (lazy import)"""
+        import pyperclip
+        pyperclip.copy(text)
+
+    @staticmethod
+    def _pyperclip_paste() -> str:
+        """Fallback čtení přes pyperclip (lazy import)"""
+        try:
+            import pyperclip
+            return pyperclip.paste() or ""
+        except Exception as e:
+            logger.debug(f"Nelze přečíst schránku: {e}")
+            return ""
@@ -0,0 +1,315 @@
+# -*- coding: utf-8 -*-
+"""
+Clipboard Watch pro aplikaci Transka
+Sleduje změny schránky a spekulativně předpřekládá zkopírovaný text,
+aby byl výsledek v cache dřív, než uživatel otevře okno
+"""
+from __future__ import annotations
+
+import re
+import sys
+import threading
+import logging
+from typing import Callable, Optional, Tuple
+
+import tkinter as tk
+
+from transka.base_translator import BaseTranslator
+from transka.clipboard import Clipboard
+from transka.dispatcher import MainThreadDispatcher
+from transka.middleware import CacheMiddleware, cache_contains, find_layer
+from transka.budget import BudgetScheduler, PREFETCH
+
+# Logging setup
+logger = logging.getLogger(__name__)
+
+# Win32 konstanty
+_WM_CLIPBOARDUPDATE = 0x031D
+_WM_QUIT = 0x0012
+_HWND_MESSAGE = -3
+
+_WORD_RE = re.compile(r"[^\W\d_]+", re.UNICODE)
+
+# Charakteristická slova a znaky jazyků (heuristika, ne detektor jazyka)
+_STOPWORDS = {
+    "CS": {"a", "je", "se", "na", "že", "to", "v", "ve", "jsem", "není", "pro", "jak", "ale", "by", "co", "si", "jsou"},
+    "EN": {"the", "and", "is", "to", "of", "in", "that", "it", "for", "you", "with", "this", "are", "be", "on", "not"},
+    "DE": {"der", "die", "das", "und", "ist", "nicht", "ich", "zu", "mit", "sie", "ein", "eine", "auf", "für"},
+    "PL": {"i", "w", "nie", "się", "na", "jest", "że", "to", "do", "z", "jak", "ale", "czy"},
+    "FR": {"le", "la", "les", "et", "est", "de", "des", "un", "une", "que", "pour", "pas", "dans"},
+    "ES": {"el", "la", "los", "las", "y", "es", "de", "que", "en", "un", "una", "por", "para", "no"},
+    "IT": {"il", "la", "e", "è", "di", "che", "non", "un", "una", "per", "con", "sono", "del"},
+}
+_CHARSETS = {
+    "CS": set("áčďéěíňóřšťúůýž"),
+    "PL": set("ąćęłńóśźż"),
+    "DE": set("äöüß"),
+}
+
+
+def looks_like_language(text: str, lang: str) -> bool:
+    """
+    Levná heuristika, zda text vypadá jako daný jazyk
+
+    Args:
+        text: Kontrolovaný text
+        lang: Kód jazyka ve formátu DeepL (CS, EN-US, AUTO, ...)
+
+    Returns:
+        True pokud text pravděpodobně odpovídá jazyku (AUTO vždy True)
+    """
+    base = lang.split("-")[0].upper()
+    if base == "AUTO":
+        return True
+
+    words = _WORD_RE.findall(text.lower())
+    if not words:
+        return False
+
+    if base == "RU":
+        cyrillic = sum(1 for ch in text if "Ѐ" <= ch <= "ӿ")
+        return cyrillic / max(1, sum(len(w) for w in words)) > 0.5
+
+    if base not in _STOPWORDS:
+        # Jazyk bez profilu - nelze rozhodnout, prefetch se nespouští
+        return False
+    stopword_ratios = {
+        code: sum(1 for word in words if word in stopwords) / len(words)
+        for code, stopwords in _STOPWORDS.items()
+    }
+    stopword_ratio = stopword_ratios.pop(base)
+
+    letters = "".join(words)
+    foreign_marks = set()
+    for other, charset in _CHARSETS.items():
+        if other != base:
+            foreign_marks |= charset
+    own_marks = _CHARSETS.get(base, set())
+
+    own_ratio = sum(1 for ch in letters if ch in own_marks) / len(letters)
+    foreign_ratio = sum(1 for ch in letters if ch in foreign_marks - own_marks) / len(letters)
+
+    if foreign_ratio > own_ratio and foreign_ratio > 0.005:
+        return False
+    if own_marks and own_ratio > 0.01:
+        return True
+    return stopword_ratio >= 0.08 and stopword_ratio >= max(stopword_ratios.values())
+
+
+class ClipboardWatcher:
+    """
+    Event-driven sledování změn schránky
+
+    Na Windows čeká vlákno v GetMessage na WM_CLIPBOARDUPDATE
+    (AddClipboardFormatListener) - žádné probouzení bez změny. Jinde se
+    obsah schránky kontroluje v intervalu přes Tk v hlavním vlákně.
+    """
+
+    def __init__(
+        self,
+        root: tk.Tk,
+        clipboard: Clipboard,
+        dispatcher: MainThreadDispatcher,
+        on_text: Callable[[str], None],
+        poll_interval: float = 1.0
+    ):
+        """
+        Inicializuje ClipboardWatcher
+
+        Args:
+            root: Hlavní Tkinter okno (fallback polling)
+            clipboard: Clipboard instance pro čtení obsahu
+            dispatcher: Dispatcher do hlavního vlákna
+            on_text: Callback s novým textem schránky (hlavní vlákno)
+            poll_interval: Interval fallback pollingu v sekundách
+        """
+        self.root = root
+        self.clipboard = clipboard
+        self.dispatcher = dispatcher
+        self.on_text = on_text
+        self.poll_interval_ms = max(250, int(poll_interval * 1000))
+        self._last_text: Optional[str] = None
+        self._thread: Optional[threading.Thread] = None
+        self._thread_id: Optional[int] = None
+        self._after_id: Optional[str] = None
+        self._running = False
+
+    def start(self) -> None:
+        """Spustí sledování"""
+        if self._running:
+            return
+        self._running = True
+        self._last_text = self.clipboard.paste()
+
+        if sys.platform == "win32":
+            self._thread = threading.Thread(target=self._run_windows, name="clipboard-watch", daemon=True)
+            self._thread.start()
+        else:
+            self._after_id = self.root.after(self.poll_interval_ms, self._poll)
+
+    def stop(self) -> None:
+        """Zastaví sledování"""
+        self._running = False
+        if self._thread_id is not None:
+            import ctypes
+            ctypes.windll.user32.PostThreadMessageW(self._thread_id, _WM_QUIT, 0, 0)
+            self._thread_id = None
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except tk.TclError:
+                pass
+            self._after_id = None
+
+    def _on_change(self) -> None:
+        """Schránka se změnila - přečte obsah v hlavním vlákně"""
+        text = self.clipboard.paste()
+        if text and text != self._last_text:
+            self._last_text = text
+            self.on_text(text)
+
+    def _poll(self) -> None:
+        """Fallback bez notifikací - kontrola obsahu v intervalu"""
+        if not self._running:
+            return
+        self._on_change()
+        self._after_id = self.root.after(self.poll_interval_ms, self._poll)
+
+    def _run_windows(self) -> None:
+        """Message-only okno s AddClipboardFormatListener a GetMessage smyčkou"""
+        import ctypes
+        from ctypes import wintypes
+
+        user32 = ctypes.WinDLL("user32", use_last_error=True)
+        kernel32 = ctypes.WinDLL("kernel32")
+
+        LRESULT = ctypes.c_ssize_t
+        WNDPROC = ctypes.WINFUNCTYPE(LRESULT, wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM)
+
+        class WNDCLASSW(ctypes.Structure):
+            _fields_ = [
+                ("style", wintypes.UINT),
+                ("lpfnWndProc", WNDPROC),
+                ("cbClsExtra", ctypes.c_int),
+                ("cbWndExtra", ctypes.c_int),
+                ("hInstance", wintypes.HINSTANCE),
+                ("hIcon", wintypes.HICON),
+                ("hCursor", wintypes.HANDLE),
+                ("hbrBackground", wintypes.HBRUSH),
+                ("lpszMenuName", wintypes.LPCWSTR),
+                ("lpszClassName", wintypes.LPCWSTR),
+            ]
+
+        kernel32.GetModuleHandleW.restype = wintypes.HMODULE
+        user32.DefWindowProcW.argtypes = [wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM]
+        user32.DefWindowProcW.restype = LRESULT
+        user32.CreateWindowExW.argtypes = [
+            wintypes.DWORD, wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.DWORD,
+            ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+            wintypes.HWND, wintypes.HMENU, wintypes.HINSTANCE, wintypes.LPVOID,
+        ]
+        user32.CreateWindowExW.restype = wintypes.HWND
+
+        def window_proc(hwnd, msg, wparam, lparam):
+            if msg == _WM_CLIPBOARDUPDATE:
+                # Obsah se čte až v hlavním vlákně přes Tk
+                self.dispatcher.post_coalesced("clipboard_change", self._on_change)
+                return 0
+            return user32.DefWindowProcW(hwnd, msg, wparam, lparam)
+
+        # Reference musí žít po celou dobu smyčky (jinak GC uvolní callback)
+        self._window_proc = WNDPROC(window_proc)
+
+        window_class = WNDCLASSW()
+        window_class.lpfnWndProc = self._window_proc
+        window_class.hInstance = kernel32.GetModuleHandleW(None)
+        window_class.lpszClassName = "TranskaClipboardWatch"
+        user32.RegisterClassW(ctypes.byref(window_class))
+
+        hwnd = user32.CreateWindowExW(
+            0, window_class.lpszClassName, "", 0, 0, 0, 0, 0,
+            wintypes.HWND(_HWND_MESSAGE), None, window_class.hInstance, None
+        )
+        if not hwnd or not user32.AddClipboardFormatListener(hwnd):
+            logger.error(f"Nelze sledovat schránku (chyba {ctypes.get_last_error()})")
+            return
+
+        self._thread_id = kernel32.GetCurrentThreadId()
+        msg = wintypes.MSG()
+        while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+            user32.TranslateMessage(ctypes.byref(msg))
+            user32.DispatchMessageW(ctypes.byref(msg))
+
+        user32.RemoveClipboardFormatListener(hwnd)
+        user32.DestroyWindow(hwnd)
+
+
+class ClipboardPrefetcher:
+    """
+    Spekulativní překlad zkopírovaného textu na pozadí
+
+    Výsledek skončí v CacheMiddleware, takže následný překlad ve workflow
+    je okamžitý. Útratu omezuje rozpočet třídy PREFETCH - při napjaté
+    předpovědi kvóty se prefetch odkládá jako první.
+    """
+
+    def __init__(
+        self,
+        translator_provider: Callable[[], BaseTranslator],
+        languages_provider: Callable[[], Tuple[str, str]],
+        budget: BudgetScheduler,
+        max_chars: int = 5000
+    ):
+        """
+        Inicializuje ClipboardPrefetcher
+
+        Args:
+            translator_provider: Vrací aktuální překladač (mění se při reloadu)
+            languages_provider: Vrací aktuální (zdrojový, cílový) jazyk
+            budget: Rozpočet znaků (třída PREFETCH)
+            max_chars: Max délka textu pro prefetch
+        """
+        self.translator_provider = translator_provider
+        self.languages_provider = languages_provider
+        self.budget = budget
+        self.max_chars = max_chars
+
+    def on_clipboard_text(self, text: str) -> None:
+        """Zváží prefetch nového textu schránky (volá se z hlavního vlákna)"""
+        text = text.strip()
+        if not text or len(text) > self.max_chars:
+            return
+
+        source_lang, target_lang = self.languages_provider()
+        if not looks_like_language(text, source_lang):
+            logger.debug("Prefetch přeskočen - text neodpovídá zdrojovému jazyku")
+            return
+
+        translator = self.translator_provider()
+        cache = find_layer(translator, CacheMiddleware)
+        if cache is None or not translator.is_configured():
+            logger.debug("Prefetch přeskočen - pipeline neobsahuje cache nebo překladač není nakonfigurován")
+            return
+        if cache_contains(translator, text, source_lang, target_lang):
+            return
+
+        decision = self.budget.reserve(PREFETCH, len(text))
+        if not decision.allowed:
+            logger.info(f"Prefetch přeskočen - {decision.reason}")
+            return
+
+        threading.Thread(
+            target=self._prefetch,
+            args=(translator, text, source_lang, target_lang),
+            name="clipboard-prefetch",
+            daemon=True
+        ).start()
+
+    def _prefetch(self, translator: BaseTranslator, text: str, source_lang: str, target_lang: str) -> None:
+        """Přeloží text na pozadí - výsledek zůstane v cache"""
+        _result, error = translator.translate(text, source_lang, target_lang)
+        self.budget.commit(PREFETCH, len(text), len(text) if not error else 0)
+        if error:
+            logger.debug(f"Prefetch selhal: {error}")
+        else:
+            logger.debug(f"Prefetch hotov ({len(text)} znaků)")
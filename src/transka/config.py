@@ -6,9 +6,15 @@ from __future__ import annotations
 
 import json
 import logging
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Any
-from dotenv import load_dotenv
+from typing import Dict, Any, List, Optional, Iterator, Set, Tuple
+from dotenv import load_dotenv, dotenv_values
+
+from transka.config_watcher import file_digest
 
 # Logging setup
 logger = logging.getLogger(__name__)
@@ -17,33 +23,139 @@ logger = logging.getLogger(__name__)
 load_dotenv()
 
 
+def atomic_write_text(path: Path, text: str) -> None:
+    """
+    Atomicky zapíše text do souboru (temp soubor + rename)
+
+    Při pádu uprostřed zápisu zůstane na disku buď starý, nebo nový obsah,
+    nikdy napůl zapsaný soubor.
+
+    Args:
+        path: Cílový soubor
+        text: Obsah (UTF-8)
+    """
+    path = Path(path)
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=str(path.parent) or ".")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
 class Config:
     """Správa konfigurace aplikace"""
 
     CONFIG_FILE = Path("config.json")
     ENV_FILE = Path(".env")
 
+    # Zpoždění odloženého zápisu - změny v tomto okně se sloučí do jednoho zápisu
+    SAVE_DEBOUNCE = 0.5
+
     DEFAULT_CONFIG = {
         "source_lang": "CS",
         "target_lang": "EN-US",
-        "translator_service": "deepl",  # "deepl" nebo "google"
+        "translator_service": "deepl",  # "deepl", "google", "libretranslate", "auto" (router) nebo plugin (entry point)
         "hotkey_main": "ctrl+alt+t",  # Hlavní zkratka: Ctrl+Alt+T (Translate)
         "hotkey_swap": "ctrl+alt+s",  # Swap jazyků: Ctrl+Alt+S
         "hotkey_clear": "ctrl+alt+c",  # Vymazání input pole: Ctrl+Alt+C
         "window_width": 600,
         "window_height": 400,
-        "usage_warning_threshold": 480000  # Varování při 96% limitu (480k z 500k)
+        "usage_warning_threshold": 480000,  # Varování při 96% limitu (480k z 500k)
+        "metrics_enabled": False,  # Tracing spany + export metrik
+        "metrics_file": "transka_metrics.prom",  # Cílový soubor exportu
+        "metrics_format": "prometheus",  # "prometheus" nebo "jsonl"
+        "metrics_interval": 30,  # Interval exportu v sekundách
+        "translator_pipeline": ["metrics", "preprocess", "cache", "retry"],  # Middleware vrstvy (vnější → vnitřní)
+        "cache_max_entries": 256,  # Velikost LRU cache překladů
+        "retry_attempts": 2,  # Počet opakování při dočasné chybě
+        "retry_backoff": 0.5,  # Základ exponenciálního backoffu (s)
+        "rate_limit_per_second": 5,  # Limit požadavků pro vrstvu rate_limit
+        "config_watch_enabled": True,  # Hot reload při externí změně config.json / .env
+        "config_watch_interval": 2.0,  # Interval mtime pollingu (bez inotify)
+        "hotkey_process": False,  # Keyboard hook v samostatném procesu
+        "hotkey_engine": "engine",  # "engine" (jeden hook, double-press) nebo "keyboard" (add_hotkey)
+        "hotkey_sequence_timeout": 0.5,  # Max prodleva mezi stisky sekvence (s)
+        "clipboard_backend": "tk",  # "tk" (bez subprocesů) nebo "pyperclip"
+        "clipboard_prefetch_enabled": False,  # Spekulativní překlad zkopírovaného textu
+        "clipboard_prefetch_max_chars": 5000,  # Max délka textu pro prefetch
+        "clipboard_watch_interval": 1.0,  # Interval kontroly schránky bez notifikací (s)
+        "text_chunk_size": 16384,  # Znaků vložených do textového pole v jedné dávce
+        "text_preview_limit": 500000,  # Nad tuto délku jen náhled, celý text mimo widget (0 = vypnuto)
+        "ui_watchdog_enabled": False,  # Logovat zaseknutí UI vlákna se stackem
+        "ui_stall_threshold_ms": 200,  # Práh zaseknutí UI vlákna (ms)
+        "history_enabled": True,  # Ukládání překladů do lokální historie
+        "history_file": "transka_history.db",  # SQLite databáze historie
+        "history_max_entries": 100000,  # Max počet záznamů (0 = bez limitu)
+        "history_max_age_days": 365,  # Max stáří záznamů ve dnech (0 = bez limitu)
+        "multi_target_enabled": False,  # Souběžný překlad i do dalších jazyků
+        "multi_targets": ["DE", "PL"],  # Další cílové jazyky (vlastní panel pro každý)
+        "incremental_translation": True,  # Po úpravě vstupu překládat jen změněné odstavce
+        "budget_ledger_file": "transka_budget.json",  # Evidence spotřeby znaků po dnech
+        "budget_limits": {  # Limity znaků podle třídy požadavků (0 = bez limitu)
+            "interactive": {"daily": 0, "monthly": 0},
+            "batch": {"daily": 50000, "monthly": 0},
+            "prefetch": {"daily": 20000, "monthly": 200000}
+        },
+        "budget_reset_day": 1,  # Den v měsíci, kdy se obnovuje kvóta API
+        "offline_queue_enabled": True,  # Fronta pro překlady, které selhaly na dočasné chybě
+        "offline_queue_file": "transka_queue.db",  # SQLite databáze fronty
+        "libretranslate_url": "http://localhost:5000",  # Vlastní LibreTranslate server
+        "libretranslate_api_key": "",  # Klíč serveru (prázdný = bez klíče)
+        "libretranslate_timeout": 10.0,  # Timeout požadavků na server (s)
+        "router_backends": ["deepl", "google"],  # Backendy routeru "auto" (první = primární pro kvótu)
+        "router_size_buckets": {"short": 300, "medium": 3000, "long": 0},  # Max znaků třídy (0 = bez meze)
+        "router_objectives": {"short": "latency", "medium": "latency", "long": "quality"},  # Cíl třídy
+        "router_quality": {"deepl": 1.0, "google": 0.7, "libretranslate": 0.6},  # Skóre kvality backendů
+        "router_latency_budget": 5.0,  # Max očekávaná latence pro cíl "quality" (s)
+        "router_alpha": 0.2,  # Váha nového vzorku v EWMA
+        "router_explore": 0.05,  # Podíl požadavků na náhodný jiný backend
+        "router_stats_file": "transka_router.json",  # Uložené statistiky routeru
+        "profiler_duration": 30.0,  # Délka profilování z tray menu (s, 0 = do zastavení)
+        "profiler_interval_ms": 5.0,  # Interval vzorkování stacků (ms)
+        "profiler_top_n": 25,  # Počet funkcí v souhrnu profilu
+        "profiler_dir": "profiles",  # Adresář výstupů profileru
+        "diagnostics_dir": "diagnostics",  # Adresář zpráv o paměti
+        "diagnostics_top_n": 25,  # Počet řádků v žebříčcích zprávy
+        "diagnostics_trace_on_start": False,  # tracemalloc od startu (úplnější zpráva, vyšší režie)
+        "log_file": "transka.log",  # Hlavní log (prázdný = jen konzole)
+        "log_level": "INFO",  # Úroveň logování (DEBUG, INFO, WARNING, ERROR)
+        "log_max_bytes": 1000000,  # Velikost logu, po které se rotuje
+        "log_backup_count": 3,  # Počet ponechaných starých logů
+        "perf_log_file": "transka_perf.jsonl",  # Výkonnostní log - JSON řádek na překlad (prázdný = vypnuto)
+        "translator_process": False,  # Backend překladače v samostatném worker procesu
+        "translator_process_workers": 4,  # Souběžné požadavky ve worker procesu
+        "translator_process_timeout": 60.0,  # Max čekání na odpověď worker procesu (s)
+        "deepl_server_url": "",  # Jiný server s DeepL API, např. lokální deepl-mock (prázdný = oficiální)
+        "documents_max_concurrent": 3,  # Souběžně překládané dokumenty
+        "documents_timeout": 600.0  # Max doba překladu jednoho dokumentu (s)
     }
 
     def __init__(self):
         self.config: Dict[str, Any] = self.DEFAULT_CONFIG.copy()
         self.api_key: str = ""
+
+        # Stav odloženého ukládání
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._batch_depth = 0
+        self._save_timer: Optional[threading.Timer] = None
+
+        # Hash posledního vlastního zápisu (watcher ho ignoruje)
+        self._written_digests: Dict[Path, str] = {}
+
         self.load()
 
     def load(self) -> None:
         """Načte konfiguraci ze souboru a .env"""
         # API klíč z .env
-        import os
         self.api_key = os.getenv("DEEPL_API_KEY", "")
 
         # Ostatní nastavení z config.json
@@ -57,22 +169,124 @@ class Config:
                 logger.error(f"Chyba při načítání konfigurace: {e}", exc_info=True)
 
     def save(self) -> None:
-        """Uloží konfiguraci do souboru"""
-        try:
+        """Uloží konfiguraci do souboru (synchronně, atomicky)"""
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            self._dirty = False
             config_data = json.dumps(self.config, indent=2, ensure_ascii=False)
-            self.CONFIG_FILE.write_text(config_data, encoding="utf-8")
+
+        try:
+            self._written_digests[self.CONFIG_FILE] = file_digest(config_data.encode("utf-8"))
+            atomic_write_text(self.CONFIG_FILE, config_data)
             logger.debug(f"Konfigurace uložena do {self.CONFIG_FILE}")
         except Exception as e:
             logger.error(f"Chyba při ukládání konfigurace: {e}", exc_info=True)
 
+    def last_written_digest(self, path: Path) -> Optional[str]:
+        """Hash obsahu, který aplikace naposledy sama zapsala do souboru"""
+        return self._written_digests.get(Path(path))
+
+    def read_snapshot(self) -> Tuple[Dict[str, Any], str]:
+        """
+        Načte config.json a .env bez aplikace změn
+
+        Returns:
+            Tuple (kompletní konfigurace včetně výchozích hodnot, API klíč)
+        """
+        new_config = self.DEFAULT_CONFIG.copy()
+        if self.CONFIG_FILE.exists():
+            new_config.update(json.loads(self.CONFIG_FILE.read_text(encoding="utf-8")))
+
+        api_key = self.api_key
+        if self.ENV_FILE.exists():
+            api_key = dotenv_values(self.ENV_FILE).get("DEEPL_API_KEY") or ""
+        return new_config, api_key
+
+    def apply_snapshot(self, new_config: Dict[str, Any], api_key: str) -> Set[str]:
+        """
+        Aplikuje znovu načtenou konfiguraci a vrátí změněné klíče
+
+        Args:
+            new_config: Konfigurace z read_snapshot()
+            api_key: API klíč z read_snapshot()
+
+        Returns:
+            Množina změněných klíčů ("api_key" pro změnu klíče v .env)
+        """
+        with self._lock:
+            changed = {
+                key for key in set(self.config) | set(new_config)
+                if self.config.get(key) != new_config.get(key)
+            }
+            self.config.update(new_config)
+
+            if api_key != self.api_key:
+                self.api_key = api_key
+                os.environ["DEEPL_API_KEY"] = api_key
+                changed.add("api_key")
+
+        if changed:
+            logger.info(f"Konfigurace znovu načtena, změněno: {', '.join(sorted(changed))}")
+        return changed
+
+    def flush(self) -> None:
+        """Okamžitě zapíše čekající změny (např. při ukončení aplikace)"""
+        with self._lock:
+            pending = self._dirty
+        if pending:
+            self.save()
+
     def get(self, key: str, default: Any = None) -> Any:
         """Získá hodnotu z konfigurace"""
         return self.config.get(key, default)
 
     def set(self, key: str, value: Any) -> None:
-        """Nastaví hodnotu v konfiguraci"""
-        self.config[key] = value
-        self.save()
+        """Nastaví hodnotu v konfiguraci (zápis na disk je odložený)"""
+        with self._lock:
+            self.config[key] = value
+            self._mark_dirty()
+
+    def update(self, values: Dict[str, Any]) -> None:
+        """Nastaví více hodnot najednou - jeden odložený zápis"""
+        with self._lock:
+            self.config.update(values)
+            self._mark_dirty()
+
+    @contextmanager
+    def batch(self) -> Iterator["Config"]:
+        """
+        Transakce - změny uvnitř bloku se zapíšou jedním zápisem
+
+        Příklad:
+            with config.batch():
+                config.set("source_lang", "EN")
+                config.set("target_lang", "CS")
+        """
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                if self._batch_depth == 0 and self._dirty:
+                    self._schedule_save()
+
+    def _mark_dirty(self) -> None:
+        """Označí konfiguraci ke zápisu (mimo batch naplánuje odložený zápis)"""
+        self._dirty = True
+        if self._batch_depth == 0:
+            self._schedule_save()
+
+    def _schedule_save(self) -> None:
+        """Naplánuje (debounce) zápis na pozadí - mimo UI vlákno"""
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+        self._save_timer = threading.Timer(self.SAVE_DEBOUNCE, self.save)
+        self._save_timer.daemon = True
+        self._save_timer.start()
 
     def set_api_key(self, api_key: str) -> None:
         """Nastaví API klíč do .env souboru"""
@@ -95,7 +309,9 @@ class Config:
         if not key_found:
             lines.append(f"DEEPL_API_KEY={api_key}\n")
 
-        self.ENV_FILE.write_text("".join(lines), encoding="utf-8")
+        env_data = "".join(lines)
+        self._written_digests[self.ENV_FILE] = file_digest(env_data.encode("utf-8"))
+        atomic_write_text(self.ENV_FILE, env_data)
         logger.info("API klíč aktualizován v .env souboru")
 
     @property
@@ -140,5 +356,302 @@ class Config:
 
     @property
     def translator_service(self) -> str:
-        """Vybraná překladová služba (deepl/google)"""
+        """Vybraná překladová služba (název backendu z registru)"""
         return self.config.get("translator_service", "deepl")  # Fallback pro staré konfigurace
+
+    @property
+    def metrics_enabled(self) -> bool:
+        """Zapnuté měření latence (tracing spany)"""
+        return bool(self.config.get("metrics_enabled", False))
+
+    @property
+    def metrics_file(self) -> Path:
+        """Soubor pro export metrik"""
+        return Path(self.config.get("metrics_file", "transka_metrics.prom"))
+
+    @property
+    def metrics_format(self) -> str:
+        """Formát exportu metrik (prometheus/jsonl)"""
+        return self.config.get("metrics_format", "prometheus")
+
+    @property
+    def metrics_interval(self) -> float:
+        """Interval exportu metrik v sekundách"""
+        return float(self.config.get("metrics_interval", 30))
+
+    @property
+    def translator_pipeline(self) -> List[str]:
+        """Middleware vrstvy překladače (od vnější k vnitřní)"""
+        return list(self.config.get("translator_pipeline", self.DEFAULT_CONFIG["translator_pipeline"]))
+
+    @property
+    def config_watch_enabled(self) -> bool:
+        """Sledování externích změn config.json / .env"""
+        return bool(self.config.get("config_watch_enabled", True))
+
+    @property
+    def config_watch_interval(self) -> float:
+        """Interval mtime pollingu v sekundách"""
+        return float(self.config.get("config_watch_interval", 2.0))
+
+    @property
+    def hotkey_process(self) -> bool:
+        """Globální zkratky v samostatném procesu"""
+        return bool(self.config.get("hotkey_process", False))
+
+    @property
+    def hotkey_engine(self) -> str:
+        """Implementace zkratek (engine/keyboard)"""
+        return self.config.get("hotkey_engine", "engine")
+
+    @property
+    def hotkey_sequence_timeout(self) -> float:
+        """Časové okno pro vícenásobné stisky v sekundách"""
+        return float(self.config.get("hotkey_sequence_timeout", 0.5))
+
+    @property
+    def clipboard_backend(self) -> str:
+        """Backend schránky (tk/pyperclip)"""
+        return self.config.get("clipboard_backend", "tk")
+
+    @property
+    def clipboard_prefetch_enabled(self) -> bool:
+        """Prefetch překladu při změně schránky"""
+        return bool(self.config.get("clipboard_prefetch_enabled", False))
+
+    @property
+    def clipboard_prefetch_max_chars(self) -> int:
+        """Max délka textu pro prefetch"""
+        return int(self.config.get("clipboard_prefetch_max_chars", 5000))
+
+    @property
+    def clipboard_watch_interval(self) -> float:
+        """Interval fallback kontroly schránky v sekundách"""
+        return float(self.config.get("clipboard_watch_interval", 1.0))
+
+    @property
+    def text_chunk_size(self) -> int:
+        """Velikost dávky při vkládání velkých textů"""
+        return int(self.config.get("text_chunk_size", 16384))
+
+    @property
+    def text_preview_limit(self) -> int:
+        """Limit délky textu zobrazeného ve widgetu (0 = bez limitu)"""
+        return int(self.config.get("text_preview_limit", 500000))
+
+    @property
+    def ui_watchdog_enabled(self) -> bool:
+        """Zapnutí hlídání zaseknutí UI vlákna"""
+        return bool(self.config.get("ui_watchdog_enabled", False))
+
+    @property
+    def ui_stall_threshold_ms(self) -> int:
+        """Práh zaseknutí UI vlákna v ms"""
+        return int(self.config.get("ui_stall_threshold_ms", 200))
+
+    @property
+    def history_enabled(self) -> bool:
+        """Ukládání historie překladů"""
+        return bool(self.config.get("history_enabled", True))
+
+    @property
+    def history_file(self) -> Path:
+        """Soubor databáze historie"""
+        return Path(self.config.get("history_file", "transka_history.db"))
+
+    @property
+    def history_max_entries(self) -> int:
+        """Max počet záznamů historie"""
+        return int(self.config.get("history_max_entries", 100000))
+
+    @property
+    def history_max_age_days(self) -> int:
+        """Max stáří záznamů historie ve dnech"""
+        return int(self.config.get("history_max_age_days", 365))
+
+    @property
+    def multi_target_enabled(self) -> bool:
+        """Souběžný překlad do dalších cílových jazyků"""
+        return bool(self.config.get("multi_target_enabled", False))
+
+    @property
+    def multi_targets(self) -> List[str]:
+        """Další cílové jazyky pro multi-target překlad"""
+        return list(self.config.get("multi_targets", ["DE", "PL"]))
+
+    @property
+    def incremental_translation(self) -> bool:
+        """Inkrementální překlad změněných odstavců"""
+        return bool(self.config.get("incremental_translation", True))
+
+    @property
+    def budget_ledger_file(self) -> Path:
+        """Soubor s evidencí spotřeby znaků"""
+        return Path(self.config.get("budget_ledger_file", "transka_budget.json"))
+
+    @property
+    def budget_limits(self) -> Dict[str, Dict[str, int]]:
+        """Limity znaků podle třídy požadavků"""
+        return dict(self.config.get("budget_limits", {}))
+
+    @property
+    def budget_reset_day(self) -> int:
+        """Den obnovení kvóty API"""
+        return int(self.config.get("budget_reset_day", 1))
+
+    @property
+    def offline_queue_enabled(self) -> bool:
+        """Offline fronta pro neúspěšné překlady"""
+        return bool(self.config.get("offline_queue_enabled", True))
+
+    @property
+    def offline_queue_file(self) -> Path:
+        """Soubor databáze offline fronty"""
+        return Path(self.config.get("offline_queue_file", "transka_queue.db"))
+
+    @property
+    def libretranslate_url(self) -> str:
+        """Adresa LibreTranslate serveru"""
+        return self.config.get("libretranslate_url", "http://localhost:5000")
+
+    @property
+    def libretranslate_api_key(self) -> str:
+        """Klíč LibreTranslate serveru (prázdný = bez klíče)"""
+        return self.config.get("libretranslate_api_key", "")
+
+    @property
+    def libretranslate_timeout(self) -> float:
+        """Timeout požadavků na LibreTranslate server (s)"""
+        return float(self.config.get("libretranslate_timeout", 10.0))
+
+    @property
+    def router_backends(self) -> List[str]:
+        """Backendy routeru "auto" (první = primární)"""
+        return list(self.config.get("router_backends", ["deepl", "google"]))
+
+    @property
+    def router_size_buckets(self) -> Dict[str, int]:
+        """Velikostní třídy routeru {název: max znaků}, vzestupně"""
+        return dict(self.config.get("router_size_buckets", {"short": 300, "medium": 3000, "long": 0}))
+
+    @property
+    def router_objectives(self) -> Dict[str, str]:
+        """Cíl routeru pro každou třídu ("latency" / "quality")"""
+        return dict(self.config.get("router_objectives", {"short": "latency", "medium": "latency", "long": "quality"}))
+
+    @property
+    def router_quality(self) -> Dict[str, float]:
+        """Skóre kvality backendů pro cíl "quality" """
+        return dict(self.config.get("router_quality", {"deepl": 1.0, "google": 0.7, "libretranslate": 0.6}))
+
+    @property
+    def router_latency_budget(self) -> float:
+        """Max očekávaná latence pro cíl "quality" (s)"""
+        return float(self.config.get("router_latency_budget", 5.0))
+
+    @property
+    def router_alpha(self) -> float:
+        """Váha nového vzorku v EWMA statistikách routeru"""
+        return float(self.config.get("router_alpha", 0.2))
+
+    @property
+    def router_explore(self) -> float:
+        """Podíl požadavků, které router pošle na náhodný jiný backend"""
+        return float(self.config.get("router_explore", 0.05))
+
+    @property
+    def router_stats_file(self) -> Path:
+        """Soubor se statistikami routeru"""
+        return Path(self.config.get("router_stats_file", "transka_router.json"))
+
+    @property
+    def profiler_duration(self) -> float:
+        """Délka profilování z tray menu (s, 0 = do zastavení)"""
+        return float(self.config.get("profiler_duration", 30.0))
+
+    @property
+    def profiler_interval_ms(self) -> float:
+        """Interval vzorkování profileru (ms)"""
+        return float(self.config.get("profiler_interval_ms", 5.0))
+
+    @property
+    def profiler_top_n(self) -> int:
+        """Počet funkcí v souhrnu profilu"""
+        return int(self.config.get("profiler_top_n", 25))
+
+    @property
+    def profiler_dir(self) -> Path:
+        """Adresář výstupů profileru"""
+        return Path(self.config.get("profiler_dir", "profiles"))
+
+    @property
+    def diagnostics_dir(self) -> Path:
+        """Adresář zpráv o paměti"""
+        return Path(self.config.get("diagnostics_dir", "diagnostics"))
+
+    @property
+    def diagnostics_top_n(self) -> int:
+        """Počet řádků v žebříčcích zprávy o paměti"""
+        return int(self.config.get("diagnostics_top_n", 25))
+
+    @property
+    def diagnostics_trace_on_start(self) -> bool:
+        """Zapnout tracemalloc hned při startu"""
+        return bool(self.config.get("diagnostics_trace_on_start", False))
+
+    @property
+    def log_file(self) -> Optional[Path]:
+        """Hlavní log (None = jen konzole)"""
+        value = self.config.get("log_file", "transka.log")
+        return Path(value) if value else None
+
+    @property
+    def log_level(self) -> str:
+        """Úroveň logování"""
+        return str(self.config.get("log_level", "INFO")).upper()
+
+    @property
+    def log_max_bytes(self) -> int:
+        """Velikost logu, po které se rotuje"""
+        return int(self.config.get("log_max_bytes", 1000000))
+
+    @property
+    def log_backup_count(self) -> int:
+        """Počet ponechaných starých logů"""
+        return int(self.config.get("log_backup_count", 3))
+
+    @property
+    def perf_log_file(self) -> Optional[Path]:
+        """Výkonnostní log (None = vypnuto)"""
+        value = self.config.get("perf_log_file", "transka_perf.jsonl")
+        return Path(value) if value else None
+
+    @property
+    def translator_process(self) -> bool:
+        """Backend překladače v samostatném worker procesu"""
+        return bool(self.config.get("translator_process", False))
+
+    @property
+    def translator_process_workers(self) -> int:
+        """Počet souběžných požadavků ve worker procesu"""
+        return max(1, int(self.config.get("translator_process_workers", 4)))
+
+    @property
+    def translator_process_timeout(self) -> float:
+        """Max doba čekání na odpověď worker procesu (s)"""
+        return float(self.config.get("translator_process_timeout", 60.0))
+
+    @property
+    def deepl_server_url(self) -> Optional[str]:
+        """Jiný server s DeepL API (None = oficiální)"""
+        return self.config.get("deepl_server_url", "") or None
+
+    @property
+    def documents_max_concurrent(self) -> int:
+        """Počet souběžně překládaných dokumentů"""
+        return max(1, int(self.config.get("documents_max_concurrent", 3)))
+
+    @property
+    def documents_timeout(self) -> float:
+        """Max doba překladu jednoho dokumentu (s)"""
+        return float(self.config.get("documents_timeout", 600.0))
@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+"""
+Config Watcher pro aplikaci Transka
+Sleduje změny config.json a .env provedené jinými nástroji (inotify / mtime polling)
+"""
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import hashlib
+import os
+import select
+import struct
+import sys
+import threading
+import logging
+from pathlib import Path
+from typing import Callable, Dict, Optional, Set, Tuple, Any
+
+# Logging setup
+logger = logging.getLogger(__name__)
+
+# inotify konstanty (linux/inotify.h)
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_NONBLOCK = 0x00000800
+_IN_CLOEXEC = 0x00080000
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+def file_digest(data: bytes) -> str:
+    """SHA-1 obsahu souboru (pro detekci skutečné změny obsahu)"""
+    return hashlib.sha1(data).hexdigest()
+
+
+class _InotifyDirectory:
+    """Minimální inotify wrapper přes ctypes (pouze Linux)"""
+
+    def __init__(self, directory: Path):
+        libc_name = ctypes.util.find_library("c") or "libc.so.6"
+        libc = ctypes.CDLL(libc_name, use_errno=True)
+        self.fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 selhal")
+
+        # Sleduje se adresář - atomický zápis (rename) mění inode souboru
+        mask = _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE
+        if libc.inotify_add_watch(self.fd, os.fsencode(str(directory)), mask) < 0:
+            error = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(error, f"inotify_add_watch selhal pro {directory}")
+
+    def read_names(self, timeout: float) -> Set[str]:
+        """Počká na události (max timeout) a vrátí názvy změněných souborů"""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+
+        names = set()
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            _wd, _mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+            if name:
+                names.add(os.fsdecode(name))
+        return names
+
+    def close(self) -> None:
+        """Uzavře inotify deskriptor"""
+        try:
+            os.close(self.fd)
+        except OSError:
+            pass
+
+
+class ConfigWatcher:
+    """
+    Sleduje config.json a .env a hlásí pouze skutečné změny obsahu
+
+    Na Linuxu čeká na inotify události (žádné probouzení bez změny),
+    jinde porovnává mtime/velikost souborů v intervalu. Obsah se čte
+    a parsuje jen tehdy, když se změnil jeho hash, a vlastní zápisy
+    aplikace (Config.save) se ignorují.
+    """
+
+    def __init__(
+        self,
+        config,
+        on_change: Callable[[Dict[str, Any], str], None],
+        poll_interval: float = 2.0
+    ):
+        """
+        Inicializuje ConfigWatcher
+
+        Args:
+            config: Config instance (cesty k souborům, vlastní zápisy)
+            on_change: Callback (nová konfigurace, API klíč) - voláno z watcher vlákna
+            poll_interval: Interval mtime pollingu v sekundách (fallback bez inotify)
+        """
+        self.config = config
+        self.on_change = on_change
+        self.poll_interval = max(0.5, float(poll_interval))
+        self._paths = [Path(config.CONFIG_FILE), Path(config.ENV_FILE)]
+        self._digests: Dict[Path, Optional[str]] = {}
+        self._stats: Dict[Path, Optional[Tuple[int, int]]] = {}
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Spustí sledování v daemon vlákně"""
+        if self._thread is not None:
+            return
+        for path in self._paths:
+            self._stats[path] = self._stat(path)
+            data = self._read(path)
+            self._digests[path] = file_digest(data) if data is not None else None
+
+        self._thread = threading.Thread(target=self._run, name="config-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Zastaví sledování"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+
+    def _run(self) -> None:
+        """Hlavní smyčka - inotify, při nedostupnosti mtime polling"""
+        inotify = None
+        if sys.platform.startswith("linux"):
+            try:
+                directory = self._paths[0].resolve().parent
+                inotify = _InotifyDirectory(directory)
+                logger.debug(f"Config watcher: inotify na {directory}")
+            except Exception as e:
+                logger.debug(f"inotify nedostupné, přepínám na polling: {e}")
+
+        try:
+            if inotify is not None:
+                self._run_inotify(inotify)
+            else:
+                self._run_polling()
+        finally:
+            if inotify is not None:
+                inotify.close()
+
+    def _run_inotify(self, inotify: _InotifyDirectory) -> None:
+        """Čeká na inotify události (timeout jen kvůli kontrole stop eventu)"""
+        watched = {path.name for path in self._paths}
+        while not self._stop_event.is_set():
+            names = inotify.read_names(timeout=1.0)
+            if names & watched:
+                # Krátké okno pro sloučení více událostí jednoho zápisu
+                self._stop_event.wait(0.05)
+                self._check(force=True)
+
+    def _run_polling(self) -> None:
+        """Levný polling - pouze os.stat, obsah se čte jen při změně mtime/velikosti"""
+        while not self._stop_event.wait(self.poll_interval):
+            self._check(force=False)
+
+    def _check(self, force: bool) -> None:
+        """Zjistí, zda se obsah skutečně změnil, a případně zavolá callback"""
+        changed = False
+        for path in self._paths:
+            stat = self._stat(path)
+            if not force and stat == self._stats.get(path):
+                continue
+            self._stats[path] = stat
+
+            data = self._read(path)
+            digest = file_digest(data) if data is not None else None
+            if digest == self._digests.get(path):
+                continue
+            self._digests[path] = digest
+
+            # Vlastní zápis aplikace - konfigurace v paměti je aktuální
+            if digest is not None and digest == self.config.last_written_digest(path):
+                continue
+            changed = True
+
+        if not changed:
+            return
+
+        try:
+            new_config, api_key = self.config.read_snapshot()
+        except Exception as e:
+            logger.error(f"Chyba při čtení změněné konfigurace: {e}", exc_info=True)
+            return
+
+        logger.info("Detekována externí změna konfigurace")
+        try:
+            self.on_change(new_config, api_key)
+        except Exception as e:
+            logger.error(f"Chyba při aplikaci změněné konfigurace: {e}", exc_info=True)
+
+    @staticmethod
+    def _stat(path: Path) -> Optional[Tuple[int, int]]:
+        """(mtime_ns, size) souboru nebo None pokud neexistuje"""
+        try:
+            st = path.stat()
+            return st.st_mtime_ns, st.st_size
+        except OSError:
+            return None
+
+    @staticmethod
+    def _read(path: Path) -> Optional[bytes]:
+        """Obsah souboru nebo None pokud neexistuje"""
+        try:
+            return path.read_bytes()
+        except OSError:
+            return None
@@ -3,34 +3,48 @@
 DeepL API překladač - implementace BaseTranslator
 """
 import deepl
-from typing import Optional, Tuple, List
+import logging
+from typing import Any, BinaryIO, Optional, Tuple, List
 
 from transka.base_translator import BaseTranslator, UsageInfo
 
+# Logging setup
+logger = logging.getLogger(__name__)
+
 
 class DeepLTranslator(BaseTranslator):
     """DeepL API překladač s podporou usage monitoringu"""
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, server_url: Optional[str] = None):
         """
         Inicializace DeepL překladače
 
         Args:
             api_key: DeepL API klíč
+            server_url: Jiný server s DeepL API (např. lokální deepl-mock pro testy), None = oficiální
         """
         self.api_key = api_key
+        self.server_url = server_url
         self.translator: Optional[deepl.Translator] = None
         self._initialize_translator()
 
+    @classmethod
+    def from_config(cls, config) -> "DeepLTranslator":
+        """Vytvoří překladač z konfigurace (API klíč, volitelně deepl_server_url)"""
+        return cls(config.api_key, server_url=config.deepl_server_url)
+
     def _initialize_translator(self) -> None:
         """Inicializace DeepL translatoru"""
         if not self.api_key:
             return
 
         try:
-            self.translator = deepl.Translator(self.api_key)
+            if self.server_url:
+                self.translator = deepl.Translator(self.api_key, server_url=self.server_url)
+            else:
+                self.translator = deepl.Translator(self.api_key)
         except Exception as e:
-            print(f"Chyba při inicializaci DeepL API: {e}")
+            logger.error(f"Chyba při inicializaci DeepL API: {e}")
             self.translator = None
 
     def is_configured(self) -> bool:
@@ -79,6 +93,121 @@ class DeepLTranslator(BaseTranslator):
         except Exception as e:
             return None, f"Neočekávaná chyba: {str(e)}"
 
+    def translate_batch(
+        self,
+        texts: List[str],
+        source_lang: str = "CS",
+        target_lang: str = "EN-US"
+    ) -> Tuple[Optional[List[str]], Optional[str]]:
+        """
+        Přeloží více textů jedním požadavkem na DeepL API
+
+        Args:
+            texts: Texty k překladu
+            source_lang: Zdrojový jazyk
+            target_lang: Cílový jazyk
+
+        Returns:
+            Tuple (přeložené texty, chybová zpráva)
+        """
+        if not self.translator:
+            return None, "DeepL API není nakonfigurováno. Nastavte API klíč."
+
+        if not texts:
+            return [], None
+
+        try:
+            results = self.translator.translate_text(
+                texts,
+                source_lang=source_lang if source_lang != "AUTO" else None,
+                target_lang=target_lang
+            )
+            return [result.text for result in results], None
+
+        except deepl.AuthorizationException:
+            return None, "Neplatný API klíč. Zkontrolujte nastavení."
+        except deepl.QuotaExceededException:
+            return None, "Překročen limit znaků. Navštivte DeepL pro upgrade."
+        except deepl.DeepLException as e:
+            return None, f"DeepL API chyba: {str(e)}"
+        except Exception as e:
+            return None, f"Neočekávaná chyba: {str(e)}"
+
+    def upload_document(
+        self,
+        input_file: BinaryIO,
+        filename: str,
+        source_lang: str = "CS",
+        target_lang: str = "EN-US"
+    ) -> Tuple[Optional[Any], Optional[str]]:
+        """
+        Nahraje dokument k překladu (DeepL document API)
+
+        Args:
+            input_file: Otevřený soubor (binárně)
+            filename: Název souboru - podle přípony DeepL pozná formát
+            source_lang: Zdrojový jazyk
+            target_lang: Cílový jazyk
+
+        Returns:
+            Tuple (DocumentHandle, chybová zpráva)
+        """
+        if not self.translator:
+            return None, "DeepL API není nakonfigurováno. Nastavte API klíč."
+
+        try:
+            handle = self.translator.translate_document_upload(
+                input_file,
+                target_lang=target_lang,
+                source_lang=source_lang if source_lang != "AUTO" else None,
+                filename=filename
+            )
+            return handle, None
+
+        except deepl.AuthorizationException:
+            return None, "Neplatný API klíč. Zkontrolujte nastavení."
+        except deepl.QuotaExceededException:
+            return None, "Překročen limit znaků. Navštivte DeepL pro upgrade."
+        except deepl.DeepLException as e:
+            return None, f"DeepL API chyba: {str(e)}"
+        except Exception as e:
+            return None, f"Neočekávaná chyba: {str(e)}"
+
+    def get_document_status(self, handle: Any) -> Tuple[Optional[Any], Optional[str]]:
+        """
+        Zjistí stav překladu dokumentu
+
+        Returns:
+            Tuple (DocumentStatus - done/ok/seconds_remaining/billed_characters, chybová zpráva)
+        """
+        if not self.translator:
+            return None, "DeepL API není nakonfigurováno"
+
+        try:
+            return self.translator.translate_document_get_status(handle), None
+        except deepl.DeepLException as e:
+            return None, f"DeepL API chyba: {str(e)}"
+        except Exception as e:
+            return None, f"Neočekávaná chyba: {str(e)}"
+
+    def download_document(self, handle: Any, output_file: BinaryIO) -> Optional[str]:
+        """
+        Stáhne přeložený dokument (knihovna zapisuje po blocích přímo do souboru)
+
+        Returns:
+            Chybová zpráva nebo None
+        """
+        if not self.translator:
+            return "DeepL API není nakonfigurováno"
+
+        try:
+            self.translator.translate_document_download(handle, output_file)
+            return None
+        except deepl.DeepLException as e:
+            return f"DeepL API chyba: {str(e)}"
+        except Exception as e:
+            return f"Neočekávaná chyba: {str(e)}"
+
     def get_usage(self) -> Tuple[Optional[UsageInfo], Optional[str]]:
         """
         Získá informace o spotřebě API
@@ -130,7 +259,7 @@ class DeepLTranslator(BaseTranslator):
             return source_list, target_list
 
         except Exception as e:
-            print(f"Chyba při získávání jazyků: {e}")
+            logger.error(f"Chyba při získávání jazyků: {e}")
             return [], []
 
     def update_api_key(self, api_key: str) -> None:
@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+"""
+Diagnostika paměti pro aplikaci Transka
+Snapshoty tracemalloc na vyžádání, diff proti základu, počty vláken
+a objektů podle typu - pro hledání úniků v dlouho běžících instalacích
+"""
+from __future__ import annotations
+
+import gc
+import sys
+import threading
+import time
+import tracemalloc
+import weakref
+import logging
+from collections import Counter
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+# Logging setup
+logger = logging.getLogger(__name__)
+
+# Alokace samotného tracemalloc / importního systému se do zprávy nepočítají
+_IGNORED_TRACES = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+]
+
+
+class MemoryDiagnostics:
+    """
+    Diagnostika paměti s porovnáním proti základu
+
+    set_baseline() zapne tracemalloc (pokud neběží) a uloží snapshot alokací,
+    počty objektů podle typu a seznam vláken. report() vše změří znovu a
+    zapíše do souboru rozdíl - místa s největším nárůstem alokací, typy
+    s nárůstem počtu objektů a vlákna, která od základu přibyla.
+    Měření běží v samostatném vlákně; výsledek předá callback.
+    """
+
+    def __init__(
+        self,
+        output_dir: Path,
+        top_n: int = 25,
+        frames: int = 5,
+        on_report: Optional[Callable[[Optional[Path]], None]] = None
+    ):
+        """
+        Inicializuje MemoryDiagnostics
+
+        Args:
+            output_dir: Adresář pro zprávy
+            top_n: Počet řádků v žebříčcích
+            frames: Hloubka tracebacku ukládaná tracemalloc
+            on_report: Callback po zapsání zprávy (cesta, None = chyba) - volá se z vlákna diagnostiky
+        """
+        self.output_dir = Path(output_dir)
+        self.top_n = top_n
+        self.frames = max(1, frames)
+        self.on_report = on_report
+
+        self._lock = threading.Lock()
+        self._baseline: Optional[tracemalloc.Snapshot] = None
+        self._baseline_types: Counter = Counter()
+        # Identifikátory vláken se recyklují - porovnává se podle objektů
+        self._baseline_threads: "weakref.WeakSet[threading.Thread]" = weakref.WeakSet()
+        self._baseline_at = 0.0
+
+    def start_tracing(self) -> None:
+        """Zapne tracemalloc (alokace před zapnutím nejsou dohledatelné)"""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            logger.info(f"tracemalloc zapnut ({self.frames} rámců)")
+
+    # --- Veřejné API (neblokující) ---
+
+    def set_baseline(self) -> None:
+        """Uloží základ pro porovnání (na pozadí)"""
+        threading.Thread(target=self._set_baseline, name="diagnostics", daemon=True).start()
+
+    def report(self, extra: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Změří stav a zapíše zprávu (na pozadí)
+
+        Args:
+            extra: Údaje sebrané v Tk vlákně (čekající after callbacky, velikost textů ve widgetech...)
+        """
+        threading.Thread(target=self._report, args=(extra or {},), name="diagnostics", daemon=True).start()
+
+    # --- Měření ---
+
+    def _set_baseline(self) -> None:
+        self.start_tracing()
+        snapshot = tracemalloc.take_snapshot().filter_traces(_IGNORED_TRACES)
+        types = self._count_types()
+        with self._lock:
+            self._baseline = snapshot
+            self._baseline_types = types
+            self._baseline_threads = weakref.WeakSet(threading.enumerate())
+            self._baseline_at = time.time()
+        logger.info("Základ diagnostiky paměti uložen")
+
+    def _report(self, extra: Dict[str, Any]) -> None:
+        path = None
+        try:
+            path = self._write_report(extra)
+            logger.info(f"Diagnostika paměti uložena: {path}")
+        except Exception as e:
+            logger.error(f"Chyba diagnostiky paměti: {e}", exc_info=True)
+        if self.on_report is not None:
+            self.on_report(path)
+
+    @staticmethod
+    def _count_types() -> Counter:
+        """Počty živých objektů sledovaných GC podle typu"""
+        gc.collect()
+        return Counter(type(obj).__name__ for obj in gc.get_objects())
+
+    def _write_report(self, extra: Dict[str, Any]) -> Path:
+        """Sestaví a zapíše zprávu, vrátí cestu"""
+        with self._lock:
+            baseline = self._baseline
+            baseline_types = self._baseline_types
+            baseline_threads = set(self._baseline_threads)
+            baseline_at = self._baseline_at
+
+        types = self._count_types()
+        threads = threading.enumerate()
+        now = time.time()
+
+        lines = [
+            f"Diagnostika paměti Transka - {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(now))}",
+            f"Python {sys.version.split()[0]}, GC počty generací {gc.get_count()}, nesebratelné objekty {len(gc.garbage)}",
+        ]
+        rss = _peak_rss_kib()
+        if rss is not None:
+            lines.append(f"Max RSS procesu: {rss / 1024:.1f} MiB")
+        for key, value in extra.items():
+            lines.append(f"{key}: {value}")
+
+        # Alokace (tracemalloc)
+        lines.append("")
+        if not tracemalloc.is_tracing():
+            lines.append("tracemalloc neběží - nejdřív nastavte základ (nebo diagnostics_trace_on_start)")
+        else:
+            current, peak = tracemalloc.get_traced_memory()
+            lines.append(f"tracemalloc: aktuálně {current / 1024:.1f} KiB, špička {peak / 1024:.1f} KiB")
+            snapshot = tracemalloc.take_snapshot().filter_traces(_IGNORED_TRACES)
+            if baseline is not None:
+                age = (now - baseline_at) / 60
+                lines.append(f"Nárůst alokací od základu ({age:.1f} min):")
+                stats = [stat for stat in snapshot.compare_to(baseline, "lineno") if stat.size_diff > 0]
+                for stat in stats[:self.top_n]:
+                    frame = stat.traceback[0]
+                    lines.append(
+                        f"  {stat.size_diff / 1024:+10.1f} KiB  {stat.count_diff:+8d} bloků  "
+                        f"{frame.filename}:{frame.lineno}"
+                    )
+                lines += self._format_tracebacks(snapshot.compare_to(baseline, "traceback"))
+            else:
+                lines.append("Největší alokace (bez základu):")
+                for stat in snapshot.statistics("lineno")[:self.top_n]:
+                    frame = stat.traceback[0]
+                    lines.append(f"  {stat.size / 1024:10.1f} KiB  {stat.count:8d} bloků  {frame.filename}:{frame.lineno}")
+
+        # Objekty podle typu
+        lines.append("")
+        if baseline_types:
+            lines.append("Typy objektů s největším nárůstem počtu:")
+            growth = Counter({name: count - baseline_types.get(name, 0) for name, count in types.items()})
+            for name, diff in growth.most_common(self.top_n):
+                if diff <= 0:
+                    break
+                lines.append(f"  {diff:+10d}  {types[name]:10d}  {name}")
+        else:
+            lines.append("Nejčastější typy objektů:")
+            for name, count in types.most_common(self.top_n):
+                lines.append(f"  {count:10d}  {name}")
+
+        # Vlákna
+        lines.append("")
+        lines.append(f"Vlákna: {len(threads)}")
+        for thread in threads:
+            new = baseline is not None and thread not in baseline_threads
+            flags = ("daemon" if thread.daemon else "") + (", nové od základu" if new else "")
+            lines.append(f"  {thread.name}" + (f" ({flags.strip(', ')})" if flags else ""))
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        path = self.output_dir / f"memory-{time.strftime('%Y%m%d-%H%M%S', time.localtime(now))}.txt"
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        return path
+
+    def _format_tracebacks(self, stats: List[tracemalloc.StatisticDiff], count: int = 3) -> List[str]:
+        """Celé tracebacky největších nárůstů (kdo vytváří closures, timery...)"""
+        lines = []
+        for stat in [stat for stat in stats if stat.size_diff > 0][:count]:
+            lines.append("")
+            lines.append(f"Traceback nárůstu {stat.size_diff / 1024:+.1f} KiB:")
+            lines += [f"  {line}" for line in stat.traceback.format()]
+        return lines
+
+
+def _peak_rss_kib() -> Optional[int]:
+    """Max RSS procesu v KiB (jen Unix, jinak None)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS vrací bajty, Linux KiB
+    return rss // 1024 if sys.platform == "darwin" else rss
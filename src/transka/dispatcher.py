@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+"""
+Main-thread Dispatcher pro aplikaci Transka
+Předává práci z hotkey hook vlákna, tray vlákna a worker vláken do Tk mainloopu
+"""
+from __future__ import annotations
+
+import threading
+import time
+import logging
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Hashable, Optional, Tuple
+
+import tkinter as tk
+
+from transka.metrics import Metrics
+
+# Logging setup
+logger = logging.getLogger(__name__)
+
+# Interval vyprazdňování, když Tcl neumí přijmout volání z jiného vlákna (ms)
+FALLBACK_INTERVAL_MS = 15
+
+
+class MainThreadDispatcher:
+    """
+    Thread-safe fronta volání vykonávaná v Tk hlavním vlákně
+
+    Tkinter není thread-safe - widgety smí používat jen vlákno s mainloopem.
+    Ostatní vlákna pouze vloží volání do fronty (O(1), bez zámku Tk) a
+    mainloop frontu vyprazdňuje po dávkách. Koalescované položky (status,
+    usage label) se slučují - provede se jen poslední.
+
+    Vložení do prázdné fronty probudí mainloop přes budicí vlákno (jeho
+    root.after() Tcl předá do hlavního vlákna, volající vlákno nečeká).
+    Časovač pak slouží jen jako pojistka - skrytá aplikace se neprobouzí
+    desítkykrát za sekundu. Bez vláknové podpory v Tcl se fronta
+    vyprazdňuje po FALLBACK_INTERVAL_MS.
+    """
+
+    def __init__(
+        self,
+        root: tk.Tk,
+        interval_ms: int = 500,
+        batch_size: int = 64,
+        metrics: Optional[Metrics] = None,
+        wake_from_threads: Optional[bool] = None
+    ):
+        """
+        Inicializuje MainThreadDispatcher
+
+        Args:
+            root: Hlavní Tkinter okno
+            interval_ms: Záložní interval kontroly fronty v ms (práce jinak budí mainloop hned)
+            batch_size: Max počet volání zpracovaných v jednom průchodu
+            metrics: Volitelné metriky (doba čekání ve frontě)
+            wake_from_threads: Budit mainloop z jiných vláken (None = podle tcl_platform(threaded))
+        """
+        self.root = root
+        self.batch_size = batch_size
+        self.metrics = metrics or Metrics(enabled=False)
+        if wake_from_threads is None:
+            wake_from_threads = self._tcl_threaded()
+        self.wake_from_threads = wake_from_threads
+        self.interval_ms = interval_ms if wake_from_threads else min(interval_ms, FALLBACK_INTERVAL_MS)
+
+        # deque.append / popleft jsou atomické - hook vlákno nečeká na zámek
+        self._queue: Deque[Tuple[Optional[Hashable], Callable[..., Any], tuple, float]] = deque()
+        self._coalesced: Dict[Hashable, Tuple[Callable[..., Any], tuple, float]] = {}
+        self._coalesce_lock = threading.Lock()
+        self._after_id: Optional[str] = None
+        self._running = False
+        self._wake_pending = False
+        self._wake_event = threading.Event()
+
+    def _tcl_threaded(self) -> bool:
+        """Tcl s podporou vláken - root.after() lze volat z jiného vlákna"""
+        try:
+            return self.root.tk.eval("expr {[info exists tcl_platform(threaded)] && $tcl_platform(threaded)}") == "1"
+        except (AttributeError, tk.TclError):
+            return False
+
+    def start(self) -> None:
+        """Spustí vyprazdňování fronty (volat z hlavního vlákna)"""
+        if self._running:
+            return
+        self._running = True
+        self._after_id = self.root.after(self.interval_ms, self._drain)
+        if self.wake_from_threads:
+            threading.Thread(target=self._wake_loop, name="dispatcher-wake", daemon=True).start()
+
+    def stop(self) -> None:
+        """Zastaví vyprazdňování fronty"""
+        self._running = False
+        self._wake_event.set()
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except tk.TclError:
+                pass
+            self._after_id = None
+
+    def post(self, callback: Callable[..., Any], *args: Any) -> None:
+        """Zařadí volání do fronty (thread-safe, neblokující)"""
+        self._queue.append((None, callback, args, time.perf_counter()))
+        self._wake()
+
+    def post_coalesced(self, key: Hashable, callback: Callable[..., Any], *args: Any) -> None:
+        """
+        Zařadí volání, které nahradí dosud neprovedené volání se stejným klíčem
+
+        Args:
+            key: Klíč pro slučování (např. "status", "usage")
+            callback: Funkce volaná v hlavním vlákně
+        """
+        with self._coalesce_lock:
+            pending = key in self._coalesced
+            self._coalesced[key] = (callback, args, time.perf_counter())
+        if not pending:
+            self._queue.append((key, None, (), 0.0))
+            self._wake()
+
+    def wrap(self, callback: Callable[[], Any], name: str = "") -> Callable[[], None]:
+        """
+        Vrátí funkci, která callback pouze zařadí do fronty
+
+        Použito pro hotkey a tray callbacky - cizí vlákno se vrací okamžitě.
+        """
+        def posted(*_args: Any) -> None:
+            self._queue.append((None, callback, (), time.perf_counter()))
+            self._wake()
+
+        posted.__name__ = name or getattr(callback, "__name__", "posted")
+        return posted
+
+    # --- Buzení mainloopu ---
+
+    def _wake(self) -> None:
+        """Požádá o okamžité vyprázdnění fronty (volá se až po vložení položky)"""
+        if self.wake_from_threads and not self._wake_pending:
+            self._wake_pending = True
+            self._wake_event.set()
+
+    def _wake_loop(self) -> None:
+        """Budicí vlákno - naplánuje vyprázdnění fronty v hlavním vlákně"""
+        while True:
+            self._wake_event.wait()
+            self._wake_event.clear()
+            if not self._running:
+                return
+            try:
+                # Tcl volání předá hlavnímu vláknu a počká na něj - proto zde, ne ve volajícím
+                self.root.after(0, self._on_wake)
+            except (RuntimeError, tk.TclError) as e:
+                # Hlavní vlákno ještě/už neběží v mainloop - frontu vyprázdní záložní časovač
+                logger.debug(f"Dispatcher nemohl probudit mainloop: {e}")
+                self._wake_pending = False
+
+    def _on_wake(self) -> None:
+        """Probuzení v hlavním vlákně - vyprázdní frontu hned, ne až po intervalu"""
+        # Nejdřív zrušit příznak: položka vložená během vyprazdňování vzbudí znovu
+        self._wake_pending = False
+        if not self._running:
+            return
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        self._drain()
+
+    def _drain(self) -> None:
+        """Zpracuje dávku volání z fronty a naplánuje další průchod"""
+        for _ in range(self.batch_size):
+            try:
+                key, callback, args, posted_at = self._queue.popleft()
+            except IndexError:
+                break
+
+            if key is not None:
+                with self._coalesce_lock:
+                    callback, args, posted_at = self._coalesced.pop(key)
+
+            self.metrics.observe("dispatch_wait", time.perf_counter() - posted_at)
+            try:
+                callback(*args)
+            except SystemExit:
+                raise
+            except Exception as e:
+                logger.error(f"Chyba v dispatched callbacku: {e}", exc_info=True)
+
+        if self._running:
+            # Nevyřízená práce se zpracuje hned v dalším idle cyklu
+            delay = 1 if self._queue else self.interval_ms
+            self._after_id = self.root.after(delay, self._drain)
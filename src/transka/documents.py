@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+"""
+Překlad dokumentů přes DeepL document API pro aplikaci Transka
+Nahrání, čekání na dokončení a stažení běží na pozadí, více dokumentů
+souběžně; výsledek se stahuje rovnou do souboru
+"""
+from __future__ import annotations
+
+import itertools
+import os
+import threading
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from transka.budget import BudgetScheduler, BATCH
+
+# Logging setup
+logger = logging.getLogger(__name__)
+
+# Formáty podporované DeepL document API
+DOCUMENT_EXTENSIONS = (".docx", ".pptx", ".xlsx", ".pdf", ".txt", ".html", ".htm", ".xlf", ".xliff", ".srt")
+
+# Meze intervalu dotazů na stav (s)
+MIN_POLL_INTERVAL = 0.5
+MAX_POLL_INTERVAL = 10.0
+
+# Stavy úlohy
+STATUS_UPLOADING = "uploading"
+STATUS_TRANSLATING = "translating"
+STATUS_DOWNLOADING = "downloading"
+STATUS_DONE = "done"
+STATUS_ERROR = "error"
+
+
+@dataclass
+class DocumentJob:
+    """Překlad jednoho dokumentu"""
+    id: int
+    source_path: Path
+    output_path: Path
+    source_lang: str
+    target_lang: str
+    status: str = STATUS_UPLOADING
+    seconds_remaining: Optional[int] = None  # Odhad DeepL (jen během překladu)
+    billed_characters: int = 0
+    error: Optional[str] = None
+    started_at: float = 0.0
+    finished_at: float = 0.0
+
+    @property
+    def finished(self) -> bool:
+        """Úloha skončila (úspěchem nebo chybou)"""
+        return self.status in (STATUS_DONE, STATUS_ERROR)
+
+
+def next_poll_interval(previous: float, seconds_remaining: Optional[int]) -> float:
+    """
+    Interval do dalšího dotazu na stav
+
+    Když DeepL vrátí odhad zbývající doby, čeká se do jeho uplynutí; odhad
+    0 znamená těsně před dokončením (nejkratší interval). Bez odhadu
+    interval roste geometricky - krátké dokumenty se vyzvednou rychle,
+    dlouhé nezahlcují API dotazy.
+
+    Args:
+        previous: Předchozí interval (s)
+        seconds_remaining: Odhad zbývající doby z DocumentStatus (None = neznámý)
+    """
+    if seconds_remaining is not None:
+        interval = float(seconds_remaining)
+    else:
+        interval = previous * 1.5
+    return min(MAX_POLL_INTERVAL, max(MIN_POLL_INTERVAL, interval))
+
+
+def default_output_path(source: Path, target_lang: str) -> Path:
+    """Výstup vedle zdroje: zprava.docx → zprava.EN-US.docx"""
+    return source.with_name(f"{source.stem}.{target_lang}{source.suffix}")
+
+
+class DocumentTranslator:
+    """
+    Správce překladů dokumentů přes DeepL
+
+    Každý dokument je úloha v poolu vláken (max_concurrent souběžně):
+    upload → dotazy na stav s adaptivním intervalem → stažení do dočasného
+    souboru a přejmenování (rozpracovaný výstup nikdy nepřepíše hotový
+    soubor). Fakturované znaky se po dokončení zapíšou do rozpočtu BATCH.
+    Změny stavu úloh hlásí callback on_update (z vlákna úlohy).
+    """
+
+    def __init__(
+        self,
+        client_provider: Callable[[], object],
+        budget: Optional[BudgetScheduler] = None,
+        max_concurrent: int = 3,
+        timeout: float = 600.0,
+        on_update: Optional[Callable[[DocumentJob], None]] = None
+    ):
+        """
+        Inicializuje DocumentTranslator
+
+        Args:
+            client_provider: Vrací DeepLTranslator (upload_document/get_document_status/download_document)
+            budget: Rozpočet znaků (fakturované znaky se evidují jako BATCH)
+            max_concurrent: Max počet souběžně zpracovávaných dokumentů
+            timeout: Max doba překladu jednoho dokumentu (s)
+            on_update: Callback při změně stavu úlohy - volá se z vlákna úlohy
+        """
+        self.client_provider = client_provider
+        self.budget = budget
+        self.timeout = timeout
+        self.on_update = on_update
+
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_concurrent), thread_name_prefix="document")
+        self._stop = threading.Event()
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._jobs: Dict[int, DocumentJob] = {}
+
+    def submit(
+        self,
+        source_path: Path,
+        source_lang: str,
+        target_lang: str,
+        output_path: Optional[Path] = None
+    ) -> DocumentJob:
+        """
+        Zařadí dokument k překladu (neblokuje)
+
+        Args:
+            source_path: Zdrojový dokument
+            source_lang: Zdrojový jazyk ("AUTO" = detekce)
+            target_lang: Cílový jazyk
+            output_path: Cílový soubor (None = vedle zdroje s kódem jazyka v názvu)
+
+        Returns:
+            DocumentJob - průběžně aktualizovaná úloha
+        """
+        source_path = Path(source_path)
+        job = DocumentJob(
+            id=next(self._ids),
+            source_path=source_path,
+            output_path=Path(output_path) if output_path else default_output_path(source_path, target_lang),
+            source_lang=source_lang,
+            target_lang=target_lang,
+            started_at=time.time()
+        )
+        with self._lock:
+            self._jobs[job.id] = job
+        self._executor.submit(self._run, job)
+        return job
+
+    def jobs(self) -> List[DocumentJob]:
+        """Všechny úlohy od startu aplikace (nejnovější první)"""
+        with self._lock:
+            return sorted(self._jobs.values(), key=lambda job: job.id, reverse=True)
+
+    def stop(self) -> None:
+        """Ukončí čekání na rozpracované dokumenty (neblokuje)"""
+        self._stop.set()
+        self._executor.shutdown(wait=False)
+
+    # --- Zpracování úlohy ---
+
+    def _update(self, job: DocumentJob, status: str, error: Optional[str] = None) -> None:
+        """Změní stav úlohy a ohlásí ho"""
+        job.status = status
+        if error is not None:
+            job.error = error
+        if job.finished:
+            job.finished_at = time.time()
+        if self.on_update is not None:
+            try:
+                self.on_update(job)
+            except Exception as e:
+                logger.error(f"Chyba v callbacku překladu dokumentu: {e}", exc_info=True)
+
+    def _run(self, job: DocumentJob) -> None:
+        """Upload → polling → stažení jednoho dokumentu"""
+        try:
+            error = self._translate(job)
+        except Exception as e:
+            logger.error(f"Chyba při překladu dokumentu {job.source_path}: {e}", exc_info=True)
+            error = str(e)
+
+        if error:
+            logger.warning(f"Překlad dokumentu {job.source_path.name} selhal: {error}")
+            self._update(job, STATUS_ERROR, error)
+        else:
+            elapsed = time.time() - job.started_at
+            logger.info(f"Dokument přeložen: {job.output_path} ({job.billed_characters} znaků, {elapsed:.1f} s)")
+            self._update(job, STATUS_DONE)
+
+    def _translate(self, job: DocumentJob) -> Optional[str]:
+        """Provede překlad, vrátí chybovou zprávu nebo None"""
+        if self.budget is None:
+            return self._translate_document(job)
+
+        # Počet znaků dokumentu je známý až po překladu - u textu se odhadne z velikosti
+        estimate = job.source_path.stat().st_size if job.source_path.suffix.lower() == ".txt" else 0
+        decision = self.budget.reserve(BATCH, estimate)
+        if not decision.allowed:
+            return decision.reason
+        try:
+            return self._translate_document(job)
+        finally:
+            # Fakturované znaky jsou známé jen po dokončení překladu (jinak 0)
+            self.budget.commit(BATCH, estimate, job.billed_characters)
+
+    def _translate_document(self, job: DocumentJob) -> Optional[str]:
+        """Upload → polling → stažení, vrátí chybovou zprávu nebo None"""
+        client = self.client_provider()
+        self._update(job, STATUS_UPLOADING)
+        with job.source_path.open("rb") as f:
+            handle, error = client.upload_document(f, job.source_path.name, job.source_lang, job.target_lang)
+        if error:
+            return error
+
+        # Čekání na dokončení - interval podle odhadu DeepL, jinak geometricky rostoucí
+        self._update(job, STATUS_TRANSLATING)
+        deadline = time.monotonic() + self.timeout
+        interval = MIN_POLL_INTERVAL
+        while True:
+            status, error = client.get_document_status(handle)
+            if error:
+                return error
+            if status.done:
+                break
+            if not status.ok:
+                return getattr(status, "error_message", None) or "DeepL dokument nepřeložil"
+
+            job.seconds_remaining = status.seconds_remaining
+            self._update(job, STATUS_TRANSLATING)
+            interval = next_poll_interval(interval, status.seconds_remaining)
+            if time.monotonic() + interval > deadline:
+                return f"Překlad dokumentu trvá déle než {self.timeout:.0f} s"
+            if self._stop.wait(interval):
+                return "Přerušeno ukončením aplikace"
+
+        job.seconds_remaining = None
+        job.billed_characters = status.billed_characters or 0
+
+        # Stažení do dočasného souboru vedle cíle, pak atomické přejmenování
+        self._update(job, STATUS_DOWNLOADING)
+        job.output_path.parent.mkdir(parents=True, exist_ok=True)
+        part_path = job.output_path.with_name(job.output_path.name + ".part")
+        try:
+            with part_path.open("wb") as f:
+                error = client.download_document(handle, f)
+            if error:
+                return error
+            os.replace(part_path, job.output_path)
+        finally:
+            if part_path.exists():
+                part_path.unlink()
+        return None
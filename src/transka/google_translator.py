@@ -28,6 +28,11 @@ class GoogleTranslator(BaseTranslator):
         self._usage_count = 0  # Lokální počítadlo znaků
         self.api_key = api_key  # Uloženo pro kompatibilitu s BaseTranslator
 
+    @classmethod
+    def from_config(cls, config) -> "GoogleTranslator":
+        """Vytvoří překladač z konfigurace (API klíč není potřeba)"""
+        return cls()
+
     def is_configured(self) -> bool:
         """Kontrola, zda je translator nakonfigurován"""
         # Google Translate free API nepotřebuje klíč
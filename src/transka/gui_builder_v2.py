@@ -7,12 +7,17 @@ from __future__ import annotations
 
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
-from typing import Dict, Any, Callable
+import time
+from typing import Dict, Any, Callable, List, Optional, Tuple
 
 from transka.theme import COLORS
 from transka.config import Config
-from transka.deepl_translator import DeepLTranslator
+from transka.backends import available_backends
 from transka.base_translator import BaseTranslator
+from transka.history import TranslationHistory, HistoryEntry
+
+# Velikost stránky výsledků historie (další stránka se načte při scrollu ke konci)
+HISTORY_PAGE_SIZE = 100
 
 
 class GUIBuilderV2:
@@ -27,7 +32,8 @@ class GUIBuilderV2:
         hotkey_main: str,
         config: Config,
         translator: BaseTranslator,
-        parent_app=None
+        parent_app=None,
+        history: Optional[TranslationHistory] = None
     ):
         """
         Inicializuje GUIBuilderV2
@@ -41,6 +47,7 @@ class GUIBuilderV2:
             config: Config instance pro nastavení
             translator: BaseTranslator instance
             parent_app: Reference na TranslatorApp pro live reload
+            history: Historie překladů (None = History tab bez dat)
         """
         self.root = root
         self.fonts = fonts
@@ -50,11 +57,15 @@ class GUIBuilderV2:
         self.config = config
         self.translator = translator
         self.parent_app = parent_app
+        self.history = history
 
         # Tab frames
         self.translation_tab = None
         self.settings_tab = None
+        self.history_tab = None
         self.current_tab = None
+        # Tab buttony podle jména tabu: (Frame, Label)
+        self._tab_buttons: Dict[str, Tuple[tk.Frame, tk.Label]] = {}
 
         # Tab buttons (Frame)
         self.translation_tab_btn = None
@@ -62,6 +73,8 @@ class GUIBuilderV2:
         # Tab labels (Label inside Frame)
         self.translation_tab_label = None
         self.settings_tab_label = None
+        self.history_tab_btn = None
+        self.history_tab_label = None
         self.content_container = None
 
         # Translation widgets
@@ -71,6 +84,9 @@ class GUIBuilderV2:
         self.usage_label = None
         self.translator_label = None
         self.lang_label = None
+        self.translation_frame = None
+        self.extra_outputs_frame = None
+        self.extra_output_texts: Dict[str, scrolledtext.ScrolledText] = {}
 
         # Settings widgets
         self.translator_service_var = None
@@ -85,6 +101,20 @@ class GUIBuilderV2:
         self.hotkey_clear_entry = None
         self.warning_threshold_entry = None
 
+        # History widgets + stav stránkování
+        self.history_search_var = None
+        self.history_search_entry = None
+        self.history_tree = None
+        self.history_count_label = None
+        self._history_query = ""
+        self._history_last_id: Optional[int] = None
+        self._history_exhausted = False
+        self._history_loaded = 0
+        self._history_page_pending = False
+        self._history_search_after: Optional[str] = None
+        self._on_history_copy: Optional[Callable[[str], None]] = None
+        self._on_history_restore: Optional[Callable[[str, str], None]] = None
+
         # Placeholder state
         self.placeholder_active = False
 
@@ -94,7 +124,10 @@ class GUIBuilderV2:
         on_clear: Callable[[], None],
         on_save_settings: Callable[[], None],
         on_test_api: Callable[[], None],
-        on_close: Callable[[], None]
+        on_close: Callable[[], None],
+        on_history_copy: Optional[Callable[[str], None]] = None,
+        on_history_restore: Optional[Callable[[str, str], None]] = None,
+        on_translate_document: Optional[Callable[[], None]] = None
     ) -> Dict[str, Any]:
         """
         Vytvoří všechny GUI komponenty s tabs
@@ -105,6 +138,9 @@ class GUIBuilderV2:
             on_save_settings: Callback pro uložení nastavení
             on_test_api: Callback pro test API
             on_close: Callback pro zavření okna
+            on_history_copy: Callback pro zkopírování překladu z historie (text)
+            on_history_restore: Callback pro otevření záznamu v Překladu (zdroj, překlad)
+            on_translate_document: Callback pro tlačítko Dokument (None = tlačítko se nezobrazí)
 
         Returns:
             Dict s vytvořenými widgety
@@ -137,12 +173,16 @@ class GUIBuilderV2:
         self.content_container.rowconfigure(0, weight=1)
 
         # Create tabs
-        self.translation_tab = self._create_translation_tab(on_translate, on_clear, on_close)
+        self.translation_tab = self._create_translation_tab(on_translate, on_clear, on_close, on_translate_document)
         self.settings_tab = self._create_settings_tab(on_save_settings, on_test_api)
+        self._on_history_copy = on_history_copy
+        self._on_history_restore = on_history_restore
+        self.history_tab = self._create_history_tab()
 
         # Place tabs in container
         self.translation_tab.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         self.settings_tab.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        self.history_tab.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
 
         # Show translation tab by default
         self.current_tab = "translation"
@@ -162,7 +202,7 @@ class GUIBuilderV2:
 
     def _add_placeholder_to_input(self):
         """Přidá placeholder text do input pole"""
-        placeholder_text = "💡 Tip: Vložte nebo napište text, který chcete přeložit...\n\nGlobální zkratky:\n• Ctrl+Alt+T - Workflow překladu (otevře → přeloží → zkopíruje)\n• Ctrl+Alt+S - Prohodit jazyky (CS ↔ EN)\n• Ctrl+Alt+C - Vymazat input pole\n\nV aplikaci:\n• Ctrl+Enter - Přeložit\n• Ctrl+1 / Ctrl+2 - Přepnout tab"
+        placeholder_text = "💡 Tip: Vložte nebo napište text, který chcete přeložit...\n\nGlobální zkratky:\n• Ctrl+Alt+T - Workflow překladu (otevře → přeloží → zkopíruje)\n• Ctrl+Alt+S - Prohodit jazyky (CS ↔ EN)\n• Ctrl+Alt+C - Vymazat input pole\n\nV aplikaci:\n• Ctrl+Enter - Přeložit\n• Ctrl+1 / Ctrl+2 / Ctrl+3 - Přepnout tab (Překlad / Nastavení / Historie)"
 
         # Vložit placeholder
         self.input_text.insert("1.0", placeholder_text)
@@ -185,7 +225,7 @@ class GUIBuilderV2:
     def _on_input_focus_out(self, event):
         """Přidá placeholder zpět pokud je pole prázdné"""
         if not self.input_text.get("1.0", "end-1c").strip():
-            placeholder_text = "💡 Tip: Vložte nebo napište text, který chcete přeložit...\n\nGlobální zkratky:\n• Ctrl+Alt+T - Workflow překladu (otevře → přeloží → zkopíruje)\n• Ctrl+Alt+S - Prohodit jazyky (CS ↔ EN)\n• Ctrl+Alt+C - Vymazat input pole\n\nV aplikaci:\n• Ctrl+Enter - Přeložit\n• Ctrl+1 / Ctrl+2 - Přepnout tab"
+            placeholder_text = "💡 Tip: Vložte nebo napište text, který chcete přeložit...\n\nGlobální zkratky:\n• Ctrl+Alt+T - Workflow překladu (otevře → přeloží → zkopíruje)\n• Ctrl+Alt+S - Prohodit jazyky (CS ↔ EN)\n• Ctrl+Alt+C - Vymazat input pole\n\nV aplikaci:\n• Ctrl+Enter - Přeložit\n• Ctrl+1 / Ctrl+2 / Ctrl+3 - Přepnout tab (Překlad / Nastavení / Historie)"
             self.input_text.insert("1.0", placeholder_text)
             self.input_text.config(fg=COLORS["text_muted"])
             self.placeholder_active = True
@@ -228,61 +268,16 @@ class GUIBuilderV2:
         tab_frame.pack(fill=tk.X, padx=0, pady=0)
         tab_frame.pack_propagate(False)
 
-        # Tab button pro Překlad - SUNKEN (aktivní)
-        self.translation_tab_btn = tk.Frame(
-            tab_frame,
-            relief=tk.SUNKEN,
-            borderwidth=2,
-            bg=COLORS["bg_dark"],
-            cursor="hand2"
-        )
-        self.translation_tab_btn.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=2, pady=2)
-
-        self.translation_tab_label = tk.Label(
-            self.translation_tab_btn,
-            text="📝  Překlad",
-            bg=COLORS["bg_dark"],
-            fg=COLORS["accent_cyan"],
-            font=self.fonts["sans_font_bold"],
-            cursor="hand2"
+        # Tab buttony (Překlad aktivní - SUNKEN, ostatní RAISED)
+        self.translation_tab_btn, self.translation_tab_label = self._create_tab_button(
+            tab_frame, "translation", "📝  Překlad", self.switch_to_translation_tab
         )
-        self.translation_tab_label.pack(fill=tk.BOTH, expand=True, padx=18, pady=10)
-
-        # Bind click a hover events pro translation tab
-        self.translation_tab_btn.bind("<Button-1>", lambda e: self.switch_to_translation_tab())
-        self.translation_tab_label.bind("<Button-1>", lambda e: self.switch_to_translation_tab())
-        self.translation_tab_btn.bind("<Enter>", lambda e: self._on_tab_hover_enter("translation"))
-        self.translation_tab_btn.bind("<Leave>", lambda e: self._on_tab_hover_leave("translation"))
-        self.translation_tab_label.bind("<Enter>", lambda e: self._on_tab_hover_enter("translation"))
-        self.translation_tab_label.bind("<Leave>", lambda e: self._on_tab_hover_leave("translation"))
-
-        # Tab button pro Nastavení - RAISED (neaktivní)
-        self.settings_tab_btn = tk.Frame(
-            tab_frame,
-            relief=tk.RAISED,
-            borderwidth=2,
-            bg=COLORS["bg_darker"],
-            cursor="hand2"
+        self.settings_tab_btn, self.settings_tab_label = self._create_tab_button(
+            tab_frame, "settings", "⚙️  Nastavení", self.switch_to_settings_tab
         )
-        self.settings_tab_btn.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=2, pady=2)
-
-        self.settings_tab_label = tk.Label(
-            self.settings_tab_btn,
-            text="⚙️  Nastavení",
-            bg=COLORS["bg_darker"],
-            fg=COLORS["text_secondary"],
-            font=self.fonts["sans_font"],
-            cursor="hand2"
+        self.history_tab_btn, self.history_tab_label = self._create_tab_button(
+            tab_frame, "history", "🕘  Historie", self.switch_to_history_tab
         )
-        self.settings_tab_label.pack(fill=tk.BOTH, expand=True, padx=18, pady=10)
-
-        # Bind click a hover events pro settings tab
-        self.settings_tab_btn.bind("<Button-1>", lambda e: self.switch_to_settings_tab())
-        self.settings_tab_label.bind("<Button-1>", lambda e: self.switch_to_settings_tab())
-        self.settings_tab_btn.bind("<Enter>", lambda e: self._on_tab_hover_enter("settings"))
-        self.settings_tab_btn.bind("<Leave>", lambda e: self._on_tab_hover_leave("settings"))
-        self.settings_tab_label.bind("<Enter>", lambda e: self._on_tab_hover_enter("settings"))
-        self.settings_tab_label.bind("<Leave>", lambda e: self._on_tab_hover_leave("settings"))
 
         # Separator line - neon cyan accent
         separator = tk.Frame(
@@ -292,11 +287,50 @@ class GUIBuilderV2:
         )
         separator.pack(fill=tk.X, padx=0, pady=0)
 
+    def _create_tab_button(
+        self,
+        tab_frame: tk.Frame,
+        tab_name: str,
+        text: str,
+        on_click: Callable[[], None]
+    ) -> Tuple[tk.Frame, tk.Label]:
+        """Vytvoří jeden tab button (Frame + Label) s click a hover events"""
+        active = tab_name == "translation"
+        bg = COLORS["bg_dark"] if active else COLORS["bg_darker"]
+
+        button = tk.Frame(
+            tab_frame,
+            relief=tk.SUNKEN if active else tk.RAISED,
+            borderwidth=2,
+            bg=bg,
+            cursor="hand2"
+        )
+        button.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=2, pady=2)
+
+        label = tk.Label(
+            button,
+            text=text,
+            bg=bg,
+            fg=COLORS["accent_cyan"] if active else COLORS["text_secondary"],
+            font=self.fonts["sans_font_bold"] if active else self.fonts["sans_font"],
+            cursor="hand2"
+        )
+        label.pack(fill=tk.BOTH, expand=True, padx=18, pady=10)
+
+        for widget in (button, label):
+            widget.bind("<Button-1>", lambda e: on_click())
+            widget.bind("<Enter>", lambda e: self._on_tab_hover_enter(tab_name))
+            widget.bind("<Leave>", lambda e: self._on_tab_hover_leave(tab_name))
+
+        self._tab_buttons[tab_name] = (button, label)
+        return button, label
+
     def _create_translation_tab(
         self,
         on_translate: Callable[[], None],
         on_clear: Callable[[], None],
-        on_close: Callable[[], None]
+        on_close: Callable[[], None],
+        on_translate_document: Optional[Callable[[], None]] = None
     ) -> ttk.Frame:
         """Vytvoří tab pro překlad"""
         frame = ttk.Frame(self.content_container)
@@ -376,9 +410,14 @@ class GUIBuilderV2:
             width=12
         )
 
+        # Panely dalších cílových jazyků (multi-target, plní set_extra_output_panes)
+        self.translation_frame = frame
+        self.extra_outputs_frame = ttk.Frame(frame)
+        self.extra_outputs_frame.grid(row=4, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+
         # Status bar s lepším stylingem
         status_frame = ttk.Frame(frame)
-        status_frame.grid(row=4, column=0, sticky=(tk.W, tk.E), pady=(8, 5))
+        status_frame.grid(row=5, column=0, sticky=(tk.W, tk.E), pady=(8, 5))
 
         self.status_label = ttk.Label(
             status_frame,
@@ -398,7 +437,7 @@ class GUIBuilderV2:
 
         # Tlačítka s ikonami a lepším stylingem
         button_frame = ttk.Frame(frame)
-        button_frame.grid(row=5, column=0, pady=(15, 10))
+        button_frame.grid(row=6, column=0, pady=(15, 10))
 
         # Primární tlačítko - Přeložit
         translate_btn = ttk.Button(
@@ -416,6 +455,15 @@ class GUIBuilderV2:
         )
         clear_btn.pack(side=tk.LEFT, padx=6, ipady=4)
 
+        # Sekundární tlačítko - Překlad dokumentů (DeepL)
+        if on_translate_document is not None:
+            document_btn = ttk.Button(
+                button_frame,
+                text="📄 Dokument...",
+                command=on_translate_document
+            )
+            document_btn.pack(side=tk.LEFT, padx=6, ipady=4)
+
         # Sekundární tlačítko - Zavřít
         close_btn = ttk.Button(
             button_frame,
@@ -426,6 +474,70 @@ class GUIBuilderV2:
 
         return frame
 
+    def set_extra_output_panes(self, languages: List[str]) -> Dict[str, scrolledtext.ScrolledText]:
+        """
+        Vytvoří output panely pro další cílové jazyky (multi-target)
+
+        Args:
+            languages: Kódy jazyků (prázdný list = panely odstraní)
+
+        Returns:
+            Dict jazyk → ScrolledText widget
+        """
+        for child in self.extra_outputs_frame.winfo_children():
+            child.destroy()
+        # Sloupce odebraných panelů by si jinak dál držely podíl šířky
+        for column in range(len(self.extra_output_texts)):
+            self.extra_outputs_frame.columnconfigure(column, weight=0, uniform="")
+        self.extra_output_texts = {}
+
+        for column, lang in enumerate(languages):
+            self.extra_outputs_frame.columnconfigure(column, weight=1, uniform="extra")
+
+            label = ttk.Label(
+                self.extra_outputs_frame,
+                text=f"✨ {lang}:",
+                font=self.fonts["sans_font_bold"]
+            )
+            label.grid(row=0, column=column, sticky=tk.W, pady=(0, 6), padx=(0 if column == 0 else 6, 0))
+
+            text = scrolledtext.ScrolledText(
+                self.extra_outputs_frame,
+                height=5,
+                wrap=tk.WORD,
+                state=tk.DISABLED,
+                font=self.fonts["mono_font"],
+                bg=COLORS["bg_darker"],
+                fg=COLORS["text_primary"],
+                selectbackground=COLORS["accent_purple"],
+                selectforeground=COLORS["bg_dark"],
+                relief=tk.FLAT,
+                borderwidth=2,
+                highlightthickness=2,
+                highlightcolor=COLORS["accent_purple"],
+                highlightbackground=COLORS["border"]
+            )
+            text.grid(
+                row=1,
+                column=column,
+                sticky=(tk.W, tk.E, tk.N, tk.S),
+                pady=(0, 12),
+                padx=(0 if column == 0 else 6, 0)
+            )
+            text.vbar.config(
+                bg=COLORS["bg_darker"],
+                troughcolor=COLORS["bg_dark"],
+                activebackground=COLORS["accent_purple"],
+                relief=tk.FLAT,
+                width=12
+            )
+            self.extra_output_texts[lang] = text
+
+        # Panely dostanou místo jen pokud existují
+        self.extra_outputs_frame.rowconfigure(1, weight=1 if languages else 0)
+        self.translation_frame.rowconfigure(4, weight=1 if languages else 0)
+        return self.extra_output_texts
+
     def _create_settings_tab(
         self,
         on_save: Callable[[], None],
@@ -463,7 +575,7 @@ class GUIBuilderV2:
         self.translator_service_combo = ttk.Combobox(
             scrollable_frame,
             textvariable=self.translator_service_var,
-            values=["deepl", "google"],
+            values=available_backends(),
             state="readonly",
             width=47
         )
@@ -580,12 +692,161 @@ class GUIBuilderV2:
             command=on_test_api
         )
         test_btn.pack(side=tk.LEFT, padx=6, ipady=4)
+        self.test_api_button = test_btn
 
         # Načíst aktuální hodnoty
         self._load_settings_values()
 
         return main_settings_frame
 
+    def _create_history_tab(self) -> ttk.Frame:
+        """Vytvoří tab s historií překladů (hledání + stránkovaný seznam)"""
+        frame = ttk.Frame(self.content_container, padding="10")
+        frame.columnconfigure(0, weight=1)
+        frame.rowconfigure(1, weight=1)
+
+        # Vyhledávání
+        search_frame = ttk.Frame(frame)
+        search_frame.grid(row=0, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 8))
+        search_frame.columnconfigure(1, weight=1)
+
+        ttk.Label(search_frame, text="🔍 Hledat:").grid(row=0, column=0, sticky=tk.W, padx=(0, 6))
+        self.history_search_var = tk.StringVar()
+        self.history_search_entry = ttk.Entry(search_frame, textvariable=self.history_search_var)
+        self.history_search_entry.grid(row=0, column=1, sticky=(tk.W, tk.E))
+        self.history_search_var.trace_add("write", lambda *args: self._schedule_history_search())
+
+        self.history_count_label = ttk.Label(
+            search_frame,
+            text="",
+            foreground=COLORS["text_secondary"]
+        )
+        self.history_count_label.grid(row=0, column=2, sticky=tk.E, padx=(10, 0))
+
+        # Seznam záznamů - načítá se po stránkách při scrollu
+        columns = ("time", "langs", "source", "target")
+        self.history_tree = ttk.Treeview(frame, columns=columns, show="headings", selectmode="browse")
+        self.history_tree.heading("time", text="Čas")
+        self.history_tree.heading("langs", text="Jazyky")
+        self.history_tree.heading("source", text="Text")
+        self.history_tree.heading("target", text="Překlad")
+        self.history_tree.column("time", width=110, stretch=False)
+        self.history_tree.column("langs", width=90, stretch=False)
+        self.history_tree.column("source", width=260)
+        self.history_tree.column("target", width=260)
+        self.history_tree.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+
+        self.history_scrollbar = ttk.Scrollbar(frame, orient="vertical", command=self.history_tree.yview)
+        self.history_scrollbar.grid(row=1, column=1, sticky=(tk.N, tk.S))
+        self.history_tree.configure(yscrollcommand=self._on_history_scroll)
+
+        self.history_tree.bind("<Double-1>", lambda e: self._history_copy_selected())
+        self.history_tree.bind("<Return>", lambda e: self._history_copy_selected())
+
+        # Tlačítka
+        button_frame = ttk.Frame(frame)
+        button_frame.grid(row=2, column=0, columnspan=2, pady=(12, 0))
+
+        copy_btn = ttk.Button(
+            button_frame,
+            text="📋 Kopírovat překlad",
+            command=self._history_copy_selected
+        )
+        copy_btn.pack(side=tk.LEFT, padx=6, ipady=4)
+
+        restore_btn = ttk.Button(
+            button_frame,
+            text="↩️ Otevřít v Překladu",
+            command=self._history_restore_selected
+        )
+        restore_btn.pack(side=tk.LEFT, padx=6, ipady=4)
+
+        return frame
+
+    def _schedule_history_search(self):
+        """Debounce hledání při psaní (dotaz až po krátké pauze)"""
+        if self._history_search_after is not None:
+            self.root.after_cancel(self._history_search_after)
+        self._history_search_after = self.root.after(200, self._history_search)
+
+    def _history_search(self):
+        """Nové hledání - vymaže seznam a načte první stránku"""
+        self._history_search_after = None
+        self._history_query = self.history_search_var.get().strip()
+        self._history_last_id = None
+        self._history_exhausted = False
+        self._history_loaded = 0
+        self.history_tree.delete(*self.history_tree.get_children())
+
+        if self.history is None:
+            self.history_count_label.config(text="Historie je vypnutá")
+            return
+        self._history_load_page()
+
+    def _history_load_page(self):
+        """Načte další stránku výsledků (keyset podle posledního id)"""
+        self._history_page_pending = False
+        if self.history is None or self._history_exhausted:
+            return
+
+        entries: List[HistoryEntry] = self.history.search(
+            self._history_query,
+            before_id=self._history_last_id,
+            limit=HISTORY_PAGE_SIZE
+        )
+        for entry in entries:
+            self.history_tree.insert(
+                "",
+                tk.END,
+                iid=str(entry.id),
+                values=(
+                    time.strftime("%d.%m. %H:%M", time.localtime(entry.created)),
+                    f"{entry.source_lang} → {entry.target_lang}",
+                    " ".join(entry.source_text.split()),
+                    " ".join(entry.translated_text.split())
+                )
+            )
+
+        self._history_loaded += len(entries)
+        if entries:
+            self._history_last_id = entries[-1].id
+        if len(entries) < HISTORY_PAGE_SIZE:
+            self._history_exhausted = True
+
+        suffix = "" if self._history_exhausted else "+"
+        self.history_count_label.config(text=f"{self._history_loaded}{suffix} záznamů")
+
+    def _on_history_scroll(self, first: str, last: str):
+        """Scrollbar + načtení další stránky při přiblížení ke konci seznamu"""
+        self.history_scrollbar.set(first, last)
+        if (
+            float(last) > 0.9
+            and self._history_loaded
+            and not self._history_exhausted
+            and not self._history_page_pending
+        ):
+            self._history_page_pending = True
+            self.root.after_idle(self._history_load_page)
+
+    def _selected_history_entry(self) -> Optional[HistoryEntry]:
+        """Vrátí kompletní vybraný záznam (plné texty se načtou až teď)"""
+        selection = self.history_tree.selection()
+        if not selection or self.history is None:
+            return None
+        return self.history.get(int(selection[0]))
+
+    def _history_copy_selected(self):
+        """Zkopíruje překlad vybraného záznamu"""
+        entry = self._selected_history_entry()
+        if entry is not None and self._on_history_copy is not None:
+            self._on_history_copy(entry.translated_text)
+
+    def _history_restore_selected(self):
+        """Otevře vybraný záznam v Překladu (bez nového překladu)"""
+        entry = self._selected_history_entry()
+        if entry is not None and self._on_history_restore is not None:
+            self._on_history_restore(entry.source_text, entry.translated_text)
+
     def _load_settings_values(self):
         """Načte aktuální hodnoty do settings formuláře"""
         self.translator_service_var.set(self.config.translator_service)
@@ -597,50 +858,37 @@ class GUIBuilderV2:
         self.hotkey_clear_entry.insert(0, self.config.hotkey_clear)
         self.warning_threshold_entry.insert(0, str(self.config.usage_warning_threshold))
 
+    def reload_settings_values(self):
+        """Znovu načte hodnoty formuláře z configu (po externí změně souborů)"""
+        for entry in (
+            self.api_key_entry,
+            self.hotkey_main_entry,
+            self.hotkey_swap_entry,
+            self.hotkey_clear_entry,
+            self.warning_threshold_entry
+        ):
+            entry.delete(0, tk.END)
+        self._load_settings_values()
+
     def _update_tab_styles(self):
         """Aktualizuje styling tab buttonů podle aktivního tabu"""
-        if self.current_tab == "translation":
-            # Translation tab je aktivní - SUNKEN
-            self.translation_tab_btn.config(
-                relief=tk.SUNKEN,
-                bg=COLORS["bg_dark"]
-            )
-            self.translation_tab_label.config(
-                bg=COLORS["bg_dark"],
-                fg=COLORS["accent_cyan"],
-                font=self.fonts["sans_font_bold"]
-            )
-            # Settings tab je neaktivní - RAISED
-            self.settings_tab_btn.config(
-                relief=tk.RAISED,
-                bg=COLORS["bg_darker"]
-            )
-            self.settings_tab_label.config(
-                bg=COLORS["bg_darker"],
-                fg=COLORS["text_secondary"],
-                font=self.fonts["sans_font"]
-            )
-        else:
-            # Settings tab je aktivní - SUNKEN
-            self.settings_tab_btn.config(
-                relief=tk.SUNKEN,
-                bg=COLORS["bg_dark"]
-            )
-            self.settings_tab_label.config(
-                bg=COLORS["bg_dark"],
-                fg=COLORS["accent_cyan"],
-                font=self.fonts["sans_font_bold"]
-            )
-            # Translation tab je neaktivní - RAISED
-            self.translation_tab_btn.config(
-                relief=tk.RAISED,
-                bg=COLORS["bg_darker"]
-            )
-            self.translation_tab_label.config(
-                bg=COLORS["bg_darker"],
-                fg=COLORS["text_secondary"],
-                font=self.fonts["sans_font"]
-            )
+        for tab_name, (button, label) in self._tab_buttons.items():
+            if tab_name == self.current_tab:
+                # Aktivní tab - SUNKEN
+                button.config(relief=tk.SUNKEN, bg=COLORS["bg_dark"])
+                label.config(
+                    bg=COLORS["bg_dark"],
+                    fg=COLORS["accent_cyan"],
+                    font=self.fonts["sans_font_bold"]
+                )
+            else:
+                # Neaktivní tab - RAISED
+                button.config(relief=tk.RAISED, bg=COLORS["bg_darker"])
+                label.config(
+                    bg=COLORS["bg_darker"],
+                    fg=COLORS["text_secondary"],
+                    font=self.fonts["sans_font"]
+                )
 
     def get_settings_values(self) -> Dict[str, Any]:
         """Vrátí aktuální hodnoty z settings formuláře"""
@@ -658,34 +906,18 @@ class GUIBuilderV2:
     def _on_tab_hover_enter(self, tab_name: str):
         """Hover efekt při najetí myší na tab"""
         # Pokud tab NENÍ aktivní, zobraz hover efekt
-        if tab_name == "translation" and self.current_tab != "translation":
-            self.translation_tab_btn.config(bg=COLORS["bg_input"])
-            self.translation_tab_label.config(
-                bg=COLORS["bg_input"],
-                fg=COLORS["text_primary"]
-            )
-        elif tab_name == "settings" and self.current_tab != "settings":
-            self.settings_tab_btn.config(bg=COLORS["bg_input"])
-            self.settings_tab_label.config(
-                bg=COLORS["bg_input"],
-                fg=COLORS["text_primary"]
-            )
+        if tab_name != self.current_tab:
+            button, label = self._tab_buttons[tab_name]
+            button.config(bg=COLORS["bg_input"])
+            label.config(bg=COLORS["bg_input"], fg=COLORS["text_primary"])
 
     def _on_tab_hover_leave(self, tab_name: str):
         """Hover efekt při opuštění myší z tabu"""
         # Pokud tab NENÍ aktivní, vrať původní styl
-        if tab_name == "translation" and self.current_tab != "translation":
-            self.translation_tab_btn.config(bg=COLORS["bg_darker"])
-            self.translation_tab_label.config(
-                bg=COLORS["bg_darker"],
-                fg=COLORS["text_secondary"]
-            )
-        elif tab_name == "settings" and self.current_tab != "settings":
-            self.settings_tab_btn.config(bg=COLORS["bg_darker"])
-            self.settings_tab_label.config(
-                bg=COLORS["bg_darker"],
-                fg=COLORS["text_secondary"]
-            )
+        if tab_name != self.current_tab:
+            button, label = self._tab_buttons[tab_name]
+            button.config(bg=COLORS["bg_darker"])
+            label.config(bg=COLORS["bg_darker"], fg=COLORS["text_secondary"])
 
     def switch_to_translation_tab(self):
         """Přepne na Translation tab (Ctrl+1)"""
@@ -700,6 +932,14 @@ class GUIBuilderV2:
         self.settings_tab.tkraise()
         self._update_tab_styles()
 
+    def switch_to_history_tab(self):
+        """Přepne na History tab (Ctrl+3) a načte nejnovější záznamy"""
+        self.current_tab = "history"
+        self.history_tab.tkraise()
+        self._update_tab_styles()
+        self._history_search()
+        self.history_search_entry.focus()
+
     def get_input_text(self) -> str:
         """
         Vrátí text z input pole (ignoruje placeholder)
@@ -0,0 +1,288 @@
+# -*- coding: utf-8 -*-
+"""
+Historie překladů pro aplikaci Transka
+Lokální SQLite úložiště s FTS5 indexem, asynchronním zápisem a stránkováním
+"""
+from __future__ import annotations
+
+import queue
+import sqlite3
+import threading
+import time
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+# Logging setup
+logger = logging.getLogger(__name__)
+
+# Kolik zápisů proběhne mezi kontrolami retence
+RETENTION_CHECK_EVERY = 200
+
+# Délka náhledu textů ve výsledcích vyhledávání (plný text přes get())
+PREVIEW_CHARS = 200
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS history (
+    id INTEGER PRIMARY KEY,
+    created REAL NOT NULL,
+    source_lang TEXT NOT NULL,
+    target_lang TEXT NOT NULL,
+    service TEXT NOT NULL,
+    source_text TEXT NOT NULL,
+    translated_text TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS history_created ON history(created);
+"""
+
+# External-content FTS5 index - texty nejsou uložené dvakrát, synchronizace triggery
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS history_fts USING fts5(
+    source_text, translated_text, content='history', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS history_ai AFTER INSERT ON history BEGIN
+    INSERT INTO history_fts(rowid, source_text, translated_text)
+    VALUES (new.id, new.source_text, new.translated_text);
+END;
+CREATE TRIGGER IF NOT EXISTS history_ad AFTER DELETE ON history BEGIN
+    INSERT INTO history_fts(history_fts, rowid, source_text, translated_text)
+    VALUES ('delete', old.id, old.source_text, old.translated_text);
+END;
+"""
+
+
+@dataclass
+class HistoryEntry:
+    """Záznam historie (ve výsledcích hledání jen náhled textů)"""
+    id: int
+    created: float
+    source_lang: str
+    target_lang: str
+    service: str
+    source_text: str
+    translated_text: str
+
+
+class TranslationHistory:
+    """
+    Historie překladů v SQLite
+
+    Zápis: record() jen vloží záznam do fronty (O(1), neblokuje hotkey cestu),
+    samostatné vlákno zapisuje po dávkách v jedné transakci. WAL režim
+    umožňuje čtení z UI vlákna souběžně se zápisem.
+
+    Čtení: search() stránkuje přes keyset (id < poslední_id ORDER BY id DESC),
+    takže každá stránka stojí stejně bez ohledu na velikost historie.
+    """
+
+    def __init__(self, path: Path, max_entries: int = 100000, max_age_days: int = 365):
+        """
+        Inicializuje TranslationHistory
+
+        Args:
+            path: Soubor databáze
+            max_entries: Max počet záznamů (0 = bez limitu)
+            max_age_days: Max stáří záznamů ve dnech (0 = bez limitu)
+        """
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.max_age_days = max_age_days
+        self.fts_enabled = True
+
+        self._queue: "queue.Queue[Optional[tuple]]" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        self._local = threading.local()
+        self._ready = threading.Event()
+
+    # --- Životní cyklus ---
+
+    def start(self) -> None:
+        """Vytvoří schéma a spustí zapisovací vlákno"""
+        if self._writer is not None:
+            return
+        self._writer = threading.Thread(target=self._write_loop, name="history-writer", daemon=True)
+        self._writer.start()
+        # Schéma vytváří writer - čtení čeká, než existuje
+        self._ready.wait(timeout=5.0)
+
+    def close(self) -> None:
+        """Dopíše frontu a ukončí zapisovací vlákno"""
+        if self._writer is None:
+            return
+        self._queue.put(None)
+        self._writer.join(timeout=5.0)
+        self._writer = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Otevře spojení s WAL režimem"""
+        conn = sqlite3.connect(str(self.path), timeout=5.0)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _reader(self) -> sqlite3.Connection:
+        """Spojení pro čtení - jedno na vlákno"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+        return conn
+
+    # --- Zápis ---
+
+    def record(
+        self,
+        source_text: str,
+        translated_text: str,
+        source_lang: str,
+        target_lang: str,
+        service: str
+    ) -> None:
+        """Zařadí překlad do fronty pro zápis (volatelné z libovolného vlákna)"""
+        if self._writer is None:
+            return
+        self._queue.put((time.time(), source_lang, target_lang, service, source_text, translated_text))
+
+    def _write_loop(self) -> None:
+        """Zapisovací vlákno - dávkové inserty + průběžná retence"""
+        try:
+            conn = self._connect()
+            conn.executescript(_SCHEMA)
+            try:
+                conn.executescript(_FTS_SCHEMA)
+            except sqlite3.OperationalError as e:
+                # SQLite bez FTS5 - vyhledávání přes LIKE
+                logger.warning(f"FTS5 není dostupné, historie se prohledává pomaleji: {e}")
+                self.fts_enabled = False
+            self._apply_retention(conn)
+        except sqlite3.Error as e:
+            logger.error(f"Nelze otevřít historii {self.path}: {e}")
+            self._writer = None
+            self._ready.set()
+            return
+        finally:
+            self._ready.set()
+
+        since_retention = 0
+        while True:
+            item = self._queue.get()
+            batch = [item]
+            # Vše, co mezitím přibylo, jde do stejné transakce
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            rows = [row for row in batch if row is not None]
+            if rows:
+                try:
+                    with conn:
+                        conn.executemany(
+                            "INSERT INTO history(created, source_lang, target_lang, service, "
+                            "source_text, translated_text) VALUES (?, ?, ?, ?, ?, ?)",
+                            rows
+                        )
+                except sqlite3.Error as e:
+                    logger.error(f"Chyba zápisu historie: {e}")
+
+                since_retention += len(rows)
+                if since_retention >= RETENTION_CHECK_EVERY:
+                    since_retention = 0
+                    self._apply_retention(conn)
+
+            if None in batch:
+                break
+
+        conn.close()
+
+    def _apply_retention(self, conn: sqlite3.Connection) -> None:
+        """Smaže záznamy nad limit počtu nebo stáří"""
+        try:
+            with conn:
+                if self.max_age_days:
+                    cutoff = time.time() - self.max_age_days * 86400
+                    conn.execute("DELETE FROM history WHERE created < ?", (cutoff,))
+                if self.max_entries:
+                    conn.execute(
+                        "DELETE FROM history WHERE id <= "
+                        "(SELECT id FROM history ORDER BY id DESC LIMIT 1 OFFSET ?)",
+                        (self.max_entries,)
+                    )
+        except sqlite3.Error as e:
+            logger.error(f"Chyba retence historie: {e}")
+
+    # --- Čtení ---
+
+    def search(self, query: str = "", before_id: Optional[int] = None, limit: int = 100) -> List[HistoryEntry]:
+        """
+        Vyhledá záznamy (nejnovější první) - jedna stránka
+
+        Args:
+            query: Hledaný text (slova jako prefixy, prázdný = vše)
+            before_id: Keyset - vrátí jen záznamy starší než toto id (další stránka)
+            limit: Velikost stránky
+
+        Returns:
+            List záznamů s náhledem textů (max PREVIEW_CHARS znaků)
+        """
+        columns = (
+            f"h.id, h.created, h.source_lang, h.target_lang, h.service, "
+            f"substr(h.source_text, 1, {PREVIEW_CHARS}), substr(h.translated_text, 1, {PREVIEW_CHARS})"
+        )
+        terms = query.split()
+
+        # První stránka bez podmínky na id, další s prostým "id < ?" - kombinovaná
+        # podmínka (? < 0 OR id < ?) by SQLite donutila k průchodu celou tabulkou
+        # místo skoku do rozsahu rowid
+        paged = before_id is not None
+        cursor_params: tuple = (before_id,) if paged else ()
+
+        if not terms:
+            where = "WHERE h.id < ? " if paged else ""
+            sql = f"SELECT {columns} FROM history h {where}ORDER BY h.id DESC LIMIT ?"
+            params: tuple = cursor_params + (limit,)
+        elif self.fts_enabled:
+            cursor = "AND rowid < ? " if paged else ""
+            sql = (
+                f"SELECT {columns} FROM history h JOIN ("
+                f"SELECT rowid FROM history_fts WHERE history_fts MATCH ? "
+                f"{cursor}ORDER BY rowid DESC LIMIT ?"
+                f") m ON h.id = m.rowid ORDER BY h.id DESC"
+            )
+            params = (self._fts_query(terms),) + cursor_params + (limit,)
+        else:
+            like = f"%{query.strip()}%"
+            cursor = "AND h.id < ? " if paged else ""
+            sql = (
+                f"SELECT {columns} FROM history h "
+                f"WHERE (h.source_text LIKE ? OR h.translated_text LIKE ?) "
+                f"{cursor}ORDER BY h.id DESC LIMIT ?"
+            )
+            params = (like, like) + cursor_params + (limit,)
+
+        try:
+            rows = self._reader().execute(sql, params).fetchall()
+        except sqlite3.Error as e:
+            logger.error(f"Chyba vyhledávání v historii: {e}")
+            return []
+        return [HistoryEntry(*row) for row in rows]
+
+    def get(self, entry_id: int) -> Optional[HistoryEntry]:
+        """Vrátí kompletní záznam podle id"""
+        try:
+            row = self._reader().execute(
+                "SELECT id, created, source_lang, target_lang, service, source_text, translated_text "
+                "FROM history WHERE id = ?",
+                (entry_id,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.error(f"Chyba čtení historie: {e}")
+            return None
+        return HistoryEntry(*row) if row else None
+
+    @staticmethod
+    def _fts_query(terms: List[str]) -> str:
+        """Převede slova na bezpečný FTS5 dotaz (každé slovo jako prefix)"""
+        return " ".join('"' + term.replace('"', '""') + '"*' for term in terms)
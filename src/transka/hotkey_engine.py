@@ -0,0 +1,286 @@
+# -*- coding: utf-8 -*-
+"""
+Hotkey Engine pro aplikaci Transka
+Jediný low-level keyboard hook + předkompilovaný stavový automat pro
+kombinace i časované vícenásobné stisky (např. Ctrl+P+P do 0.5s)
+"""
+from __future__ import annotations
+
+import threading
+import time
+import logging
+from typing import Callable, Dict, FrozenSet, List, Optional, Tuple, Union
+
+# Logging setup
+logger = logging.getLogger(__name__)
+
+# Modifikátory jako bitová maska (rychlé porovnání stavu)
+MOD_CTRL = 1
+MOD_SHIFT = 2
+MOD_ALT = 4
+MOD_WINDOWS = 8
+
+MODIFIER_ALIASES: Dict[str, int] = {
+    "ctrl": MOD_CTRL,
+    "control": MOD_CTRL,
+    "left ctrl": MOD_CTRL,
+    "right ctrl": MOD_CTRL,
+    "shift": MOD_SHIFT,
+    "left shift": MOD_SHIFT,
+    "right shift": MOD_SHIFT,
+    "alt": MOD_ALT,
+    "left alt": MOD_ALT,
+    "right alt": MOD_ALT,
+    "alt gr": MOD_ALT,
+    "windows": MOD_WINDOWS,
+    "win": MOD_WINDOWS,
+    "left windows": MOD_WINDOWS,
+    "right windows": MOD_WINDOWS,
+    "cmd": MOD_WINDOWS,
+    "command": MOD_WINDOWS,
+    "super": MOD_WINDOWS,
+}
+
+# Krok sekvence = (maska modifikátorů, název klávesy)
+Step = Tuple[int, str]
+
+# Identifikátory klávesy - scan kódy (int) a název (str) jako záloha
+KeyIds = FrozenSet[Union[int, str]]
+
+# Zkompilovaný krok = (maska modifikátorů, identifikátory klávesy)
+CompiledStep = Tuple[int, KeyIds]
+
+
+def parse_hotkey(spec: str) -> List[Step]:
+    """
+    Zkompiluje zápis zkratky na sekvenci kroků
+
+    Podporované zápisy:
+        "ctrl+alt+t"      - jedna kombinace
+        "ctrl+p+p"        - Ctrl držen, P stisknuto dvakrát (double-press)
+        "ctrl+k, ctrl+c"  - sekvence kombinací oddělená čárkou
+
+    Args:
+        spec: Zápis zkratky
+
+    Returns:
+        List kroků (maska modifikátorů, klávesa)
+
+    Raises:
+        ValueError: Neplatný zápis (chybí ne-modifikační klávesa)
+    """
+    steps: List[Step] = []
+    for group in spec.lower().split(","):
+        parts = [part.strip() for part in group.split("+")]
+        if not group.strip() or any(not part for part in parts):
+            raise ValueError(f"Neplatná zkratka: '{spec}'")
+
+        mask = 0
+        keys = []
+        for part in parts:
+            modifier = MODIFIER_ALIASES.get(part)
+            if modifier is not None:
+                mask |= modifier
+            else:
+                keys.append(part)
+
+        if not keys:
+            raise ValueError(f"Zkratka '{spec}' neobsahuje žádnou klávesu kromě modifikátorů")
+        steps.extend((mask, key) for key in keys)
+    return steps
+
+
+def resolve_key(name: str) -> KeyIds:
+    """
+    Převede název klávesy na identifikátory pro porovnání s událostmi
+
+    keyboard na Windows pojmenuje událost podle stavu Shift/AltGr (Shift+1
+    přijde jako "!", uvolnění po Shiftu jako "1"), scan kód je ale stejný -
+    zkratky se proto párují podle scan kódů jako u keyboard.add_hotkey.
+    Název zůstává pro klávesy, které keyboard převést neumí.
+
+    Args:
+        name: Název klávesy ze zápisu zkratky
+
+    Returns:
+        Množina scan kódů a názvu klávesy
+    """
+    ids = {name}
+    try:
+        import keyboard
+        ids.update(keyboard.key_to_scan_codes(name))
+    except (ImportError, ValueError, OSError) as e:
+        logger.debug(f"Klávesu '{name}' nelze převést na scan kód, páruje se podle názvu: {e}")
+    return frozenset(ids)
+
+
+class _Binding:
+    """Zkompilovaná zkratka + stav průchodu sekvencí"""
+
+    __slots__ = ("name", "spec", "steps", "callback", "progress", "last_time")
+
+    def __init__(self, name: str, spec: str, steps: List[CompiledStep], callback: Callable[[], None]):
+        self.name = name
+        self.spec = spec
+        self.steps = steps
+        self.callback = callback
+        self.progress = 0
+        self.last_time = 0.0
+
+
+class HotkeyEngine:
+    """
+    Sjednocený hotkey engine nad jediným keyboard.hook
+
+    Index (maska, scan kód / klávesa) → zkratky umožňuje zpracovat každý
+    stisk v O(1) bez ohledu na počet registrovaných zkratek. Časová okna sekvencí se
+    kontrolují podle časových značek událostí - žádné polling ani spící vlákno.
+    Rozhraní add/remove/close odpovídá backendům HotkeyManageru.
+    """
+
+    def __init__(self, sequence_timeout: float = 0.5):
+        """
+        Inicializuje HotkeyEngine
+
+        Args:
+            sequence_timeout: Max prodleva mezi kroky sekvence v sekundách
+        """
+        self.sequence_timeout = sequence_timeout
+        self._bindings: Dict[str, _Binding] = {}
+        self._index: Dict[Tuple[int, Union[int, str]], Tuple[_Binding, ...]] = {}
+        self._active: List[_Binding] = []
+        self._modifiers = 0
+        self._pressed: set = set()  # Držené klávesy (scan kód, jinak název) - autorepeat
+        self._lock = threading.Lock()
+        self._hook = None
+
+    # --- Backend rozhraní (HotkeyManager) ---
+
+    def add(self, name: str, combo: str, callback: Callable[[], None]) -> None:
+        """Zaregistruje (nebo nahradí) zkratku a přepočítá index"""
+        steps = [(mask, resolve_key(key)) for mask, key in parse_hotkey(combo)]
+        with self._lock:
+            self._bindings[name] = _Binding(name, combo, steps, callback)
+            self._rebuild_index()
+        self._ensure_hooked()
+
+    def remove(self, name: str) -> None:
+        """Odregistruje zkratku"""
+        with self._lock:
+            if self._bindings.pop(name, None) is not None:
+                self._rebuild_index()
+
+    def close(self) -> None:
+        """Odregistruje vše a odpojí hook"""
+        with self._lock:
+            self._bindings.clear()
+            self._rebuild_index()
+        if self._hook is not None:
+            import keyboard
+            keyboard.unhook(self._hook)
+            self._hook = None
+
+    # --- Kompilace ---
+
+    def _rebuild_index(self) -> None:
+        """Předkompiluje index krok → zkratky (volá se jen při změně registrací)"""
+        index: Dict[Tuple[int, Union[int, str]], List[_Binding]] = {}
+        for binding in self._bindings.values():
+            binding.progress = 0
+            for mask, ids in set(binding.steps):
+                for key_id in ids:
+                    bindings = index.setdefault((mask, key_id), [])
+                    if binding not in bindings:
+                        bindings.append(binding)
+        # Atomická výměna - hook vlákno vždy vidí konzistentní index
+        self._index = {step: tuple(bindings) for step, bindings in index.items()}
+        self._active = []
+
+    def _ensure_hooked(self) -> None:
+        """Nainstaluje jediný low-level hook (lazy při první registraci)"""
+        if self._hook is None:
+            import keyboard
+            self._hook = keyboard.hook(self.process_event)
+
+    # --- Zpracování událostí (hook vlákno) ---
+
+    def process_event(self, event) -> None:
+        """
+        Zpracuje jednu událost klávesnice
+
+        Args:
+            event: Objekt s atributy event_type ("down"/"up"), name, scan_code a time
+        """
+        name = (event.name or "").lower()
+        scan_code = getattr(event, "scan_code", None)
+        modifier = MODIFIER_ALIASES.get(name)
+        # Stisk a uvolnění mohou mít různý název (Shift puštěn dřív: "!" / "1")
+        key = scan_code if scan_code is not None else name
+
+        if event.event_type == "up":
+            if modifier is not None:
+                self._modifiers &= ~modifier
+                if not self._modifiers:
+                    # Ztracené uvolnění (např. během zamčení obrazovky) nesmí blokovat další stisky
+                    self._pressed.clear()
+            else:
+                self._pressed.discard(key)
+            return
+
+        if modifier is not None:
+            self._modifiers |= modifier
+            return
+
+        # Autorepeat při držení klávesy není nový stisk
+        if key in self._pressed:
+            return
+        self._pressed.add(key)
+
+        self._on_key_down(self._modifiers, scan_code, name, event.time or time.time())
+
+    def _on_key_down(self, mask: int, scan_code: Optional[int], name: str, now: float) -> None:
+        """Posune stavové automaty zkratek, které daný stisk obsahují"""
+        candidates = self._index.get((mask, scan_code), ()) if scan_code is not None else ()
+        if not candidates:
+            candidates = self._index.get((mask, name), ())
+
+        def matches(step: CompiledStep) -> bool:
+            return step[0] == mask and (scan_code in step[1] or name in step[1])
+
+        # Rozpracované sekvence, které tento stisk nepokračuje, se resetují
+        if self._active:
+            for binding in self._active:
+                if binding not in candidates:
+                    binding.progress = 0
+            self._active = [b for b in self._active if b.progress]
+
+        for binding in candidates:
+            steps = binding.steps
+            if (
+                binding.progress
+                and matches(steps[binding.progress])
+                and now - binding.last_time <= self.sequence_timeout
+            ):
+                binding.progress += 1
+            elif matches(steps[0]):
+                binding.progress = 1
+            else:
+                binding.progress = 0
+                continue
+
+            binding.last_time = now
+            if binding.progress == len(steps):
+                binding.progress = 0
+                self._fire(binding)
+            elif binding not in self._active:
+                self._active.append(binding)
+
+        if self._active:
+            self._active = [b for b in self._active if b.progress]
+
+    def _fire(self, binding: _Binding) -> None:
+        """Zavolá callback zkratky (callbacky mají být neblokující)"""
+        try:
+            binding.callback()
+        except Exception as e:
+            logger.error(f"Chyba v callbacku zkratky {binding.spec}: {e}", exc_info=True)
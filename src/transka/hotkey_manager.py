@@ -5,14 +5,37 @@ Spravuje globální klávesové zkratky
 """
 from __future__ import annotations
 
-import keyboard
-from typing import Callable
+from typing import Callable, Dict
 import logging
 
 # Logging setup
 logger = logging.getLogger(__name__)
 
 
+class KeyboardHotkeyBackend:
+    """Backend zkratek v procesu aplikace (keyboard.add_hotkey)"""
+
+    def __init__(self):
+        import keyboard
+        self._keyboard = keyboard
+        self._handles: Dict[str, object] = {}
+
+    def add(self, name: str, combo: str, callback: Callable[[], None]) -> None:
+        """Zaregistruje zkratku (při chybě vyhodí výjimku)"""
+        self._handles[name] = self._keyboard.add_hotkey(combo, callback)
+
+    def remove(self, name: str) -> None:
+        """Odregistruje zkratku"""
+        handle = self._handles.pop(name, None)
+        if handle is not None:
+            self._keyboard.remove_hotkey(handle)
+
+    def close(self) -> None:
+        """Odregistruje vše"""
+        self._keyboard.unhook_all()
+        self._handles.clear()
+
+
 class HotkeyManager:
     """Správce globálních klávesových zkratek"""
 
@@ -23,7 +46,8 @@ class HotkeyManager:
         clear_hotkey: str,
         workflow_callback: Callable[[], None],
         swap_callback: Callable[[], None],
-        clear_callback: Callable[[], None]
+        clear_callback: Callable[[], None],
+        backend=None
     ):
         """
         Inicializuje HotkeyManager
@@ -35,6 +59,7 @@ class HotkeyManager:
             workflow_callback: Callback funkce pro zpracování workflow hotkey
             swap_callback: Callback funkce pro swap jazyků
             clear_callback: Callback funkce pro vymazání input pole
+            backend: Backend zkratek (None = keyboard v procesu aplikace)
         """
         self.main_hotkey = main_hotkey
         self.swap_hotkey = swap_hotkey
@@ -42,26 +67,42 @@ class HotkeyManager:
         self.workflow_callback = workflow_callback
         self.swap_callback = swap_callback
         self.clear_callback = clear_callback
+        self.backend = backend or KeyboardHotkeyBackend()
         self._registered_hotkeys = []
 
     def register_hotkeys(self):
         """Zaregistruje všechny globální klávesové zkratky"""
         try:
             # Hlavní zkratka (Ctrl+Alt+T)
-            keyboard.add_hotkey(self.main_hotkey, self.workflow_callback)
+            self.backend.add("main", self.main_hotkey, self.workflow_callback)
             self._registered_hotkeys.append(self.main_hotkey)
 
             # Swap jazyků zkratka (Ctrl+Alt+S)
-            keyboard.add_hotkey(self.swap_hotkey, self.swap_callback)
+            self.backend.add("swap", self.swap_hotkey, self.swap_callback)
             self._registered_hotkeys.append(self.swap_hotkey)
 
             # Clear input pole zkratka (Ctrl+Alt+C)
-            keyboard.add_hotkey(self.clear_hotkey, self.clear_callback)
+            self.backend.add("clear", self.clear_hotkey, self.clear_callback)
             self._registered_hotkeys.append(self.clear_hotkey)
 
         except Exception as e:
             logger.error(f"Chyba při nastavování zkratek: {e}", exc_info=True)
 
+    def _replace_hotkey(
+        self,
+        name: str,
+        old_hotkey: str,
+        new_hotkey: str,
+        callback: Callable[[], None]
+    ) -> None:
+        """Odregistruje starou zkratku a zaregistruje novou pod stejným jménem"""
+        if old_hotkey in self._registered_hotkeys:
+            self.backend.remove(name)
+            self._registered_hotkeys.remove(old_hotkey)
+
+        self.backend.add(name, new_hotkey, callback)
+        self._registered_hotkeys.append(new_hotkey)
+
     def update_main_hotkey(self, new_hotkey: str):
         """
         Aktualizuje hlavní zkratku (pro live reload z Settings)
@@ -73,14 +114,7 @@ class HotkeyManager:
             bool: True pokud úspěšné, False při chybě
         """
         try:
-            # Odstranit starou zkratku
-            if self.main_hotkey in self._registered_hotkeys:
-                keyboard.remove_hotkey(self.main_hotkey)
-                self._registered_hotkeys.remove(self.main_hotkey)
-
-            # Přidat novou zkratku
-            keyboard.add_hotkey(new_hotkey, self.workflow_callback)
-            self._registered_hotkeys.append(new_hotkey)
+            self._replace_hotkey("main", self.main_hotkey, new_hotkey, self.workflow_callback)
             self.main_hotkey = new_hotkey
             logger.info(f"Hlavní zkratka změněna na: {new_hotkey}")
             return True
@@ -99,14 +133,7 @@ class HotkeyManager:
             bool: True pokud úspěšné, False při chybě
         """
         try:
-            # Odstranit starou zkratku
-            if self.swap_hotkey in self._registered_hotkeys:
-                keyboard.remove_hotkey(self.swap_hotkey)
-                self._registered_hotkeys.remove(self.swap_hotkey)
-
-            # Přidat novou zkratku
-            keyboard.add_hotkey(new_hotkey, self.swap_callback)
-            self._registered_hotkeys.append(new_hotkey)
+            self._replace_hotkey("swap", self.swap_hotkey, new_hotkey, self.swap_callback)
             self.swap_hotkey = new_hotkey
             logger.info(f"Swap zkratka změněna na: {new_hotkey}")
             return True
@@ -125,14 +152,7 @@ class HotkeyManager:
             bool: True pokud úspěšné, False při chybě
         """
         try:
-            # Odstranit starou zkratku
-            if self.clear_hotkey in self._registered_hotkeys:
-                keyboard.remove_hotkey(self.clear_hotkey)
-                self._registered_hotkeys.remove(self.clear_hotkey)
-
-            # Přidat novou zkratku
-            keyboard.add_hotkey(new_hotkey, self.clear_callback)
-            self._registered_hotkeys.append(new_hotkey)
+            self._replace_hotkey("clear", self.clear_hotkey, new_hotkey, self.clear_callback)
             self.clear_hotkey = new_hotkey
             logger.info(f"Clear zkratka změněna na: {new_hotkey}")
             return True
@@ -142,5 +162,5 @@ class HotkeyManager:
 
     def unregister_all(self):
         """Odregistruje všechny klávesové zkratky"""
-        keyboard.unhook_all()
+        self.backend.close()
         self._registered_hotkeys.clear()
@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+"""
+Hotkey listener v samostatném procesu
+Keyboard hook běží mimo interpreter s Tk a překlady (žádná GIL kontence),
+do aplikace se přes pipe posílají jen události odpovídajících zkratek
+"""
+from __future__ import annotations
+
+import itertools
+import multiprocessing
+import threading
+import time
+import logging
+from typing import Callable, Dict, Optional, Tuple
+
+from transka.metrics import Metrics
+
+# Logging setup
+logger = logging.getLogger(__name__)
+
+# Timeout pro potvrzení příkazu od child procesu (s)
+ACK_TIMEOUT = 3.0
+
+# Max počet automatických restartů child procesu
+MAX_RESTARTS = 5
+
+
+def _listener_main(conn, sequence_timeout: Optional[float]) -> None:
+    """
+    Vstupní bod child procesu - registruje zkratky a posílá události
+
+    Protokol (tuple přes multiprocessing.Connection):
+        parent → child: ("add", request_id, name, combo) / ("remove", request_id, name) / ("close",)
+        child → parent: ("ack", request_id, error) / ("hotkey", name, time_hook)
+
+    Args:
+        conn: Konec pipe v child procesu
+        sequence_timeout: None = keyboard.add_hotkey, jinak HotkeyEngine s daným oknem
+    """
+    if sequence_timeout is None:
+        from transka.hotkey_manager import KeyboardHotkeyBackend
+        backend = KeyboardHotkeyBackend()
+    else:
+        from transka.hotkey_engine import HotkeyEngine
+        backend = HotkeyEngine(sequence_timeout)
+
+    send_lock = threading.Lock()
+
+    def send(message: tuple) -> None:
+        with send_lock:
+            conn.send(message)
+
+    def make_callback(name: str) -> Callable[[], None]:
+        def on_hotkey() -> None:
+            # time.time() - perf_counter nemá mezi procesy společný počátek
+            send(("hotkey", name, time.time()))
+        return on_hotkey
+
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            break
+
+        command = message[0]
+        if command == "close":
+            break
+
+        request_id = message[1]
+        try:
+            if command == "add":
+                _, _, name, combo = message
+                backend.add(name, combo, make_callback(name))
+            elif command == "remove":
+                backend.remove(message[2])
+            send(("ack", request_id, None))
+        except Exception as e:
+            send(("ack", request_id, str(e)))
+
+    backend.close()
+
+
+class ProcessHotkeyBackend:
+    """
+    Backend zkratek s keyboard hookem v child procesu
+
+    Rozhraní odpovídá KeyboardHotkeyBackend (add/remove/close), takže
+    HotkeyManager včetně live přeregistrace funguje beze změny.
+    Při pádu child procesu se spustí nový a zkratky se znovu zaregistrují.
+    """
+
+    def __init__(self, metrics: Optional[Metrics] = None, sequence_timeout: Optional[float] = None):
+        """
+        Inicializuje ProcessHotkeyBackend
+
+        Args:
+            metrics: Volitelné metriky (latence hook → dispatch)
+            sequence_timeout: None = keyboard.add_hotkey, jinak HotkeyEngine v child procesu
+        """
+        self.metrics = metrics or Metrics(enabled=False)
+        self.sequence_timeout = sequence_timeout
+        self._context = multiprocessing.get_context("spawn")
+        self._bindings: Dict[str, Tuple[str, Callable[[], None]]] = {}
+        self._pending: Dict[int, Tuple[threading.Event, list]] = {}
+        self._request_ids = itertools.count(1)
+        self._send_lock = threading.Lock()
+        self._conn = None
+        self._process = None
+        self._reader: Optional[threading.Thread] = None
+        self._closing = False
+        self._restarts = 0
+
+    def _ensure_started(self) -> None:
+        """Spustí child proces a čtecí vlákno (lazy při první registraci)"""
+        if self._process is not None and self._process.is_alive():
+            return
+
+        parent_conn, child_conn = self._context.Pipe()
+        self._process = self._context.Process(
+            target=_listener_main,
+            args=(child_conn, self.sequence_timeout),
+            name="transka-hotkeys",
+            daemon=True
+        )
+        self._process.start()
+        child_conn.close()
+        self._conn = parent_conn
+
+        self._reader = threading.Thread(
+            target=self._read_loop,
+            args=(parent_conn,),
+            name="hotkey-ipc",
+            daemon=True
+        )
+        self._reader.start()
+        logger.info(f"Hotkey listener spuštěn v procesu PID {self._process.pid}")
+
+    def _request(self, *message) -> None:
+        """Pošle příkaz a počká na potvrzení (chyba → RuntimeError)"""
+        self._ensure_started()
+        request_id = next(self._request_ids)
+        event = threading.Event()
+        result: list = []
+        self._pending[request_id] = (event, result)
+
+        with self._send_lock:
+            self._conn.send((message[0], request_id) + message[1:])
+
+        if not event.wait(ACK_TIMEOUT):
+            self._pending.pop(request_id, None)
+            raise RuntimeError("Hotkey proces neodpověděl")
+        if result and result[0]:
+            raise RuntimeError(result[0])
+
+    def add(self, name: str, combo: str, callback: Callable[[], None]) -> None:
+        """Zaregistruje zkratku v child procesu"""
+        self._request("add", name, combo)
+        self._bindings[name] = (combo, callback)
+
+    def remove(self, name: str) -> None:
+        """Odregistruje zkratku v child procesu"""
+        self._bindings.pop(name, None)
+        self._request("remove", name)
+
+    def close(self) -> None:
+        """Ukončí child proces"""
+        self._closing = True
+        self._bindings.clear()
+        if self._conn is not None:
+            try:
+                with self._send_lock:
+                    self._conn.send(("close",))
+            except (OSError, ValueError):
+                pass
+        if self._process is not None:
+            self._process.join(timeout=1.0)
+            if self._process.is_alive():
+                self._process.terminate()
+            self._process = None
+
+    def _read_loop(self, conn) -> None:
+        """Čte události z child procesu a volá callbacky"""
+        while True:
+            try:
+                message = conn.recv()
+            except (EOFError, OSError):
+                break
+
+            if message[0] == "hotkey":
+                _, name, hooked_at = message
+                binding = self._bindings.get(name)
+                if binding is not None:
+                    self.metrics.observe("hotkey_ipc", max(0.0, time.time() - hooked_at))
+                    binding[1]()
+            elif message[0] == "ack":
+                pending = self._pending.pop(message[1], None)
+                if pending is not None:
+                    pending[1].append(message[2])
+                    pending[0].set()
+
+        if not self._closing:
+            self._restart()
+
+    def _restart(self) -> None:
+        """Obnoví child proces po pádu a znovu zaregistruje zkratky"""
+        for event, result in list(self._pending.values()):
+            result.append("Hotkey proces spadl")
+            event.set()
+        self._pending.clear()
+
+        self._restarts += 1
+        if self._restarts > MAX_RESTARTS:
+            logger.error("Hotkey proces opakovaně padá, globální zkratky jsou vypnuté")
+            self._process = None
+            return
+        logger.warning("Hotkey proces skončil, spouštím znovu")
+
+        bindings = dict(self._bindings)
+        self._process = None
+        threading.Thread(
+            target=self._reregister,
+            args=(bindings,),
+            name="hotkey-restart",
+            daemon=True
+        ).start()
+
+    def _reregister(self, bindings: Dict[str, Tuple[str, Callable[[], None]]]) -> None:
+        """Znovu zaregistruje zkratky v novém procesu"""
+        for name, (combo, callback) in bindings.items():
+            try:
+                self.add(name, combo, callback)
+            except Exception as e:
+                logger.error(f"Nelze obnovit zkratku {name} ({combo}): {e}")
@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+"""
+Inkrementální překlad pro aplikaci Transka
+Po úpravě vstupu se znovu překládají jen změněné odstavce, nezměněné
+odstavce se převezmou z předchozího překladu
+"""
+from __future__ import annotations
+
+import re
+import difflib
+import threading
+import logging
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from transka.base_translator import BaseTranslator
+from transka.middleware import take_cache_outcome
+
+# Logging setup
+logger = logging.getLogger(__name__)
+
+# Odstavce oddělené jedním či více prázdnými řádky (i s mezerami) - oddělovač se zachytí
+_PARAGRAPH_SPLIT = re.compile(r"(\n(?:[ \t]*\n)+)")
+
+
+def split_paragraphs(text: str) -> List[str]:
+    """Rozdělí text na neprázdné odstavce"""
+    return split_layout(text)[0]
+
+
+def split_layout(text: str) -> Tuple[List[str], List[str]]:
+    """
+    Rozdělí text na neprázdné odstavce a původní oddělovače mezi nimi
+
+    Returns:
+        Tuple (odstavce, oddělovače) - oddělovač i stojí mezi odstavci i a i+1
+    """
+    parts = _PARAGRAPH_SPLIT.split(text.strip())
+    paragraphs: List[str] = []
+    separators: List[str] = []
+    # split se zachycující skupinou střídá odstavce (sudé) a oddělovače (liché)
+    for index in range(0, len(parts), 2):
+        paragraph = parts[index].strip("\n")
+        if not paragraph.strip():
+            continue
+        if paragraphs:
+            separators.append(parts[index - 1])
+        paragraphs.append(paragraph)
+    return paragraphs, separators
+
+
+def join_paragraphs(paragraphs: List[str], separators: List[str]) -> str:
+    """Složí odstavce s oddělovači ze split_layout() (inverze pro nezměněný text)"""
+    if not paragraphs:
+        return ""
+    return paragraphs[0] + "".join(
+        separator + paragraph for separator, paragraph in zip(separators, paragraphs[1:])
+    )
+
+
+@dataclass
+class IncrementalResult:
+    """Výsledek inkrementálního překladu"""
+    text: Optional[str]
+    error: Optional[str]
+    sent_chars: int = 0  # Znaky skutečně odeslané na API
+    saved_chars: int = 0  # Znaky převzaté z předchozího překladu
+    reused_paragraphs: int = 0
+    cache_outcome: str = "none"  # Výsledek cache vrstvy (viz take_cache_outcome)
+
+
+class IncrementalTranslator:
+    """
+    Pamatuje si poslední zdroj a překlad po odstavcích
+
+    První překlad jde na API celý (kvůli kontextu). Pokud má výsledek stejný
+    počet odstavců jako zdroj, uloží se jejich párování. Při dalším překladu
+    se nový vstup porovná s předchozím (difflib nad odstavci) a přes
+    translate_batch() se pošlou jen vložené/změněné odstavce.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._languages: Optional[Tuple[str, str]] = None
+        self._source: List[str] = []
+        self._translated: List[str] = []
+
+    def reset(self) -> None:
+        """Zapomene předchozí překlad (např. při změně překladače)"""
+        with self._lock:
+            self._languages = None
+            self._source = []
+            self._translated = []
+
+    def translate(
+        self,
+        translator: BaseTranslator,
+        text: str,
+        source_lang: str,
+        target_lang: str
+    ) -> IncrementalResult:
+        """
+        Přeloží text, pokud možno jen změněné odstavce
+
+        Args:
+            translator: Překladač (pipeline)
+            text: Celý vstupní text
+            source_lang: Zdrojový jazyk
+            target_lang: Cílový jazyk
+
+        Returns:
+            IncrementalResult s textem/chybou a počtem ušetřených znaků
+        """
+        paragraphs, separators = split_layout(text)
+        with self._lock:
+            same_languages = self._languages == (source_lang, target_lang)
+            old_source = list(self._source) if same_languages else []
+            old_translated = list(self._translated) if same_languages else []
+
+        opcodes = []
+        if old_source and paragraphs:
+            matcher = difflib.SequenceMatcher(None, old_source, paragraphs, autojunk=False)
+            opcodes = matcher.get_opcodes()
+
+        if not any(tag == "equal" for tag, *_ in opcodes):
+            return self._translate_full(translator, text, paragraphs, source_lang, target_lang)
+
+        # Odstavce k odeslání (vložené nebo změněné) v pořadí nového textu
+        to_send = [
+            index
+            for tag, _, _, j1, j2 in opcodes
+            if tag in ("replace", "insert")
+            for index in range(j1, j2)
+        ]
+
+        translated_new: List[str] = []
+        cache_outcome = "none"
+        if to_send:
+            translated_new, error = translator.translate_batch(
+                [paragraphs[index] for index in to_send],
+                source_lang,
+                target_lang
+            )
+            cache_outcome = take_cache_outcome(translator)
+            if error or translated_new is None or len(translated_new) != len(to_send):
+                return IncrementalResult(None, error or "Neúplný výsledek dávkového překladu", cache_outcome=cache_outcome)
+
+        # Splice - nezměněné odstavce z minulého překladu, ostatní z dávky
+        result: List[str] = [""] * len(paragraphs)
+        for index, translated in zip(to_send, translated_new):
+            result[index] = translated
+        reused = 0
+        saved_chars = 0
+        for tag, i1, i2, j1, j2 in opcodes:
+            if tag == "equal":
+                for offset in range(i2 - i1):
+                    result[j1 + offset] = old_translated[i1 + offset]
+                    saved_chars += len(paragraphs[j1 + offset])
+                    reused += 1
+
+        self._remember(source_lang, target_lang, paragraphs, result)
+        # Odstavce z cache se na API neposílají (při částečném zásahu horní odhad)
+        sent_chars = 0 if cache_outcome == "hit" else sum(len(paragraphs[index]) for index in to_send)
+        logger.debug(f"Inkrementální překlad: {len(to_send)} odstavců odesláno, {reused} převzato")
+        return IncrementalResult(
+            # Prázdné řádky mezi odstavci podle nového vstupu (jako u překladu celého textu)
+            join_paragraphs(result, separators),
+            None,
+            sent_chars=sent_chars,
+            saved_chars=saved_chars,
+            reused_paragraphs=reused,
+            cache_outcome=cache_outcome
+        )
+
+    def _translate_full(
+        self,
+        translator: BaseTranslator,
+        text: str,
+        paragraphs: List[str],
+        source_lang: str,
+        target_lang: str
+    ) -> IncrementalResult:
+        """Přeloží celý text a zapamatuje si párování odstavců"""
+        result, error = translator.translate(text, source_lang, target_lang)
+        cache_outcome = take_cache_outcome(translator)
+        # Překlad z cache (např. po prefetchi schránky) už byl zaúčtován - nic se neodeslalo
+        sent_chars = 0 if cache_outcome == "hit" else len(text)
+        if error or result is None:
+            return IncrementalResult(None, error, sent_chars=sent_chars, cache_outcome=cache_outcome)
+
+        translated = split_paragraphs(result)
+        if len(translated) == len(paragraphs):
+            self._remember(source_lang, target_lang, paragraphs, translated)
+        else:
+            # Překlad nezachoval strukturu odstavců - nelze spárovat
+            self.reset()
+        return IncrementalResult(result, None, sent_chars=sent_chars, cache_outcome=cache_outcome)
+
+    def _remember(
+        self,
+        source_lang: str,
+        target_lang: str,
+        source: List[str],
+        translated: List[str]
+    ) -> None:
+        """Uloží poslední párování odstavců"""
+        with self._lock:
+            self._languages = (source_lang, target_lang)
+            self._source = source
+            self._translated = translated
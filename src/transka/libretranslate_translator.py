@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+"""
+LibreTranslate překladač - implementace BaseTranslator
+Pro vlastní (self-hosted) server kompatibilní s LibreTranslate API,
+bez kvóty a bez externích závislostí (urllib)
+"""
+import json
+import logging
+import urllib.error
+import urllib.request
+from typing import Any, Dict, List, Optional, Tuple
+
+from transka.base_translator import BaseTranslator, UsageInfo
+
+# Logging setup
+logger = logging.getLogger(__name__)
+
+
+class LibreTranslateTranslator(BaseTranslator):
+    """
+    Překladač pro server s LibreTranslate API (POST /translate, GET /languages)
+
+    Vhodné pro překlad na vlastním hardwaru v LAN - žádný limit znaků,
+    nízká latence. Dávka jde jedním požadavkem ("q" jako seznam).
+    """
+
+    def __init__(self, url: str = "http://localhost:5000", api_key: str = "", timeout: float = 10.0):
+        """
+        Inicializace LibreTranslate překladače
+
+        Args:
+            url: Adresa serveru (např. "http://192.168.1.10:5000")
+            api_key: Volitelný klíč serveru (prázdný = server bez klíčů)
+            timeout: Timeout HTTP požadavků (s)
+        """
+        self.url = url.rstrip("/")
+        self.api_key = api_key
+        self.timeout = timeout
+        self._usage_count = 0  # Lokální počítadlo znaků
+
+    @classmethod
+    def from_config(cls, config) -> "LibreTranslateTranslator":
+        """Vytvoří překladač z konfigurace (libretranslate_*)"""
+        return cls(config.libretranslate_url, config.libretranslate_api_key, config.libretranslate_timeout)
+
+    def is_configured(self) -> bool:
+        """Kontrola, zda je translator nakonfigurován"""
+        return bool(self.url)
+
+    def _request(self, path: str, payload: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Odešle požadavek na server a vrátí dekódovaný JSON
+
+        Raises:
+            urllib.error.URLError, ValueError
+        """
+        data = None
+        headers = {"Accept": "application/json"}
+        if payload is not None:
+            if self.api_key:
+                payload = dict(payload, api_key=self.api_key)
+            data = json.dumps(payload).encode("utf-8")
+            headers["Content-Type"] = "application/json"
+
+        request = urllib.request.Request(self.url + path, data=data, headers=headers)
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            return json.loads(response.read().decode("utf-8"))
+
+    def _format_error(self, error: Exception) -> str:
+        """Převede výjimku na chybovou zprávu (dočasné chyby rozpozná is_transient_error)"""
+        if isinstance(error, urllib.error.HTTPError):
+            detail = ""
+            try:
+                detail = json.loads(error.read().decode("utf-8")).get("error", "")
+            except Exception:
+                pass
+            return f"LibreTranslate chyba (status code: {error.code}) {detail}".strip()
+        if isinstance(error, urllib.error.URLError):
+            return f"LibreTranslate - chyba spojení (connection): {error.reason}"
+        if isinstance(error, TimeoutError):
+            return "LibreTranslate - požadavek timed out"
+        return f"LibreTranslate chyba: {error}"
+
+    def translate(
+        self,
+        text: str,
+        source_lang: str = "CS",
+        target_lang: str = "EN-US"
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Přeloží text pomocí LibreTranslate serveru
+
+        Args:
+            text: Text k překladu
+            source_lang: Zdrojový jazyk (AUTO pro auto-detekci)
+            target_lang: Cílový jazyk
+
+        Returns:
+            Tuple (přeložený text, chybová zpráva)
+        """
+        if not text or not text.strip():
+            return None, "Prázdný text k překladu"
+
+        results, error = self.translate_batch([text], source_lang, target_lang)
+        if error:
+            return None, error
+        return results[0], None
+
+    def translate_batch(
+        self,
+        texts: List[str],
+        source_lang: str = "CS",
+        target_lang: str = "EN-US"
+    ) -> Tuple[Optional[List[str]], Optional[str]]:
+        """
+        Přeloží více textů jedním požadavkem
+
+        Args:
+            texts: Texty k překladu
+            source_lang: Zdrojový jazyk
+            target_lang: Cílový jazyk
+
+        Returns:
+            Tuple (přeložené texty, chybová zpráva)
+        """
+        if not texts:
+            return [], None
+
+        payload = {
+            "q": texts if len(texts) > 1 else texts[0],
+            "source": self._convert_lang_code(source_lang, is_source=True),
+            "target": self._convert_lang_code(target_lang),
+            "format": "text",
+        }
+        try:
+            response = self._request("/translate", payload)
+        except Exception as e:
+            return None, self._format_error(e)
+
+        translated = response.get("translatedText") if isinstance(response, dict) else None
+        if isinstance(translated, str):
+            translated = [translated]
+        if not isinstance(translated, list) or len(translated) != len(texts):
+            return None, "LibreTranslate vrátil neočekávanou odpověď"
+
+        self._usage_count += sum(len(text) for text in texts)
+        return translated, None
+
+    @staticmethod
+    def _convert_lang_code(lang_code: str, is_source: bool = False) -> str:
+        """
+        Konvertuje kód jazyka z DeepL formátu (EN-US, ZH-HANS) na LibreTranslate (en, zh)
+
+        Args:
+            lang_code: Kód jazyka
+            is_source: True pokud je to zdrojový jazyk (podporuje AUTO)
+
+        Returns:
+            Kód jazyka pro LibreTranslate
+        """
+        if is_source and lang_code.upper() == "AUTO":
+            return "auto"
+        return lang_code.split("-")[0].lower()
+
+    def get_usage(self) -> Tuple[Optional[UsageInfo], Optional[str]]:
+        """
+        Získá informace o spotřebě
+
+        Vlastní server nemá kvótu - vrací lokální počítadlo s "neomezeným" limitem.
+
+        Returns:
+            Tuple (UsageInfo, chybová zpráva)
+        """
+        info = UsageInfo(
+            character_count=self._usage_count,
+            character_limit=999999999,  # "Neomezeno" (vlastní server)
+            service_name="LibreTranslate"
+        )
+        return info, None
+
+    def get_available_languages(self) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]:
+        """
+        Získá seznam jazyků ze serveru (GET /languages)
+
+        Returns:
+            Tuple (zdrojové jazyky, cílové jazyky)
+        """
+        try:
+            languages = self._request("/languages")
+        except Exception as e:
+            logger.error(f"Chyba při získávání jazyků: {e}")
+            return [], []
+
+        langs = [(lang["code"], lang["name"]) for lang in languages if "code" in lang]
+        source_langs = [("AUTO", "Automatická detekce")] + langs
+        return source_langs, langs
+
+    def update_api_key(self, api_key: str) -> None:
+        """
+        Aktualizuje API klíč
+
+        Klíč DeepL z nastavení se ignoruje - klíč serveru je libretranslate_api_key.
+        """
+
+    @property
+    def service_name(self) -> str:
+        """Název služby"""
+        return "LibreTranslate"
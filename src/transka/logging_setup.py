@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+"""
+Nastavení logování pro aplikaci Transka
+Všechny loggery zapisují jen do fronty (QueueHandler) - soubory s rotací
+a konzoli obsluhuje samostatné vlákno, takže Tk vlákno ani hook vlákno
+nikdy nečekají na disk
+"""
+from __future__ import annotations
+
+import json
+import queue
+import sys
+import logging
+import logging.handlers
+from pathlib import Path
+from typing import List, Optional
+
+# Logging setup
+logger = logging.getLogger(__name__)
+
+# Logger výkonnostního logu (jeden JSON řádek na překlad)
+PERF_LOGGER_NAME = "transka.perf"
+perf_logger = logging.getLogger(PERF_LOGGER_NAME)
+
+LOG_FORMAT = "%(asctime)s %(levelname)-7s [%(threadName)s] %(name)s: %(message)s"
+
+
+class _ExcludeLoggerFilter(logging.Filter):
+    """Propustí vše kromě záznamů daného loggeru (a jeho potomků)"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return not super().filter(record)
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Záznam výkonnostního logu jako jeden JSON řádek"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {"ts": round(record.created, 3), "event": record.getMessage()}
+        data.update(getattr(record, "perf", {}))
+        return json.dumps(data, ensure_ascii=False)
+
+
+class LoggingPipeline:
+    """Fronta záznamů + vlákno zapisovače (QueueListener)"""
+
+    def __init__(
+        self,
+        listener: logging.handlers.QueueListener,
+        queue_handler: logging.Handler,
+        handlers: List[logging.Handler]
+    ):
+        self.listener: Optional[logging.handlers.QueueListener] = listener
+        self.queue_handler = queue_handler
+        self.handlers = handlers
+
+    def stop(self) -> None:
+        """Zapíše zbytek fronty a ukončí vlákno zapisovače"""
+        if self.listener is None:
+            return
+        logging.getLogger().removeHandler(self.queue_handler)
+        self.listener.stop()
+        self.listener = None
+        for handler in self.handlers:
+            handler.close()
+
+    def set_level(self, level: str) -> None:
+        """Změní úroveň logování za běhu (hot reload konfigurace)"""
+        logging.getLogger().setLevel(_parse_level(level))
+
+
+def _parse_level(level: str) -> int:
+    """Název úrovně → číslo (neznámá úroveň = INFO)"""
+    value = logging.getLevelName(str(level).upper())
+    return value if isinstance(value, int) else logging.INFO
+
+
+def _rotating_handler(path: Path, max_bytes: int, backup_count: int) -> logging.Handler:
+    """RotatingFileHandler s vytvořením adresáře"""
+    path = Path(path)
+    if path.parent and not path.parent.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+    return logging.handlers.RotatingFileHandler(
+        path,
+        maxBytes=max(0, int(max_bytes)),
+        backupCount=max(0, int(backup_count)),
+        encoding="utf-8",
+        delay=True
+    )
+
+
+def setup_logging(
+    log_file: Optional[Path],
+    level: str = "INFO",
+    max_bytes: int = 1_000_000,
+    backup_count: int = 3,
+    perf_file: Optional[Path] = None,
+    console: bool = True
+) -> LoggingPipeline:
+    """
+    Přesměruje logování přes frontu do vlákna zapisovače
+
+    Root logger dostane jediný QueueHandler (neomezená SimpleQueue - zápis
+    do fronty nikdy neblokuje). Vlákno QueueListener rozesílá záznamy do
+    rotovaného logu, na stderr a záznamy loggeru transka.perf do
+    samostatného JSON-lines souboru.
+
+    Args:
+        log_file: Hlavní log (None = jen konzole)
+        level: Úroveň logování ("DEBUG", "INFO", ...)
+        max_bytes: Velikost souboru, po které se rotuje (0 = bez rotace)
+        backup_count: Počet ponechaných starých souborů
+        perf_file: Výkonnostní log (None = vypnuto)
+        console: Logovat i na stderr (pokud existuje - pythonw ho nemá)
+
+    Returns:
+        LoggingPipeline - stop() při ukončení aplikace dopíše frontu
+    """
+    handlers: List[logging.Handler] = []
+    formatter = logging.Formatter(LOG_FORMAT)
+    not_perf = _ExcludeLoggerFilter(PERF_LOGGER_NAME)
+
+    if log_file is not None:
+        try:
+            handler = _rotating_handler(log_file, max_bytes, backup_count)
+            handler.setFormatter(formatter)
+            handler.addFilter(not_perf)
+            handlers.append(handler)
+        except OSError as e:
+            if sys.stderr is not None:
+                sys.stderr.write(f"Nelze otevřít log {log_file}: {e}\n")
+
+    if console and sys.stderr is not None:
+        handler = logging.StreamHandler(sys.stderr)
+        handler.setFormatter(formatter)
+        handler.addFilter(not_perf)
+        handlers.append(handler)
+
+    if perf_file is not None:
+        try:
+            handler = _rotating_handler(perf_file, max_bytes, backup_count)
+            handler.setFormatter(JsonLinesFormatter())
+            handler.addFilter(logging.Filter(PERF_LOGGER_NAME))
+            handlers.append(handler)
+            perf_logger.setLevel(logging.INFO)
+        except OSError as e:
+            if sys.stderr is not None:
+                sys.stderr.write(f"Nelze otevřít výkonnostní log {perf_file}: {e}\n")
+    else:
+        # Bez souboru se záznamy ani nevytvářejí (log_translation skončí na isEnabledFor)
+        perf_logger.setLevel(logging.CRITICAL + 1)
+
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+
+    root = logging.getLogger()
+    for existing in list(root.handlers):
+        root.removeHandler(existing)
+    root.addHandler(queue_handler)
+    root.setLevel(_parse_level(level))
+
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+
+    logger.info(f"Logování: {log_file or 'jen konzole'}, úroveň {level}, výkonnostní log {perf_file or 'vypnut'}")
+    return LoggingPipeline(listener, queue_handler, handlers)
+
+
+def log_translation(
+    latency: float,
+    chars: int,
+    backend: str,
+    cache: str,
+    error: Optional[str] = None,
+    **fields
+) -> None:
+    """
+    Zapíše jeden záznam výkonnostního logu o překladu
+
+    Args:
+        latency: Doba překladu v sekundách
+        chars: Počet znaků vstupu
+        backend: Název překladače
+        cache: Výsledek cache ("hit", "miss", "partial", "off")
+        error: Chybová zpráva (None = úspěch)
+        **fields: Další pole záznamu (třída požadavku, cílový jazyk...)
+    """
+    if not perf_logger.isEnabledFor(logging.INFO):
+        return
+    record = {
+        "latency_ms": round(latency * 1000, 1),
+        "chars": chars,
+        "backend": backend,
+        "cache": cache,
+        "ok": error is None,
+    }
+    if error is not None:
+        record["error"] = error
+    record.update(fields)
+    perf_logger.info("translation", extra={"perf": record})
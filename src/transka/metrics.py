@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*-
+"""
+Metriky a tracing spany pro aplikaci Transka
+Měří latenci jednotlivých kroků workflow (hotkey → překlad → schránka)
+a periodicky je exportuje do lokálního souboru (Prometheus text / JSON-lines)
+"""
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+import logging
+from pathlib import Path
+from typing import Dict, Tuple, Optional, Any, List
+
+# Logging setup
+logger = logging.getLogger(__name__)
+
+# Hranice histogramu v sekundách (poslední bucket je +Inf)
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+
+class Histogram:
+    """Kumulativní histogram latencí (kompatibilní s Prometheus)"""
+
+    __slots__ = ("buckets", "counts", "count", "total")
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts: List[int] = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value: float) -> None:
+        """Zaznamená jednu hodnotu (v sekundách)"""
+        index = len(self.buckets)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                index = i
+                break
+        self.counts[index] += 1
+        self.count += 1
+        self.total += value
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Vrátí kumulativní buckety, počet a součet"""
+        cumulative = []
+        running = 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            running += count
+            cumulative.append(["+Inf" if bound == float("inf") else bound, running])
+        return {"buckets": cumulative, "count": self.count, "sum": self.total}
+
+
+class _Span:
+    """Context manager měřící dobu jednoho kroku"""
+
+    __slots__ = ("_metrics", "_stage", "_backend", "_start")
+
+    def __init__(self, metrics: "Metrics", stage: str, backend: str):
+        self._metrics = metrics
+        self._stage = stage
+        self._backend = backend
+        self._start = 0.0
+
+    def __enter__(self) -> "_Span":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self._metrics.observe(self._stage, time.perf_counter() - self._start, self._backend)
+        if exc_type is not None:
+            self._metrics.inc(f"{self._stage}_errors", self._backend)
+        return False
+
+
+class _NullSpan:
+    """No-op span - použit při vypnutých metrikách (nulová režie)"""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Metrics:
+    """Agregace spanů do histogramů a counterů (per stage + backend)"""
+
+    def __init__(self, enabled: bool = False):
+        """
+        Inicializuje Metrics
+
+        Args:
+            enabled: False = všechny operace jsou no-op
+        """
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._histograms: Dict[Tuple[str, str], Histogram] = {}
+        self._counters: Dict[Tuple[str, str], int] = {}
+
+    def span(self, stage: str, backend: str = ""):
+        """
+        Vrátí context manager měřící dobu kroku
+
+        Args:
+            stage: Název kroku (např. "network", "render")
+            backend: Název překladače (label)
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, stage, backend)
+
+    def observe(self, stage: str, seconds: float, backend: str = "") -> None:
+        """Zaznamená naměřenou dobu kroku (pro spany přes hranice vláken)"""
+        if not self.enabled:
+            return
+        key = (stage, backend)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram()
+            histogram.observe(seconds)
+
+    def inc(self, name: str, backend: str = "", value: int = 1) -> None:
+        """Zvýší counter"""
+        if not self.enabled:
+            return
+        key = (name, backend)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Vrátí konzistentní kopii všech metrik"""
+        with self._lock:
+            histograms = {key: hist.to_dict() for key, hist in self._histograms.items()}
+            counters = dict(self._counters)
+        return {"histograms": histograms, "counters": counters}
+
+    def render_prometheus(self) -> str:
+        """Vyrenderuje metriky v Prometheus text formátu"""
+        snapshot = self.snapshot()
+        lines = [
+            "# HELP transka_stage_seconds Doba kroku workflow v sekundách",
+            "# TYPE transka_stage_seconds histogram",
+        ]
+        for (stage, backend), data in sorted(snapshot["histograms"].items()):
+            labels = f'stage="{stage}",backend="{backend}"'
+            for bound, count in data["buckets"]:
+                lines.append(f'transka_stage_seconds_bucket{{{labels},le="{bound}"}} {count}')
+            lines.append(f"transka_stage_seconds_sum{{{labels}}} {data['sum']:.6f}")
+            lines.append(f"transka_stage_seconds_count{{{labels}}} {data['count']}")
+
+        lines.append("# HELP transka_events_total Počet událostí")
+        lines.append("# TYPE transka_events_total counter")
+        for (name, backend), value in sorted(snapshot["counters"].items()):
+            lines.append(f'transka_events_total{{name="{name}",backend="{backend}"}} {value}')
+        return "\n".join(lines) + "\n"
+
+    def render_jsonl(self) -> str:
+        """Vyrenderuje metriky jako jeden JSON řádek (append do souboru)"""
+        snapshot = self.snapshot()
+        record = {
+            "ts": time.time(),
+            "histograms": [
+                {"stage": stage, "backend": backend, **data}
+                for (stage, backend), data in sorted(snapshot["histograms"].items())
+            ],
+            "counters": [
+                {"name": name, "backend": backend, "value": value}
+                for (name, backend), value in sorted(snapshot["counters"].items())
+            ],
+        }
+        return json.dumps(record, ensure_ascii=False) + "\n"
+
+
+class MetricsExporter:
+    """Periodický export metrik do lokálního souboru v separátním vlákně"""
+
+    def __init__(
+        self,
+        metrics: Metrics,
+        path: Path,
+        export_format: str = "prometheus",
+        interval: float = 30.0
+    ):
+        """
+        Inicializuje MetricsExporter
+
+        Args:
+            metrics: Instance Metrics
+            path: Cílový soubor
+            export_format: "prometheus" (přepisuje soubor) nebo "jsonl" (append)
+            interval: Interval exportu v sekundách
+        """
+        self.metrics = metrics
+        self.path = Path(path)
+        self.export_format = export_format.lower()
+        self.interval = max(1.0, float(interval))
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Spustí export vlákno (pouze pokud jsou metriky zapnuté)"""
+        if not self.metrics.enabled or self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="metrics-exporter", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Zastaví export vlákno a provede finální export"""
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join(timeout=2.0)
+        self._thread = None
+        self.export()
+
+    def _run(self) -> None:
+        """Smyčka exportu - čeká na stop event s timeoutem (žádný busy loop)"""
+        while not self._stop_event.wait(self.interval):
+            self.export()
+
+    def export(self) -> None:
+        """Zapíše aktuální metriky do souboru"""
+        try:
+            if self.export_format == "jsonl":
+                with self.path.open("a", encoding="utf-8") as f:
+                    f.write(self.metrics.render_jsonl())
+            else:
+                # Atomický přepis - čtenář nikdy nevidí napůl zapsaný soubor
+                tmp_path = self.path.with_name(self.path.name + ".tmp")
+                tmp_path.write_text(self.metrics.render_prometheus(), encoding="utf-8")
+                os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.error(f"Chyba při exportu metrik: {e}", exc_info=True)
@@ -0,0 +1,513 @@
+# -*- coding: utf-8 -*-
+"""
+Middleware pipeline pro překladače
+Průřezové funkce (cache, retry, rate limiting, metriky, preprocessing)
+obalují libovolný BaseTranslator bez zásahu do DeepL/Google implementací
+"""
+from __future__ import annotations
+
+import threading
+import time
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Tuple, List, Dict, Any, Type, Callable, Sequence
+
+from transka.base_translator import BaseTranslator, UsageInfo, is_transient_error
+from transka.metrics import Metrics
+
+# Logging setup
+logger = logging.getLogger(__name__)
+
+# Thread-local akumulátor času stráveného ve vnitřních vrstvách
+_timing = threading.local()
+
+
+@dataclass
+class LayerStats:
+    """Statistika jedné vrstvy pipeline"""
+    calls: int = 0
+    short_circuits: int = 0
+    self_time: float = 0.0  # Čas strávený v samotné vrstvě (bez vnitřních vrstev)
+
+    @property
+    def avg_overhead_ms(self) -> float:
+        """Průměrná režie vrstvy na volání v ms"""
+        if self.calls == 0:
+            return 0.0
+        return self.self_time / self.calls * 1000
+
+
+class TranslatorMiddleware(BaseTranslator):
+    """
+    Základ pro vrstvu pipeline - obaluje vnitřní překladač
+
+    Vrstva přepisuje process_* metody. Volání forward_* předá požadavek
+    další vrstvě; vrácení výsledku bez forward_* je short-circuit
+    (např. cache hit). Režie každé vrstvy se měří automaticky.
+    """
+
+    name = "middleware"
+
+    def __init__(self, inner: BaseTranslator, config=None, metrics: Optional[Metrics] = None):
+        """
+        Inicializuje vrstvu
+
+        Args:
+            inner: Vnitřní překladač (další vrstva nebo backend)
+            config: Config instance pro nastavení vrstvy
+            metrics: Volitelné metriky
+        """
+        self.inner = inner
+        self.config = config
+        self.metrics = metrics or Metrics(enabled=False)
+        self.stats = LayerStats()
+        self._stats_lock = threading.Lock()
+
+    # --- Veřejné rozhraní BaseTranslator (měřené) ---
+
+    def translate(
+        self,
+        text: str,
+        source_lang: str = "CS",
+        target_lang: str = "EN-US"
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """Přeloží text přes vrstvu"""
+        return self._timed(self.process_translate, text, source_lang, target_lang)
+
+    def translate_batch(
+        self,
+        texts: List[str],
+        source_lang: str = "CS",
+        target_lang: str = "EN-US"
+    ) -> Tuple[Optional[List[str]], Optional[str]]:
+        """Přeloží více textů přes vrstvu"""
+        return self._timed(self.process_translate_batch, texts, source_lang, target_lang)
+
+    def get_usage(self) -> Tuple[Optional[UsageInfo], Optional[str]]:
+        """Získá usage přes vrstvu"""
+        return self._timed(self.process_get_usage)
+
+    def get_available_languages(self) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]:
+        """Získá jazyky přes vrstvu"""
+        return self._timed(self.process_get_available_languages)
+
+    def is_configured(self) -> bool:
+        """Kontrola konfigurace - deleguje na vnitřní překladač"""
+        return self.inner.is_configured()
+
+    def update_api_key(self, api_key: str) -> None:
+        """Aktualizace API klíče - deleguje na vnitřní překladač"""
+        self.inner.update_api_key(api_key)
+
+    @property
+    def service_name(self) -> str:
+        """Název služby vnitřního backendu"""
+        return self.inner.service_name
+
+    # --- Body pro přepsání ve vrstvách ---
+
+    def process_translate(self, text: str, source_lang: str, target_lang: str):
+        """Zpracování translate() - výchozí je průchod dál"""
+        return self.forward_translate(text, source_lang, target_lang)
+
+    def process_translate_batch(self, texts: List[str], source_lang: str, target_lang: str):
+        """Zpracování translate_batch() - výchozí je průchod dál"""
+        return self.forward_translate_batch(texts, source_lang, target_lang)
+
+    def process_get_usage(self):
+        """Zpracování get_usage() - výchozí je průchod dál"""
+        return self.forward_get_usage()
+
+    def process_get_available_languages(self):
+        """Zpracování get_available_languages() - výchozí je průchod dál"""
+        return self.forward_get_available_languages()
+
+    # --- Předání další vrstvě ---
+
+    def forward_translate(self, text: str, source_lang: str, target_lang: str):
+        """Předá translate() vnitřní vrstvě"""
+        return self._forward(self.inner.translate, text, source_lang, target_lang)
+
+    def forward_translate_batch(self, texts: List[str], source_lang: str, target_lang: str):
+        """Předá translate_batch() vnitřní vrstvě"""
+        return self._forward(self.inner.translate_batch, texts, source_lang, target_lang)
+
+    def forward_get_usage(self):
+        """Předá get_usage() vnitřní vrstvě"""
+        return self._forward(self.inner.get_usage)
+
+    def forward_get_available_languages(self):
+        """Předá get_available_languages() vnitřní vrstvě"""
+        return self._forward(self.inner.get_available_languages)
+
+    # --- Měření režie ---
+
+    def _timed(self, handler: Callable, *args):
+        """Zavolá handler a změří čas strávený pouze v této vrstvě"""
+        outer_inner_time = getattr(_timing, "inner", 0.0)
+        _timing.inner = 0.0
+        start = time.perf_counter()
+        try:
+            return handler(*args)
+        finally:
+            self_time = time.perf_counter() - start - _timing.inner
+            _timing.inner = outer_inner_time
+            with self._stats_lock:
+                self.stats.calls += 1
+                self.stats.self_time += self_time
+            self.metrics.observe(f"middleware_{self.name}", self_time)
+
+    def _forward(self, method: Callable, *args):
+        """Zavolá vnitřní vrstvu a přičte její čas do akumulátoru"""
+        start = time.perf_counter()
+        try:
+            return method(*args)
+        finally:
+            _timing.inner = getattr(_timing, "inner", 0.0) + time.perf_counter() - start
+
+    def _short_circuit(self) -> None:
+        """Zaznamená, že vrstva vrátila výsledek bez volání další vrstvy"""
+        with self._stats_lock:
+            self.stats.short_circuits += 1
+
+
+class PreprocessMiddleware(TranslatorMiddleware):
+    """Normalizace vstupu (konce řádků, koncové mezery) + odmítnutí prázdného textu"""
+
+    name = "preprocess"
+
+    def process_translate(self, text: str, source_lang: str, target_lang: str):
+        """Normalizuje text; prázdný vstup nepošle na API"""
+        if not text or not text.strip():
+            self._short_circuit()
+            return None, "Prázdný text k překladu"
+
+        return self.forward_translate(self._normalize(text), source_lang, target_lang)
+
+    def process_translate_batch(self, texts: List[str], source_lang: str, target_lang: str):
+        """Normalizuje každý text; prázdný text v dávce odmítne celou dávku"""
+        if any(not text or not text.strip() for text in texts):
+            self._short_circuit()
+            return None, "Prázdný text k překladu"
+        return self.forward_translate_batch([self._normalize(text) for text in texts], source_lang, target_lang)
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        """Sjednotí konce řádků a odstraní koncové mezery"""
+        normalized = "\n".join(line.rstrip() for line in text.replace("\r\n", "\n").split("\n"))
+        return normalized.strip("\n")
+
+
+class CacheMiddleware(TranslatorMiddleware):
+    """LRU cache úspěšných překladů a seznamu jazyků"""
+
+    name = "cache"
+
+    def __init__(self, inner: BaseTranslator, config=None, metrics: Optional[Metrics] = None):
+        super().__init__(inner, config, metrics)
+        self.max_entries = int(config.get("cache_max_entries", 256)) if config is not None else 256
+        self._cache: "OrderedDict[Tuple[str, str, str], str]" = OrderedDict()
+        self._languages = None
+        self._lock = threading.Lock()
+        # Výsledek posledního dotazu v daném vlákně (pro výkonnostní log)
+        self._outcome = threading.local()
+
+    def process_translate(self, text: str, source_lang: str, target_lang: str):
+        """Vrátí překlad z cache (short-circuit) nebo ho získá a uloží"""
+        key = (text, source_lang, target_lang)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+        if cached is not None:
+            self._short_circuit()
+            self.metrics.inc("cache_hits", self.service_name)
+            self._outcome.value = "hit"
+            return cached, None
+
+        self.metrics.inc("cache_misses", self.service_name)
+        self._outcome.value = "miss"
+        result, error = self.forward_translate(text, source_lang, target_lang)
+        if result is not None and not error:
+            self._store(key, result)
+        return result, error
+
+    def process_translate_batch(self, texts: List[str], source_lang: str, target_lang: str):
+        """Dál pošle jen texty, které nejsou v cache; výsledky poskládá zpět"""
+        results: List[Optional[str]] = []
+        with self._lock:
+            for text in texts:
+                key = (text, source_lang, target_lang)
+                cached = self._cache.get(key)
+                if cached is not None:
+                    self._cache.move_to_end(key)
+                results.append(cached)
+
+        missing = [index for index, cached in enumerate(results) if cached is None]
+        self.metrics.inc("cache_hits", self.service_name, len(texts) - len(missing))
+        self._outcome.value = "hit" if not missing else "miss" if len(missing) == len(texts) else "partial"
+        if not missing:
+            self._short_circuit()
+            return results, None
+
+        self.metrics.inc("cache_misses", self.service_name, len(missing))
+        translated, error = self.forward_translate_batch(
+            [texts[index] for index in missing], source_lang, target_lang
+        )
+        if error or translated is None:
+            return None, error
+
+        for index, result in zip(missing, translated):
+            results[index] = result
+            self._store((texts[index], source_lang, target_lang), result)
+        return results, None
+
+    def _store(self, key: Tuple[str, str, str], result: str) -> None:
+        """Uloží překlad do LRU cache"""
+        with self._lock:
+            self._cache[key] = result
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+
+    def process_get_available_languages(self):
+        """Seznam jazyků se mění zřídka - cachuje se první neprázdná odpověď"""
+        if self._languages is not None:
+            self._short_circuit()
+            return self._languages
+        languages = self.forward_get_available_languages()
+        if languages[0] or languages[1]:
+            self._languages = languages
+        return languages
+
+    def update_api_key(self, api_key: str) -> None:
+        """Nový klíč může znamenat jiný účet - jazyky se načtou znovu"""
+        self._languages = None
+        super().update_api_key(api_key)
+
+    def take_outcome(self) -> Optional[str]:
+        """Vrátí a smaže výsledek posledního dotazu z aktuálního vlákna ("hit", "miss", "partial")"""
+        outcome = getattr(self._outcome, "value", None)
+        self._outcome.value = None
+        return outcome
+
+    def contains(self, text: str, source_lang: str, target_lang: str) -> bool:
+        """Kontrola, zda je překlad v cache (bez změny LRU pořadí)"""
+        with self._lock:
+            return (text, source_lang, target_lang) in self._cache
+
+
+class RetryMiddleware(TranslatorMiddleware):
+    """Opakování požadavků při dočasných chybách (síť, 5xx) s exponenciálním backoffem"""
+
+    name = "retry"
+
+    def __init__(self, inner: BaseTranslator, config=None, metrics: Optional[Metrics] = None):
+        super().__init__(inner, config, metrics)
+        self.attempts = int(config.get("retry_attempts", 2)) if config is not None else 2
+        self.backoff = float(config.get("retry_backoff", 0.5)) if config is not None else 0.5
+
+    def _with_retry(self, forward: Callable, *args):
+        """Volá forward, dokud nevrátí nedočasnou chybu nebo nedojdou pokusy"""
+        result = forward(*args)
+        for attempt in range(self.attempts):
+            if not is_transient_error(result[1]):
+                break
+            delay = self.backoff * (2 ** attempt)
+            logger.info(f"Dočasná chyba '{result[1]}', opakuji za {delay:.1f}s")
+            self.metrics.inc("retries", self.service_name)
+            time.sleep(delay)
+            result = forward(*args)
+        return result
+
+    def process_translate(self, text: str, source_lang: str, target_lang: str):
+        """translate() s opakováním"""
+        return self._with_retry(self.forward_translate, text, source_lang, target_lang)
+
+    def process_translate_batch(self, texts: List[str], source_lang: str, target_lang: str):
+        """translate_batch() s opakováním"""
+        return self._with_retry(self.forward_translate_batch, texts, source_lang, target_lang)
+
+    def process_get_usage(self):
+        """get_usage() s opakováním"""
+        return self._with_retry(self.forward_get_usage)
+
+
+class RateLimitMiddleware(TranslatorMiddleware):
+    """Token bucket omezující počet požadavků za sekundu (blokuje worker vlákno)"""
+
+    name = "rate_limit"
+
+    def __init__(self, inner: BaseTranslator, config=None, metrics: Optional[Metrics] = None):
+        super().__init__(inner, config, metrics)
+        self.rate = float(config.get("rate_limit_per_second", 5)) if config is not None else 5.0
+        self.capacity = max(1.0, self.rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _acquire(self) -> None:
+        """Počká na volný token"""
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                wait = (1.0 - self._tokens) / self.rate
+            self.metrics.inc("rate_limited", self.service_name)
+            time.sleep(wait)
+
+    def process_translate(self, text: str, source_lang: str, target_lang: str):
+        """translate() až po získání tokenu"""
+        self._acquire()
+        return self.forward_translate(text, source_lang, target_lang)
+
+    def process_translate_batch(self, texts: List[str], source_lang: str, target_lang: str):
+        """Dávka je jeden požadavek - stojí jeden token"""
+        self._acquire()
+        return self.forward_translate_batch(texts, source_lang, target_lang)
+
+
+class MetricsMiddleware(TranslatorMiddleware):
+    """Počítadla volání a chyb backendu + latence vnitřní části pipeline"""
+
+    name = "metrics"
+
+    def process_translate(self, text: str, source_lang: str, target_lang: str):
+        """Změří translate() vnitřních vrstev"""
+        backend = self.service_name
+        with self.metrics.span("backend_translate", backend):
+            result, error = self.forward_translate(text, source_lang, target_lang)
+        self.metrics.inc("backend_errors" if error else "backend_calls", backend)
+        return result, error
+
+    def process_translate_batch(self, texts: List[str], source_lang: str, target_lang: str):
+        """Změří translate_batch() vnitřních vrstev"""
+        backend = self.service_name
+        with self.metrics.span("backend_translate_batch", backend):
+            results, error = self.forward_translate_batch(texts, source_lang, target_lang)
+        self.metrics.inc("backend_errors" if error else "backend_calls", backend)
+        return results, error
+
+    def process_get_usage(self):
+        """Změří get_usage() vnitřních vrstev"""
+        with self.metrics.span("backend_usage", self.service_name):
+            return self.forward_get_usage()
+
+
+# Registr dostupných vrstev (název v config → třída)
+MIDDLEWARE_REGISTRY: Dict[str, Type[TranslatorMiddleware]] = {
+    PreprocessMiddleware.name: PreprocessMiddleware,
+    CacheMiddleware.name: CacheMiddleware,
+    RetryMiddleware.name: RetryMiddleware,
+    RateLimitMiddleware.name: RateLimitMiddleware,
+    MetricsMiddleware.name: MetricsMiddleware,
+}
+
+
+def build_pipeline(
+    translator: BaseTranslator,
+    layer_names: Sequence[str],
+    config=None,
+    metrics: Optional[Metrics] = None
+) -> BaseTranslator:
+    """
+    Sestaví middleware stack kolem backendu
+
+    Pořadí v layer_names je od vnější vrstvy k vnitřní - první vrstva
+    vidí požadavek jako první a výsledek jako poslední.
+
+    Args:
+        translator: Backend (DeepL/Google)
+        layer_names: Názvy vrstev z MIDDLEWARE_REGISTRY
+        config: Config instance
+        metrics: Volitelné metriky
+
+    Returns:
+        Nejvnější vrstva (nebo samotný backend při prázdném seznamu)
+    """
+    wrapped = translator
+    for name in reversed(list(layer_names)):
+        layer_class = MIDDLEWARE_REGISTRY.get(name)
+        if layer_class is None:
+            logger.warning(f"Neznámá middleware vrstva: {name}")
+            continue
+        wrapped = layer_class(wrapped, config, metrics)
+    return wrapped
+
+
+def find_layer(translator: BaseTranslator, layer_class: Type[TranslatorMiddleware]) -> Optional[TranslatorMiddleware]:
+    """Najde první vrstvu daného typu ve stacku"""
+    current = translator
+    while isinstance(current, TranslatorMiddleware):
+        if isinstance(current, layer_class):
+            return current
+        current = current.inner
+    return None
+
+
+def get_backend(translator: BaseTranslator) -> BaseTranslator:
+    """Vrátí backend pod všemi vrstvami pipeline"""
+    current = translator
+    while isinstance(current, TranslatorMiddleware):
+        current = current.inner
+    return current
+
+
+def take_cache_outcome(translator: BaseTranslator) -> str:
+    """
+    Výsledek cache pro poslední překlad z aktuálního vlákna
+
+    Returns:
+        "hit", "miss", "partial", "none" (cache nebyla dotázána) nebo "off" (bez cache vrstvy)
+    """
+    cache = find_layer(translator, CacheMiddleware)
+    if cache is None:
+        return "off"
+    return cache.take_outcome() or "none"
+
+
+def cache_contains(translator: BaseTranslator, text: str, source_lang: str, target_lang: str) -> bool:
+    """
+    Kontrola, zda by překlad textu přišel z cache
+
+    Text projde normalizací vrstev nad cache stejně jako při translate(),
+    takže se porovnává se skutečným klíčem cache.
+
+    Returns:
+        True pokud je překlad v cache (False i bez cache vrstvy)
+    """
+    current = translator
+    while isinstance(current, TranslatorMiddleware):
+        if isinstance(current, CacheMiddleware):
+            return current.contains(text, source_lang, target_lang)
+        if isinstance(current, PreprocessMiddleware):
+            text = current._normalize(text)
+        current = current.inner
+    return False
+
+
+def get_pipeline_stats(translator: BaseTranslator) -> List[Dict[str, Any]]:
+    """
+    Vrátí statistiky všech vrstev (od vnější k vnitřní)
+
+    Returns:
+        List dictů s názvem vrstvy, počtem volání, short-circuity a režií
+    """
+    stats = []
+    current = translator
+    while isinstance(current, TranslatorMiddleware):
+        stats.append({
+            "layer": current.name,
+            "calls": current.stats.calls,
+            "short_circuits": current.stats.short_circuits,
+            "avg_overhead_ms": current.stats.avg_overhead_ms,
+        })
+        current = current.inner
+    return stats
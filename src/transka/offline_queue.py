@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+"""
+Offline fronta požadavků pro aplikaci Transka
+Překlady, které selhaly na dočasné chybě (síť, 5xx), se uloží na disk a
+drainer je po obnovení spojení dopřeloží s exponenciálním backoffem
+"""
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional
+
+from transka.base_translator import BaseTranslator, is_transient_error
+from transka.budget import BudgetScheduler, INTERACTIVE, BATCH, PREFETCH
+from transka.middleware import take_cache_outcome
+from transka.logging_setup import log_translation
+
+# Logging setup
+logger = logging.getLogger(__name__)
+
+# Priorita tříd při vyprazdňování fronty (nižší číslo = dřív)
+CLASS_PRIORITY = {INTERACTIVE: 0, BATCH: 1, PREFETCH: 2}
+
+# Max čekání drainer vlákna bez podnětu (s)
+IDLE_WAIT = 30.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS queue (
+    id INTEGER PRIMARY KEY,
+    source_text TEXT NOT NULL,
+    source_lang TEXT NOT NULL,
+    target_lang TEXT NOT NULL,
+    request_class TEXT NOT NULL,
+    priority INTEGER NOT NULL,
+    created REAL NOT NULL,
+    requests INTEGER NOT NULL DEFAULT 1,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt REAL NOT NULL,
+    last_error TEXT,
+    UNIQUE(source_text, source_lang, target_lang)
+);
+CREATE INDEX IF NOT EXISTS queue_due ON queue(next_attempt);
+"""
+
+
+@dataclass
+class QueuedRequest:
+    """Požadavek ve frontě"""
+    id: int
+    source_text: str
+    source_lang: str
+    target_lang: str
+    request_class: str
+    requests: int  # Kolikrát byl stejný požadavek zařazen (sloučené duplicity)
+    attempts: int
+
+
+class OfflineQueue:
+    """
+    Trvalá fronta překladů v SQLite + drainer vlákno
+
+    Stejný text se stejnými jazyky je ve frontě jen jednou (UNIQUE) -
+    opakované zařazení jen zvýší počítadlo, zaplatí se jednou. Drainer
+    zpracovává položky podle priority třídy; při dočasné chybě se položka
+    i celé vyprazdňování odloží s exponenciálním backoffem, trvalá chyba
+    položku vyřadí.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        translator_provider: Callable[[], BaseTranslator],
+        on_result: Callable[[QueuedRequest, Optional[str], Optional[str]], None],
+        budget: Optional[BudgetScheduler] = None,
+        base_delay: float = 5.0,
+        max_delay: float = 600.0
+    ):
+        """
+        Inicializuje OfflineQueue
+
+        Args:
+            path: Soubor databáze fronty
+            translator_provider: Vrací aktuální překladač
+            on_result: Callback (požadavek, výsledek, chyba) - volá se z drainer vlákna
+            budget: Volitelný rozpočet (třída požadavku)
+            base_delay: První prodleva backoffu (s)
+            max_delay: Max prodleva backoffu (s)
+        """
+        self.path = Path(path)
+        self.translator_provider = translator_provider
+        self.on_result = on_result
+        self.budget = budget
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._conn = sqlite3.connect(str(self.path), timeout=5.0, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    # --- Životní cyklus ---
+
+    def start(self) -> None:
+        """Spustí drainer vlákno"""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._drain_loop, name="offline-queue", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Zastaví drainer (nevyřízené položky zůstávají na disku)"""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+        with self._lock:
+            self._conn.close()
+
+    # --- Fronta ---
+
+    def enqueue(self, text: str, source_lang: str, target_lang: str, request_class: str = BATCH) -> bool:
+        """
+        Zařadí požadavek (volatelné z libovolného vlákna)
+
+        Returns:
+            True pokud jde o nový požadavek, False pokud byl sloučen s existujícím
+        """
+        priority = CLASS_PRIORITY.get(request_class, len(CLASS_PRIORITY))
+        with self._lock:
+            with self._conn:
+                cursor = self._conn.execute(
+                    "INSERT OR IGNORE INTO queue(source_text, source_lang, target_lang, request_class, "
+                    "priority, created, next_attempt) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (text, source_lang, target_lang, request_class, priority, time.time(), time.time())
+                )
+                created = cursor.rowcount == 1
+                if not created:
+                    # Duplicita - jedna platba; vyšší priorita vyhrává
+                    self._conn.execute(
+                        "UPDATE queue SET requests = requests + 1, "
+                        "request_class = CASE WHEN priority > ? THEN ? ELSE request_class END, "
+                        "priority = MIN(priority, ?) "
+                        "WHERE source_text = ? AND source_lang = ? AND target_lang = ?",
+                        (priority, request_class, priority, text, source_lang, target_lang)
+                    )
+        self._wake.set()
+        logger.info(f"Požadavek {'zařazen do' if created else 'sloučen ve'} frontě ({len(text)} znaků)")
+        return created
+
+    def pending_count(self) -> int:
+        """Počet čekajících požadavků"""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM queue").fetchone()[0]
+
+    def _next_due(self) -> Optional[QueuedRequest]:
+        """Nejdůležitější položka, jejíž čas nadešel"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT id, source_text, source_lang, target_lang, request_class, requests, attempts "
+                "FROM queue WHERE next_attempt <= ? ORDER BY priority, id LIMIT 1",
+                (time.time(),)
+            ).fetchone()
+        return QueuedRequest(*row) if row else None
+
+    def _seconds_until_next(self) -> float:
+        """Doba do nejbližší naplánované položky"""
+        with self._lock:
+            row = self._conn.execute("SELECT MIN(next_attempt) FROM queue").fetchone()
+        if row[0] is None:
+            return IDLE_WAIT
+        return min(IDLE_WAIT, max(0.0, row[0] - time.time()))
+
+    def _remove(self, request: QueuedRequest) -> None:
+        with self._lock:
+            with self._conn:
+                self._conn.execute("DELETE FROM queue WHERE id = ?", (request.id,))
+
+    def _postpone(self, request: QueuedRequest, delay: float, error: str, count_attempt: bool = True) -> None:
+        with self._lock:
+            with self._conn:
+                self._conn.execute(
+                    "UPDATE queue SET attempts = attempts + ?, next_attempt = ?, last_error = ? WHERE id = ?",
+                    (1 if count_attempt else 0, time.time() + delay, error, request.id)
+                )
+
+    # --- Drainer ---
+
+    def _drain_loop(self) -> None:
+        """Vyprazdňuje frontu; při výpadku čeká s exponenciálním backoffem"""
+        while not self._stop.is_set():
+            request = self._next_due()
+            if request is None:
+                self._wake.wait(self._seconds_until_next())
+                self._wake.clear()
+                continue
+
+            delay = self._process(request)
+            if delay:
+                # Výpadek trvá - nezkoušet hned další položky
+                self._stop.wait(delay)
+
+    def _process(self, request: QueuedRequest) -> float:
+        """
+        Zpracuje jednu položku
+
+        Returns:
+            Prodleva před dalším pokusem (0 = pokračovat hned)
+        """
+        chars = len(request.source_text)
+        if self.budget is not None:
+            decision = self.budget.reserve(request.request_class, chars)
+            if not decision.allowed:
+                self._postpone(request, max(decision.retry_after, self.base_delay), decision.reason, False)
+                return 0.0
+
+        translator = self.translator_provider()
+        started = time.perf_counter()
+        result, error = translator.translate(request.source_text, request.source_lang, request.target_lang)
+        cache_outcome = take_cache_outcome(translator)
+        # Zásah cache se na API neposlal - nezapočítává se do rozpočtu
+        sent_chars = 0 if error or cache_outcome == "hit" else chars
+        log_translation(
+            time.perf_counter() - started, chars, translator.service_name, cache_outcome, error,
+            kind=f"queued-{request.request_class}", target=request.target_lang, sent_chars=sent_chars
+        )
+
+        if self.budget is not None:
+            self.budget.commit(request.request_class, chars, sent_chars)
+
+        if error and is_transient_error(error):
+            delay = min(self.max_delay, self.base_delay * (2 ** request.attempts))
+            self._postpone(request, delay, error)
+            logger.info(f"Fronta: dočasná chyba '{error}', další pokus za {delay:.0f}s")
+            return delay
+
+        self._remove(request)
+        try:
+            self.on_result(request, result, error)
+        except Exception as e:
+            logger.error(f"Chyba při doručení výsledku z fronty: {e}", exc_info=True)
+        return 0.0
@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+"""
+Sampling profiler pro aplikaci Transka
+Za běhu periodicky vzorkuje stacky všech vláken (Tk, hotkey hook, workery)
+přes sys._current_frames() - bez restartu pod speciálním profilerem
+"""
+from __future__ import annotations
+
+import sys
+import threading
+import time
+import logging
+from collections import Counter
+from pathlib import Path
+from types import CodeType
+from typing import Callable, Dict, List, Optional
+
+# Logging setup
+logger = logging.getLogger(__name__)
+
+# Max hloubka stacku ve vzorku (hlubší rámce se oříznou u kořene)
+MAX_STACK_DEPTH = 128
+
+
+class SamplingProfiler:
+    """
+    Nízkorežijní sampling profiler všech vláken
+
+    Samostatné vlákno každých interval sekund přečte aktuální rámce všech
+    vláken a započítá jejich stack. Jde o wall-clock profil - čekající
+    vlákna (mainloop, hook) se objeví ve svém čekacím volání. Výstupem je
+    soubor collapsed stacků (flamegraph.pl, speedscope, inferno) a textový
+    souhrn s top-N funkcemi.
+    """
+
+    def __init__(
+        self,
+        output_dir: Path,
+        interval: float = 0.005,
+        top_n: int = 25,
+        on_finished: Optional[Callable[[Optional[Path]], None]] = None
+    ):
+        """
+        Inicializuje SamplingProfiler
+
+        Args:
+            output_dir: Adresář pro výstupní soubory
+            interval: Interval vzorkování v sekundách
+            top_n: Počet funkcí v souhrnu
+            on_finished: Callback po zapsání výsledku (cesta k souhrnu, None = chyba)
+                - volá se z vlákna profileru
+        """
+        self.output_dir = Path(output_dir)
+        self.interval = max(0.001, interval)
+        self.top_n = top_n
+        self.on_finished = on_finished
+
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._stacks: Counter = Counter()
+        self._samples = 0
+        self._started_at = 0.0
+        self._labels: Dict[CodeType, str] = {}
+
+    @property
+    def running(self) -> bool:
+        """Probíhá profilování"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, duration: float = 30.0) -> None:
+        """
+        Spustí profilování
+
+        Args:
+            duration: Po kolika sekundách se profilování samo ukončí (0 = až stop())
+        """
+        if self.running:
+            return
+        self._stop_event.clear()
+        self._stacks = Counter()
+        self._samples = 0
+        self._labels = {}
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(duration,),
+            name="sampling-profiler",
+            daemon=True
+        )
+        self._thread.start()
+        logger.info(f"Profilování spuštěno (interval {self.interval * 1000:.1f} ms, max {duration:.0f} s)")
+
+    def stop(self) -> None:
+        """Ukončí profilování - výsledek zapíše vlákno profileru (neblokuje)"""
+        self._stop_event.set()
+
+    # --- Vzorkování ---
+
+    def _run(self, duration: float) -> None:
+        """Smyčka vzorkování, po ukončení zapíše výsledky"""
+        own_id = threading.get_ident()
+        self._started_at = time.time()
+        deadline = time.perf_counter() + duration if duration > 0 else None
+
+        while not self._stop_event.wait(self.interval):
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+            self._sample(own_id)
+
+        path = None
+        try:
+            path = self._write_results()
+        except OSError as e:
+            logger.error(f"Nelze zapsat výsledek profilování: {e}")
+        if self.on_finished is not None:
+            try:
+                self.on_finished(path)
+            except Exception as e:
+                logger.error(f"Chyba v callbacku profileru: {e}", exc_info=True)
+
+    def _sample(self, own_id: int) -> None:
+        """Započítá aktuální stack každého vlákna"""
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own_id:
+                continue
+            frames: List[str] = []
+            while frame is not None and len(frames) < MAX_STACK_DEPTH:
+                code = frame.f_code
+                label = self._labels.get(code)
+                if label is None:
+                    # Popisek rámce se skládá jen jednou pro každý code objekt
+                    label = self._labels[code] = f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+                frames.append(label)
+                frame = frame.f_back
+            frames.append(names.get(thread_id, f"thread-{thread_id}"))
+            frames.reverse()
+            self._stacks[tuple(frames)] += 1
+        self._samples += 1
+
+    # --- Výstup ---
+
+    def _write_results(self) -> Path:
+        """Zapíše collapsed stacky a souhrn, vrátí cestu k souhrnu"""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(self._started_at))
+        folded_path = self.output_dir / f"profile-{stamp}.folded"
+        summary_path = self.output_dir / f"profile-{stamp}-top.txt"
+
+        with folded_path.open("w", encoding="utf-8") as f:
+            for stack, count in self._stacks.most_common():
+                # Středník je oddělovač rámců - v názvech se nahradí
+                f.write(";".join(frame.replace(";", ",") for frame in stack) + f" {count}\n")
+
+        summary_path.write_text(self._format_summary(folded_path), encoding="utf-8")
+        logger.info(f"Profil uložen: {folded_path} ({self._samples} vzorků)")
+        return summary_path
+
+    def _format_summary(self, folded_path: Path) -> str:
+        """Textový souhrn - vlákna, top funkce podle vlastního a celkového času"""
+        duration = time.time() - self._started_at
+        per_thread: Counter = Counter()
+        self_counts: Counter = Counter()
+        total_counts: Counter = Counter()
+        for stack, count in self._stacks.items():
+            per_thread[stack[0]] += count
+            if len(stack) > 1:
+                self_counts[stack[-1]] += count
+            # Rekurzivní funkce se do celkového času započítá jen jednou
+            for frame in set(stack[1:]):
+                total_counts[frame] += count
+
+        lines = [
+            f"Profil Transka - {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(self._started_at))}",
+            f"Délka {duration:.1f} s, {self._samples} vzorků po {self.interval * 1000:.1f} ms (wall-clock)",
+            f"Collapsed stacky: {folded_path.name}",
+            "",
+            "Vzorky podle vláken:",
+        ]
+        lines += [f"  {count:>8}  {name}" for name, count in per_thread.most_common()]
+        total = sum(per_thread.values())
+        lines += self._format_top("Top funkce (vlastní čas):", self_counts, total)
+        lines += self._format_top("Top funkce (včetně volaných):", total_counts, total)
+        return "\n".join(lines) + "\n"
+
+    def _format_top(self, title: str, counts: Counter, total: int) -> List[str]:
+        """Řádky top-N tabulky s procenty ze všech vzorků vláken"""
+        total = total or 1
+        lines = ["", title]
+        for frame, count in counts.most_common(self.top_n):
+            lines.append(f"  {count:>8}  {count / total * 100:5.1f} %  {frame}")
+        return lines
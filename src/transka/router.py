@@ -0,0 +1,325 @@
+# -*- coding: utf-8 -*-
+"""
+Router překladačů pro aplikaci Transka
+Vybírá backend pro každý požadavek podle živých statistik latence a chyb
+(EWMA) v jednotlivých velikostních třídách vstupu
+"""
+from __future__ import annotations
+
+import json
+import random
+import threading
+import time
+import logging
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from transka.base_translator import BaseTranslator, UsageInfo, is_transient_error
+from transka.config import atomic_write_text
+
+# Logging setup
+logger = logging.getLogger(__name__)
+
+# Cíle výběru backendu
+OBJECTIVE_LATENCY = "latency"  # Nejnižší očekávaná latence
+OBJECTIVE_QUALITY = "quality"  # Nejvyšší kvalita v rámci latency budgetu
+
+# Kolik vzorků potřebuje backend v třídě, než se mu věří (do té doby se zkouší přednostně)
+MIN_SAMPLES = 3
+
+# Po kolika rozhodnutích se statistiky uloží na disk
+SAVE_EVERY = 20
+
+
+@dataclass
+class RouteStats:
+    """EWMA statistika backendu v jedné velikostní třídě"""
+    latency: float = 0.0  # EWMA latence požadavků, chyba se počítá jako penalizace (s)
+    error_rate: float = 0.0  # EWMA podílu chyb
+    samples: int = 0
+    chosen: int = 0  # Kolikrát router backend vybral
+
+    def observe(self, alpha: float, latency: float, error: bool) -> None:
+        """Započítá výsledek požadavku (u chyby už penalizovanou latenci)"""
+        first = self.samples == 0
+        self.samples += 1
+        self.error_rate = float(error) if first else (1 - alpha) * self.error_rate + alpha * float(error)
+        self.latency = latency if first else (1 - alpha) * self.latency + alpha * latency
+
+    @property
+    def expected_latency(self) -> float:
+        """Očekávaná latence včetně opakování po chybě (geometrická řada)"""
+        return self.latency / max(0.05, 1.0 - self.error_rate)
+
+
+class RoutingTranslator(BaseTranslator):
+    """
+    Překladač "auto" - směruje požadavky mezi více backendů
+
+    Vstup se podle délky zařadí do velikostní třídy (např. short/medium/long).
+    Pro každou dvojici (backend, třída) se drží EWMA latence a chybovosti.
+    Cíl třídy rozhoduje o výběru:
+
+    - latency: backend s nejnižší očekávanou latencí
+    - quality: backend s nejvyšším skóre kvality, jehož očekávaná latence
+      se vejde do latency budgetu (jinak nejrychlejší)
+
+    Backend bez dostatku vzorků se zkouší přednostně (optimistický start),
+    malá část požadavků jde na náhodný jiný backend, aby statistiky
+    nezastaraly. Při dočasné chybě se zkusí další backend v pořadí.
+    """
+
+    def __init__(
+        self,
+        backends: Dict[str, BaseTranslator],
+        size_buckets: Optional[Dict[str, int]] = None,
+        objectives: Optional[Dict[str, str]] = None,
+        quality: Optional[Dict[str, float]] = None,
+        latency_budget: float = 5.0,
+        alpha: float = 0.2,
+        explore: float = 0.05,
+        stats_path: Optional[Path] = None,
+        clock: Callable[[], float] = time.perf_counter
+    ):
+        """
+        Inicializuje RoutingTranslator
+
+        Args:
+            backends: Backendy podle názvu (první = primární pro usage a jazyky)
+            size_buckets: Třídy {název: max znaků} vzestupně, 0 = bez horní meze
+            objectives: Cíl pro každou třídu ("latency" / "quality")
+            quality: Skóre kvality backendů (vyšší = lepší)
+            latency_budget: Max očekávaná latence pro cíl "quality" (s)
+            alpha: Váha nového vzorku v EWMA
+            explore: Podíl požadavků na náhodný jiný backend
+            stats_path: Soubor pro uložení statistik (teplý start po restartu)
+            clock: Zdroj času (pro testy a benchmarky)
+        """
+        if not backends:
+            raise ValueError("Router potřebuje alespoň jeden backend")
+        self.backends = dict(backends)
+        self.size_buckets = dict(size_buckets or {"short": 300, "medium": 3000, "long": 0})
+        self.objectives = dict(objectives or {})
+        self.quality = dict(quality or {})
+        self.latency_budget = latency_budget
+        self.alpha = alpha
+        self.explore = explore
+        self.stats_path = Path(stats_path) if stats_path else None
+        self.clock = clock
+
+        self._lock = threading.Lock()
+        self._stats: Dict[Tuple[str, str], RouteStats] = {}
+        self._decisions = 0
+        self._load_stats()
+
+    @classmethod
+    def from_config(cls, config) -> "RoutingTranslator":
+        """Vytvoří router a jeho backendy z konfigurace (router_*)"""
+        from transka.backends import create_backend
+
+        backends = {}
+        for name in config.router_backends:
+            if name == "auto" or name in backends:
+                continue
+            backends[name] = create_backend(name, config)
+        return cls(
+            backends,
+            size_buckets=config.router_size_buckets,
+            objectives=config.router_objectives,
+            quality=config.router_quality,
+            latency_budget=config.router_latency_budget,
+            alpha=config.router_alpha,
+            explore=config.router_explore,
+            stats_path=config.router_stats_file
+        )
+
+    # --- Statistiky ---
+
+    def _load_stats(self) -> None:
+        """Načte uložené statistiky (neznámé backendy/třídy se ignorují)"""
+        if self.stats_path is None or not self.stats_path.exists():
+            return
+        try:
+            data = json.loads(self.stats_path.read_text(encoding="utf-8"))
+            for item in data:
+                key = (item["backend"], item["bucket"])
+                if key[0] in self.backends and key[1] in self.size_buckets:
+                    self._stats[key] = RouteStats(
+                        latency=item["latency"],
+                        error_rate=item["error_rate"],
+                        samples=item["samples"],
+                        chosen=item["chosen"]
+                    )
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Nelze načíst statistiky routeru {self.stats_path}: {e}")
+
+    def save_stats(self) -> None:
+        """Uloží statistiky na disk"""
+        if self.stats_path is None:
+            return
+        with self._lock:
+            data = [
+                {"backend": backend, "bucket": bucket, **asdict(stats)}
+                for (backend, bucket), stats in sorted(self._stats.items())
+            ]
+        try:
+            atomic_write_text(self.stats_path, json.dumps(data, indent=2))
+        except OSError as e:
+            logger.error(f"Nelze uložit statistiky routeru: {e}")
+
+    def get_stats(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Vrátí statistiky rozhodování pro ladění
+
+        Returns:
+            {třída: [{backend, objective, samples, chosen, latency_ms,
+            expected_ms, error_rate, quality}]} - backendy v pořadí, v jakém
+            by je router právě zkoušel
+        """
+        result = {}
+        for bucket in self.size_buckets:
+            rows = []
+            with self._lock:
+                ranked = self._rank(bucket)
+                for name in ranked:
+                    stats = self._stats.get((name, bucket), RouteStats())
+                    rows.append({
+                        "backend": name,
+                        "objective": self._objective(bucket),
+                        "samples": stats.samples,
+                        "chosen": stats.chosen,
+                        "latency_ms": round(stats.latency * 1000, 1),
+                        "expected_ms": round(stats.expected_latency * 1000, 1),
+                        "error_rate": round(stats.error_rate, 3),
+                        "quality": self.quality.get(name, 0.0),
+                    })
+            result[bucket] = rows
+        return result
+
+    # --- Rozhodování ---
+
+    def _bucket(self, chars: int) -> str:
+        """Velikostní třída podle počtu znaků"""
+        for name, limit in self.size_buckets.items():
+            if not limit or chars <= limit:
+                return name
+        return name
+
+    def _objective(self, bucket: str) -> str:
+        """Cíl třídy (výchozí latence)"""
+        return self.objectives.get(bucket, OBJECTIVE_LATENCY)
+
+    def _rank(self, bucket: str) -> List[str]:
+        """Seřadí nakonfigurované backendy od nejvhodnějšího (volá se pod zámkem)"""
+        candidates = [name for name, backend in self.backends.items() if backend.is_configured()]
+        if not candidates:
+            return list(self.backends)
+
+        def stats(name: str) -> RouteStats:
+            return self._stats.get((name, bucket), RouteStats())
+
+        # Málo vzorků = zatím neznámý backend, má přednost (optimistický start)
+        unknown = [name for name in candidates if stats(name).samples < MIN_SAMPLES]
+        known = [name for name in candidates if stats(name).samples >= MIN_SAMPLES]
+
+        if self._objective(bucket) == OBJECTIVE_QUALITY:
+            def key(name: str):
+                within = stats(name).expected_latency <= self.latency_budget
+                return (not within, -self.quality.get(name, 0.0), stats(name).expected_latency)
+            unknown.sort(key=lambda name: -self.quality.get(name, 0.0))
+        else:
+            def key(name: str):
+                return stats(name).expected_latency
+
+        known.sort(key=key)
+        return unknown + known
+
+    def _choose(self, chars: int) -> Tuple[str, List[str]]:
+        """Vybere třídu a pořadí backendů pro požadavek"""
+        bucket = self._bucket(chars)
+        with self._lock:
+            ranked = self._rank(bucket)
+            if len(ranked) > 1 and random.random() < self.explore:
+                # Průzkum - občas jiný backend, aby jeho statistiky nezastaraly
+                explored = random.choice(ranked[1:])
+                ranked.remove(explored)
+                ranked.insert(0, explored)
+            self._decisions += 1
+            save = self._decisions % SAVE_EVERY == 0
+        if save:
+            self.save_stats()
+        return bucket, ranked
+
+    def _record(self, name: str, bucket: str, latency: float, error: Optional[str], chosen: bool) -> None:
+        """Započítá výsledek do EWMA statistik"""
+        if error:
+            # Chyba stojí aspoň latency budget - rychle selhávající backend (např.
+            # neplatný klíč) by jinak měl nulovou latenci a dostával vše
+            latency = max(latency, self.latency_budget)
+        with self._lock:
+            stats = self._stats.setdefault((name, bucket), RouteStats())
+            stats.observe(self.alpha, latency, bool(error))
+            if chosen:
+                stats.chosen += 1
+
+    def _route(self, chars: int, call: Callable[[BaseTranslator], Tuple[Any, Optional[str]]]):
+        """Provede požadavek na nejvhodnějším backendu, při dočasné chybě na dalším"""
+        bucket, ranked = self._choose(chars)
+        result: Tuple[Any, Optional[str]] = (None, "Žádný překladač není nakonfigurován")
+        for index, name in enumerate(ranked):
+            start = self.clock()
+            result = call(self.backends[name])
+            self._record(name, bucket, self.clock() - start, result[1], index == 0)
+            if not is_transient_error(result[1]):
+                break
+            logger.info(f"Router: {name} selhal ({result[1]}), zkouším další backend")
+        return result
+
+    # --- BaseTranslator ---
+
+    def is_configured(self) -> bool:
+        """Router je použitelný, pokud je nakonfigurován aspoň jeden backend"""
+        return any(backend.is_configured() for backend in self.backends.values())
+
+    def translate(
+        self,
+        text: str,
+        source_lang: str = "CS",
+        target_lang: str = "EN-US"
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """Přeloží text na backendu vybraném podle délky textu a statistik"""
+        return self._route(len(text), lambda backend: backend.translate(text, source_lang, target_lang))
+
+    def translate_batch(
+        self,
+        texts: List[str],
+        source_lang: str = "CS",
+        target_lang: str = "EN-US"
+    ) -> Tuple[Optional[List[str]], Optional[str]]:
+        """Dávka jde celá na jeden backend (třída podle součtu znaků)"""
+        chars = sum(len(text) for text in texts)
+        return self._route(chars, lambda backend: backend.translate_batch(texts, source_lang, target_lang))
+
+    @property
+    def primary(self) -> BaseTranslator:
+        """Primární backend (první v seznamu) - kvóta a seznam jazyků"""
+        return next(iter(self.backends.values()))
+
+    def get_usage(self) -> Tuple[Optional[UsageInfo], Optional[str]]:
+        """Spotřeba primárního backendu (kvóta, ke které se vztahuje rozpočet)"""
+        return self.primary.get_usage()
+
+    def get_available_languages(self) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]:
+        """Jazyky primárního backendu"""
+        return self.primary.get_available_languages()
+
+    def update_api_key(self, api_key: str) -> None:
+        """Předá nový klíč všem backendům"""
+        for backend in self.backends.values():
+            backend.update_api_key(api_key)
+
+    @property
+    def service_name(self) -> str:
+        """Název služby"""
+        return f"Auto ({', '.join(self.backends)})"
@@ -7,6 +7,7 @@ from tkinter import ttk, messagebox
 import keyboard
 
 from transka.config import Config
+from transka.backends import available_backends
 from transka.deepl_translator import DeepLTranslator
 from transka.base_translator import BaseTranslator
 from transka.theme import COLORS
@@ -48,7 +49,7 @@ class SettingsWindow:
         self.translator_service_combo = ttk.Combobox(
             main_frame,
             textvariable=self.translator_service_var,
-            values=["deepl", "google"],
+            values=available_backends(),
             state="readonly",
             width=47
         )
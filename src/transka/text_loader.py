@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+"""
+Text Loader pro aplikaci Transka
+Postupné vkládání velkých textů do Tk Text widgetů po dávkách přes after_idle,
+aby mainloop mezi dávkami stihl překreslit okno a zpracovat vstup
+"""
+from __future__ import annotations
+
+import time
+import logging
+from typing import Callable, Optional
+
+import tkinter as tk
+
+# Logging setup
+logger = logging.getLogger(__name__)
+
+# Mark, za který se vkládají další dávky (pravá gravitace = posouvá se s textem)
+LOAD_MARK = "transka_load"
+
+
+class ChunkedTextLoader:
+    """
+    Neblokující plnění Text widgetu
+
+    Malé texty (do chunk_size) se vloží hned jedním insertem jako dřív.
+    Větší texty se vkládají po dávkách naplánovaných přes after_idle -
+    Tk spouští idle callbacky přidané během idle zpracování až v dalším
+    cyklu, takže mezi dávkami proběhnou události okna i klávesnice.
+
+    Texty delší než preview_limit se do widgetu vloží jen jako náhled;
+    celý text drží loader a vrací ho get_text(), dokud uživatel náhled
+    neupraví (sleduje se přes edit_modified flag widgetu).
+    """
+
+    def __init__(
+        self,
+        widget: tk.Text,
+        chunk_size: int = 16384,
+        preview_limit: int = 0,
+        on_done: Optional[Callable[[float], None]] = None
+    ):
+        """
+        Inicializuje ChunkedTextLoader
+
+        Args:
+            widget: Text / ScrolledText widget
+            chunk_size: Počet znaků vložených v jedné dávce
+            preview_limit: Max znaků zobrazených ve widgetu (0 = vždy celý text)
+            on_done: Volitelný callback po dokončení vkládání (doba v sekundách)
+        """
+        self.widget = widget
+        self.chunk_size = max(1024, chunk_size)
+        self.preview_limit = preview_limit
+        self.on_done = on_done
+
+        self._pending: Optional[str] = None
+        self._offset = 0
+        self._after_id: Optional[str] = None
+        self._started_at = 0.0
+        self._full_text: Optional[str] = None
+
+    # --- Veřejné API ---
+
+    def load(self, text: str) -> None:
+        """
+        Nahradí obsah widgetu textem (velké texty po dávkách / jako náhled)
+
+        Args:
+            text: Nový obsah widgetu
+        """
+        self.cancel()
+        self._full_text = None
+
+        display = text
+        if self.preview_limit and len(text) > self.preview_limit:
+            self._full_text = text
+            display = text[:self.preview_limit] + (
+                f"\n\n… [náhled: zobrazeno {self.preview_limit:,} z {len(text):,} znaků,"
+                f" pro překlad a kopírování se použije celý text]"
+            )
+
+        with self._writable():
+            self.widget.delete("1.0", tk.END)
+        # Smazání i vkládané dávky nastavují modified flag - ten má značit jen úpravy uživatele
+        self.widget.edit_modified(False)
+        self._start(display, "1.0")
+
+    def insert(self, text: str, index: str = tk.INSERT) -> None:
+        """
+        Vloží text na pozici (velké texty po dávkách, bez náhledu)
+
+        Args:
+            text: Vkládaný text
+            index: Pozice ve widgetu
+        """
+        self.cancel()
+        self._start(text, index)
+
+    def get_text(self) -> str:
+        """
+        Vrátí celý obsah včetně části, která ještě není ve widgetu
+
+        Returns:
+            Celý text (bez koncového newline, který přidává Tk)
+        """
+        if self._full_text is not None and not self.widget.edit_modified():
+            return self._full_text
+        if self._full_text is not None:
+            # Uživatel upravil náhled - platí to, co je ve widgetu
+            self._full_text = None
+
+        content = self.widget.get("1.0", "end-1c")
+        if self._pending is not None:
+            content += self._pending[self._offset:]
+        return content
+
+    def clear(self) -> None:
+        """Zruší rozpracované vkládání a vymaže widget"""
+        self.cancel()
+        self._full_text = None
+        with self._writable():
+            self.widget.delete("1.0", tk.END)
+
+    def cancel(self) -> None:
+        """Zruší rozpracované vkládání (již vložená část zůstává)"""
+        if self._after_id is not None:
+            try:
+                self.widget.after_cancel(self._after_id)
+            except tk.TclError:
+                pass
+            self._after_id = None
+        self._pending = None
+        self._offset = 0
+
+    @property
+    def loading(self) -> bool:
+        """True pokud vkládání ještě probíhá"""
+        return self._pending is not None
+
+    def bind_paste(self, paste: Callable[[], str]) -> None:
+        """
+        Přesměruje vkládání velkých textů ze schránky (<<Paste>>) přes loader
+
+        Args:
+            paste: Funkce vracející text schránky
+        """
+        def on_paste(event) -> Optional[str]:
+            text = paste()
+            if len(text) <= self.chunk_size:
+                return None  # Malý text - výchozí Tk binding
+
+            try:
+                self.widget.delete(tk.SEL_FIRST, tk.SEL_LAST)
+            except tk.TclError:
+                pass  # Žádný výběr
+
+            if not self.widget.get("1.0", "end-1c").strip():
+                self.load(text)
+            else:
+                self.insert(text, tk.INSERT)
+            return "break"
+
+        self.widget.bind("<<Paste>>", on_paste)
+
+    # --- Interní ---
+
+    def _start(self, text: str, index: str) -> None:
+        """Vloží první dávku a zbytek naplánuje"""
+        self._started_at = time.perf_counter()
+
+        if len(text) <= self.chunk_size:
+            with self._writable():
+                self.widget.insert(index, text)
+            self._finish()
+            return
+
+        self._pending = text
+        self._offset = 0
+        self.widget.mark_set(LOAD_MARK, index)
+        self.widget.mark_gravity(LOAD_MARK, tk.RIGHT)
+        self._insert_chunk()
+
+    def _insert_chunk(self) -> None:
+        """Vloží jednu dávku a naplánuje další (after_idle)"""
+        self._after_id = None
+        text = self._pending
+        if text is None:
+            return
+
+        end = min(self._offset + self.chunk_size, len(text))
+        try:
+            user_modified = self.widget.edit_modified()
+            with self._writable():
+                self.widget.insert(LOAD_MARK, text[self._offset:end])
+            if not user_modified:
+                # Vlastní vložení není úprava náhledu (get_text by zahodil celý text)
+                self.widget.edit_modified(False)
+        except tk.TclError as e:
+            # Widget zničen během vkládání (zavření aplikace)
+            logger.debug(f"Vkládání textu přerušeno: {e}")
+            self._pending = None
+            return
+        self._offset = end
+
+        if self._offset < len(text):
+            self._after_id = self.widget.after_idle(self._insert_chunk)
+        else:
+            self._pending = None
+            self._offset = 0
+            self.widget.mark_unset(LOAD_MARK)
+            self._finish()
+
+    def _finish(self) -> None:
+        """Reset modified flagu (detekce úprav náhledu) + callback"""
+        self.widget.edit_modified(False)
+        if self.on_done is not None:
+            self.on_done(time.perf_counter() - self._started_at)
+
+    def _writable(self) -> "_WritableState":
+        """Context manager - dočasně povolí zápis do DISABLED widgetu"""
+        return _WritableState(self.widget)
+
+
+class _WritableState:
+    """Dočasně přepne widget do stavu NORMAL a pak vrátí původní stav"""
+
+    __slots__ = ("widget", "state")
+
+    def __init__(self, widget: tk.Text):
+        self.widget = widget
+        self.state = None
+
+    def __enter__(self) -> None:
+        self.state = str(self.widget.cget("state"))
+        if self.state != tk.NORMAL:
+            self.widget.config(state=tk.NORMAL)
+
+    def __exit__(self, *exc_info) -> None:
+        if self.state != tk.NORMAL:
+            self.widget.config(state=self.state)
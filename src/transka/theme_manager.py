@@ -182,6 +182,26 @@ class ThemeManager:
             ]
         )
 
+        # Treeview (historie překladů)
+        style.configure('Treeview',
+            background=COLORS["bg_darker"],
+            fieldbackground=COLORS["bg_darker"],
+            foreground=COLORS["text_primary"],
+            bordercolor=COLORS["border"],
+            font=self.sans_font,
+            rowheight=24
+        )
+        style.map('Treeview',
+            background=[('selected', COLORS["accent_cyan"])],
+            foreground=[('selected', COLORS["bg_dark"])]
+        )
+        style.configure('Treeview.Heading',
+            background=COLORS["bg_button"],
+            foreground=COLORS["accent_cyan"],
+            font=self.sans_font_bold,
+            relief=tk.FLAT
+        )
+
     def get_fonts(self) -> Dict[str, Any]:
         """
         Vrátí slovník s vytvořenými fonty
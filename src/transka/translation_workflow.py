@@ -8,18 +8,32 @@ from __future__ import annotations
 import tkinter as tk
 from tkinter import messagebox, scrolledtext
 import threading
-import pyperclip
-from typing import Optional, Callable
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Callable
 import ctypes
 from enum import IntEnum, auto
 import logging
 
-from transka.base_translator import BaseTranslator
+from transka.base_translator import BaseTranslator, is_transient_error
+from transka.metrics import Metrics
+from transka.middleware import take_cache_outcome
+from transka.logging_setup import log_translation
+from transka.dispatcher import MainThreadDispatcher
+from transka.clipboard import Clipboard
+from transka.text_loader import ChunkedTextLoader
+from transka.history import TranslationHistory
+from transka.incremental import IncrementalTranslator
+from transka.budget import BudgetScheduler, INTERACTIVE, BATCH
+from transka.offline_queue import OfflineQueue
 from transka.theme import COLORS
 
 # Logging setup
 logger = logging.getLogger(__name__)
 
+# Max počet souběžných překladů do dalších cílových jazyků
+MAX_FANOUT_WORKERS = 4
+
 
 class WorkflowState(IntEnum):
     """Stavy workflow pro překlad"""
@@ -44,7 +58,16 @@ class TranslationWorkflow:
         input_widget: scrolledtext.ScrolledText,
         output_widget: scrolledtext.ScrolledText,
         status_callback: Callable[[str, str], None],
-        usage_update_callback: Callable[[], None]
+        usage_update_callback: Callable[[], None],
+        metrics: Optional[Metrics] = None,
+        dispatcher: Optional[MainThreadDispatcher] = None,
+        clipboard: Optional[Clipboard] = None,
+        chunk_size: int = 16384,
+        preview_limit: int = 0,
+        history: Optional[TranslationHistory] = None,
+        incremental: bool = True,
+        budget: Optional[BudgetScheduler] = None,
+        offline_queue: Optional[OfflineQueue] = None
     ):
         """
         Inicializuje TranslationWorkflow
@@ -57,6 +80,15 @@ class TranslationWorkflow:
             output_widget: Output ScrolledText widget
             status_callback: Callback pro update status labelu (text, color)
             usage_update_callback: Callback pro update usage statistik
+            metrics: Volitelné metriky (None = měření vypnuto)
+            dispatcher: Předávání výsledků do hlavního vlákna (None = root.after)
+            clipboard: Schránka (None = Tk schránka přes output widget)
+            chunk_size: Velikost dávky při postupném vkládání velkých textů
+            preview_limit: Nad tuto délku se ve widgetu zobrazí jen náhled (0 = vypnuto)
+            history: Historie překladů (None = nezaznamenává se)
+            incremental: Po úpravě vstupu překládat jen změněné odstavce
+            budget: Rozpočet znaků (None = bez limitů a evidence)
+            offline_queue: Fronta pro překlady, které selhaly na dočasné chybě
         """
         self.translator = translator
         self.source_lang = source_lang
@@ -65,6 +97,30 @@ class TranslationWorkflow:
         self.output_widget = output_widget
         self.status_callback = status_callback
         self.usage_update_callback = usage_update_callback
+        self.metrics = metrics or Metrics(enabled=False)
+        self.dispatcher = dispatcher
+        self.clipboard = clipboard or Clipboard(output_widget, metrics=self.metrics)
+        self.history = history
+        self.incremental: Optional[IncrementalTranslator] = IncrementalTranslator() if incremental else None
+        self.budget = budget
+        self.offline_queue = offline_queue
+
+        # Neblokující plnění textových polí (velké texty po dávkách)
+        self.chunk_size = chunk_size
+        self.preview_limit = preview_limit
+        self.input_loader = ChunkedTextLoader(input_widget, chunk_size, preview_limit)
+        self.output_loader = ChunkedTextLoader(
+            output_widget,
+            chunk_size,
+            preview_limit,
+            on_done=lambda seconds: self.metrics.observe("render", seconds, self._backend_label())
+        )
+
+        # Multi-target: další cílové jazyky → loader jejich output panelu
+        self.extra_loaders: Dict[str, ChunkedTextLoader] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Generace překladu - opožděné výsledky starého překladu se zahodí
+        self._generation = 0
 
         # State pro workflow
         self.state: WorkflowState = WorkflowState.HIDDEN
@@ -73,12 +129,34 @@ class TranslationWorkflow:
     def update_translator(self, translator: BaseTranslator) -> None:
         """Aktualizuje překladač (při změně v Settings)"""
         self.translator = translator
+        if self.incremental is not None:
+            self.incremental.reset()
 
     def update_languages(self, source_lang: str, target_lang: str) -> None:
         """Aktualizuje jazyky (při změně v Settings)"""
         self.source_lang = source_lang
         self.target_lang = target_lang
 
+    def set_extra_targets(self, output_widgets: Dict[str, scrolledtext.ScrolledText]) -> None:
+        """
+        Nastaví další cílové jazyky (multi-target) a jejich output panely
+
+        Args:
+            output_widgets: Dict jazyk → output widget (prázdný = multi-target vypnut)
+        """
+        self._generation += 1
+        for loader in self.extra_loaders.values():
+            loader.cancel()
+        self.extra_loaders = {
+            lang: ChunkedTextLoader(widget, self.chunk_size, self.preview_limit)
+            for lang, widget in output_widgets.items()
+        }
+        if self.extra_loaders and self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=MAX_FANOUT_WORKERS,
+                thread_name_prefix="translate-fanout"
+            )
+
     def save_previous_window(self) -> None:
         """Uloží předchozí aktivní okno pro pozdější restore fokus"""
         try:
@@ -100,7 +178,8 @@ class TranslationWorkflow:
         Přeloží text a zobrazí v output poli (NEUZAVŘE okno, NEKOPÍRUJE)
         Použito ve State 1 → State 2
         """
-        input_text = self.input_widget.get("1.0", tk.END).strip()
+        with self.metrics.span("input_read", self._backend_label()):
+            input_text = self.input_loader.get_text().strip()
 
         if not input_text:
             return
@@ -110,22 +189,14 @@ class TranslationWorkflow:
             return
 
         self.status_callback("Překládám...", COLORS["status_working"])
-
-        def translate_thread():
-            result, error = self.translator.translate(
-                input_text,
-                self.source_lang,
-                self.target_lang
-            )
-            root.after(0, lambda: self._handle_translation_result(result, error))
-
-        threading.Thread(target=translate_thread, daemon=True).start()
+        self._start_translation(root, input_text)
 
     def translate_full(self, root: tk.Tk):
         """
         Kompletní překlad s GUI update (tlačítko Přeložit / Ctrl+Enter)
         """
-        input_text = self.input_widget.get("1.0", tk.END).strip()
+        with self.metrics.span("input_read", self._backend_label()):
+            input_text = self.input_loader.get_text().strip()
 
         if not input_text:
             self.status_callback("Prázdný text", COLORS["status_warning"])
@@ -135,34 +206,190 @@ class TranslationWorkflow:
             messagebox.showerror("Chyba", "Překladač není nakonfigurován. Nastavte API klíč v nastavení.")
             return
 
+        # Status se překreslí v dalším průchodu mainloopu (bez re-entrantního root.update)
         self.status_callback("Překládám...", COLORS["status_working"])
-        root.update()
+        self._start_translation(root, input_text)
+
+    def _backend_label(self) -> str:
+        """Label backendu pro metriky"""
+        return self.translator.service_name
+
+    def _start_translation(self, root: tk.Tk, input_text: str) -> None:
+        """Spustí překlad v separátním vlákně a výsledek předá do hlavního vlákna"""
+        translator = self.translator
+        source_lang, target_lang = self.source_lang, self.target_lang
+        backend = self._backend_label()
+        queued_at = time.perf_counter()
+        # Rezervace před fan-outem (přednost hlavního jazyka) - souběžné jazyky
+        # a fronta pak nerozeberou stejný zbytek rozpočtu
+        decision = self.budget.reserve(INTERACTIVE, len(input_text)) if self.budget is not None else None
 
-        # Překlad v separátním vlákně
         def translate_thread():
-            result, error = self.translator.translate(
-                input_text,
-                self.source_lang,
-                self.target_lang
+            self.metrics.observe("queue_wait", time.perf_counter() - queued_at, backend)
+
+            saved_chars = 0
+            sent_chars = 0
+            cache_outcome = "none"
+            started = time.perf_counter()
+            with self.metrics.span("network", backend):
+                if decision is not None and not decision.allowed:
+                    result, error = None, decision.reason
+                elif self.incremental is not None:
+                    # Jen změněné odstavce oproti minulému překladu
+                    outcome = self.incremental.translate(translator, input_text, source_lang, target_lang)
+                    result, error = outcome.text, outcome.error
+                    sent_chars, saved_chars = outcome.sent_chars, outcome.saved_chars
+                    cache_outcome = outcome.cache_outcome
+                else:
+                    result, error = translator.translate(
+                        input_text,
+                        source_lang,
+                        target_lang
+                    )
+                    cache_outcome = take_cache_outcome(translator)
+                    # Zásah cache (např. po prefetchi) se na API neposlal - nezapočítává se znovu
+                    sent_chars = 0 if cache_outcome == "hit" else len(input_text)
+            log_translation(
+                time.perf_counter() - started, len(input_text), backend, cache_outcome, error,
+                kind=INTERACTIVE, target=target_lang, sent_chars=sent_chars
             )
+            self.metrics.inc("translations" if not error else "translation_errors", backend)
+            self.metrics.inc("characters", backend, sent_chars)
+            if saved_chars:
+                self.metrics.inc("characters_saved", backend, saved_chars)
+            if decision is not None and decision.allowed:
+                self.budget.commit(INTERACTIVE, len(input_text), sent_chars if not error else 0)
+
+            # Záznam do historie (jen zařazení do fronty zapisovacího vlákna)
+            if not error and self.history is not None:
+                self.history.record(input_text, result, source_lang, target_lang, backend)
 
             # Aktualizace GUI v hlavním vlákně
-            root.after(0, lambda: self._handle_translation_result(result, error))
+            handoff_at = time.perf_counter()
+
+            def deliver():
+                self.metrics.observe("handoff", time.perf_counter() - handoff_at, backend)
+                self._handle_translation_result(
+                    result,
+                    error,
+                    saved_chars,
+                    request=(input_text, source_lang, target_lang)
+                )
+
+            if self.dispatcher is not None:
+                self.dispatcher.post(deliver)
+            else:
+                root.after(0, deliver)
 
         threading.Thread(target=translate_thread, daemon=True).start()
 
-    def _handle_translation_result(self, result: Optional[str], error: Optional[str]):
+        if self.extra_loaders:
+            self._start_fanout(root, input_text, translator, source_lang, backend)
+
+    def _start_fanout(
+        self,
+        root: tk.Tk,
+        input_text: str,
+        translator: BaseTranslator,
+        source_lang: str,
+        backend: str
+    ) -> None:
+        """
+        Přeloží text souběžně do dalších cílových jazyků
+
+        Každý jazyk je samostatný požadavek v poolu vláken (DeepL i Google
+        přijímají jen jeden cílový jazyk na požadavek) - celková doba je tak
+        blízká jednomu překladu. Výsledky se zobrazují postupně, jak dorazí.
+        """
+        self._generation += 1
+        generation = self._generation
+        source_base = source_lang.split("-")[0].upper()
+
+        def translate_one(lang: str, loader: ChunkedTextLoader):
+            started = time.perf_counter()
+            with self.metrics.span("network", backend):
+                result, error = translator.translate(input_text, source_lang, lang)
+            cache_outcome = take_cache_outcome(translator)
+            sent_chars = 0 if cache_outcome == "hit" else len(input_text)
+            log_translation(
+                time.perf_counter() - started, len(input_text), backend, cache_outcome, error,
+                kind="fanout", target=lang, sent_chars=sent_chars
+            )
+            self.metrics.inc("translations" if not error else "translation_errors", backend)
+            self.metrics.inc("characters", backend, sent_chars)
+
+            if self.budget is not None:
+                self.budget.commit(INTERACTIVE, len(input_text), sent_chars if not error else 0)
+            if not error and self.history is not None:
+                self.history.record(input_text, result, source_lang, lang, backend)
+
+            # Dočasný výpadek - další jazyk se dopřeloží z offline fronty
+            queued = False
+            if error and is_transient_error(error) and self.offline_queue is not None:
+                queued = True
+                self.offline_queue.enqueue(input_text, source_lang, lang, BATCH)
+
+            def deliver():
+                # Mezitím spuštěný nový překlad / vymazání → starý výsledek zahodit
+                if generation != self._generation:
+                    return
+                if queued:
+                    loader.load("📥 Ve frontě - přeloží se po obnovení spojení")
+                else:
+                    loader.load(result if not error else f"Chyba: {error}")
+
+            if self.dispatcher is not None:
+                self.dispatcher.post(deliver)
+            else:
+                root.after(0, deliver)
+
+        for lang, loader in self.extra_loaders.items():
+            if lang.split("-")[0].upper() == source_base:
+                # Cílový jazyk je zároveň zdrojový (po swapu jazyků) - nepřekládá se
+                loader.clear()
+                continue
+            if self.budget is not None:
+                # Rezervace se sčítají s hlavním překladem i ostatními jazyky
+                decision = self.budget.reserve(INTERACTIVE, len(input_text))
+                if not decision.allowed:
+                    # Rozpočet vyčerpán - jazyk se nepřekládá, v panelu je důvod
+                    loader.load(f"Chyba: {decision.reason}")
+                    continue
+            loader.load("⏳ Překládám...")
+            self._executor.submit(translate_one, lang, loader)
+
+    def _handle_translation_result(
+        self,
+        result: Optional[str],
+        error: Optional[str],
+        saved_chars: int = 0,
+        request: Optional[tuple] = None
+    ):
         """Zpracuje výsledek překladu"""
-        if error:
+        if error and request is not None and self.offline_queue is not None and is_transient_error(error):
+            # Dočasná chyba - uživatel může požadavek uložit do offline fronty
+            self.status_callback(f"Chyba: {error}", COLORS["status_error"])
+            if messagebox.askyesno(
+                "Chyba překladu",
+                f"{error}\n\nZařadit text do offline fronty? Přeloží se automaticky "
+                f"po obnovení spojení a výsledek se zkopíruje do schránky."
+            ):
+                self.offline_queue.enqueue(*request, INTERACTIVE)
+                self.status_callback("📥 Zařazeno do offline fronty", COLORS["status_warning"])
+        elif error:
             self.status_callback(f"Chyba: {error}", COLORS["status_error"])
             messagebox.showerror("Chyba překladu", error)
         else:
-            self.output_widget.config(state=tk.NORMAL)
-            self.output_widget.delete("1.0", tk.END)
-            self.output_widget.insert("1.0", result)
-            self.output_widget.config(state=tk.DISABLED)
+            # Velký výsledek se vkládá po dávkách (metrika render po dokončení)
+            self.output_loader.load(result)
 
-            self.status_callback("Přeloženo", COLORS["status_ready"])
+            if saved_chars:
+                self.status_callback(
+                    f"Přeloženo (jen změny, ušetřeno {saved_chars:,} znaků)",
+                    COLORS["status_ready"]
+                )
+            else:
+                self.status_callback("Přeloženo", COLORS["status_ready"])
 
             # Aktualizace usage
             self.usage_update_callback()
@@ -173,29 +400,85 @@ class TranslationWorkflow:
         Použito ve State 2 → State 0
         """
         # Získání přeloženého textu z output pole
-        translated_text = self.output_widget.get("1.0", tk.END).strip()
+        translated_text = self.output_loader.get_text().strip()
 
         if translated_text:
             # Kopírování do schránky
-            pyperclip.copy(translated_text)
+            with self.metrics.span("clipboard", self._backend_label()):
+                self.clipboard.copy(translated_text)
 
             # Vymazání input pole
-            self.input_widget.delete("1.0", tk.END)
+            self.input_loader.clear()
 
             # Vymazání output pole
-            self.output_widget.config(state=tk.NORMAL)
-            self.output_widget.delete("1.0", tk.END)
-            self.output_widget.config(state=tk.DISABLED)
+            self.output_loader.clear()
+            self._clear_extra_outputs()
 
     def clear_all(self):
         """Vymaže textová pole"""
-        self.input_widget.delete("1.0", tk.END)
-        self.output_widget.config(state=tk.NORMAL)
-        self.output_widget.delete("1.0", tk.END)
-        self.output_widget.config(state=tk.DISABLED)
+        self.input_loader.clear()
+        self.output_loader.clear()
+        self._clear_extra_outputs()
         self.status_callback("Připraveno", COLORS["text_primary"])
         self.input_widget.focus()
 
+    def _clear_extra_outputs(self) -> None:
+        """Vymaže panely dalších jazyků a zahodí rozpracované výsledky"""
+        self._generation += 1
+        for loader in self.extra_loaders.values():
+            loader.clear()
+
+    def advance(
+        self,
+        root: tk.Tk,
+        show_window: Callable[[], None],
+        hide_window: Callable[[], None]
+    ) -> WorkflowState:
+        """
+        Provede jeden krok 3-step workflow podle aktuálního stavu (hlavní zkratka)
+
+        State 0 (HIDDEN) → zobraz okno → State 1 (SHOWN)
+        State 1 (SHOWN):
+          - JE přeložený text v output? → zkopíruj a zavři (skip překladu)
+          - NENÍ přeložený text? → přelož text → State 2 (TRANSLATED)
+        State 2 (TRANSLATED) → zkopíruj, vymaž, zavři, restore fokus → State 0 (HIDDEN)
+
+        Args:
+            root: Hlavní Tkinter okno
+            show_window: Zobrazí okno (krok 1)
+            hide_window: Skryje okno (po zkopírování překladu)
+
+        Returns:
+            Nový stav workflow
+        """
+        if self.state == WorkflowState.HIDDEN:
+            # Krok 1: Otevře okno
+            show_window()
+            self.set_state(WorkflowState.SHOWN)
+
+        elif self.state == WorkflowState.SHOWN:
+            # Smart detection: Pokud už existuje přeložený text (např. z Ctrl+Enter),
+            # přeskoč překlad a rovnou zkopíruj + zavři
+            if self.output_loader.get_text().strip():
+                self._copy_and_hide(hide_window)
+            else:
+                # Žádný přeložený text → normální překlad (krok 2)
+                self.translate_with_display(root)
+                self.set_state(WorkflowState.TRANSLATED)
+
+        elif self.state == WorkflowState.TRANSLATED:
+            # Krok 3: Zkopíruje, vymaže, zavře
+            self._copy_and_hide(hide_window)
+
+        return self.state
+
+    def _copy_and_hide(self, hide_window: Callable[[], None]) -> None:
+        """Zkopíruje překlad, vymaže pole, zavře okno a vrátí fokus → State 0"""
+        self.copy_translation_and_clear()
+        hide_window()
+        self.restore_previous_window()
+        self.reset_state()
+
     def get_state(self) -> WorkflowState:
         """Vrátí aktuální stav workflow"""
         return self.state
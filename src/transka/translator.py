@@ -3,9 +3,13 @@
 DeepL API komunikace a správa překladů
 """
 import deepl
+import logging
 from typing import Optional, Tuple
 from dataclasses import dataclass
 
+# Logging setup
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class UsageInfo:
@@ -53,7 +57,7 @@ class DeepLTranslator:
         try:
             self.translator = deepl.Translator(self.api_key)
         except Exception as e:
-            print(f"Chyba při inicializaci DeepL API: {e}")
+            logger.error(f"Chyba při inicializaci DeepL API: {e}")
             self.translator = None
 
     def is_configured(self) -> bool:
@@ -152,7 +156,7 @@ class DeepLTranslator:
             return source_list, target_list
 
         except Exception as e:
-            print(f"Chyba při získávání jazyků: {e}")
+            logger.error(f"Chyba při získávání jazyků: {e}")
             return [], []
 
     def update_api_key(self, api_key: str) -> None:
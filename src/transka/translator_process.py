@@ -0,0 +1,397 @@
+# -*- coding: utf-8 -*-
+"""
+Překladač v samostatném procesu
+HTTP klienti backendů, parsování JSON a router běží mimo interpreter s Tk
+a keyboard hookem (žádná GIL kontence); zaseknutý požadavek nezdrží
+ukončení aplikace - proces se jednoduše ukončí
+"""
+from __future__ import annotations
+
+import itertools
+import multiprocessing
+import threading
+import logging
+import logging.handlers
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeout
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from transka.base_translator import BaseTranslator, UsageInfo
+
+# Logging setup
+logger = logging.getLogger(__name__)
+
+# Max počet automatických restartů worker procesu
+MAX_RESTARTS = 5
+
+# Metody překladače, které lze volat přes pipe
+ALLOWED_METHODS = {
+    "translate",
+    "translate_batch",
+    "get_usage",
+    "get_available_languages",
+    "update_api_key",
+    "describe",
+}
+
+
+class _PipeLogHandler(logging.handlers.QueueHandler):
+    """Posílá záznamy logování z worker procesu do hlavního procesu"""
+
+    def __init__(self, send: Callable[[tuple], None]):
+        super().__init__(None)
+        self._send = send
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        self._send(("log", record))
+
+
+def _describe(translator: BaseTranslator) -> Dict[str, Any]:
+    """Stav překladače, který si hlavní proces drží lokálně (bez IPC při každém dotazu)"""
+    return {"configured": translator.is_configured(), "service_name": translator.service_name}
+
+
+def _worker_main(conn, service: str, snapshot: Dict[str, Any], api_key: str, workers: int, log_level: int) -> None:
+    """
+    Vstupní bod worker procesu - sestaví backend a obsluhuje požadavky
+
+    Protokol (tuple přes multiprocessing.Connection):
+        parent → child: ("call", request_id, method, args) / ("close",)
+        child → parent: ("ready", info) / ("result", request_id, value, error) / ("log", record)
+
+    Požadavky se zpracovávají souběžně v poolu vláken, odpovědi chodí
+    v pořadí dokončení - párují se podle request_id.
+
+    Args:
+        conn: Konec pipe v child procesu
+        service: Název backendu (translator_service)
+        snapshot: Konfigurace hlavního procesu
+        api_key: API klíč
+        workers: Počet souběžných požadavků
+        log_level: Úroveň logování hlavního procesu
+    """
+    send_lock = threading.Lock()
+
+    def send(message: tuple) -> None:
+        try:
+            with send_lock:
+                conn.send(message)
+        except (OSError, ValueError):
+            # Hlavní proces už pipe zavřel
+            pass
+
+    root = logging.getLogger()
+    for existing in list(root.handlers):
+        root.removeHandler(existing)
+    root.addHandler(_PipeLogHandler(send))
+    root.setLevel(log_level)
+
+    from transka.config import Config
+    from transka.backends import create_backend
+
+    # Stejná konfigurace jako v hlavním procesu (včetně neuložených změn)
+    config = Config()
+    config.config.update(snapshot)
+    config.api_key = api_key
+    translator = create_backend(service, config)
+    send(("ready", _describe(translator)))
+
+    def handle(request_id: int, method: str, args: tuple) -> None:
+        try:
+            if method == "describe":
+                value = _describe(translator)
+            else:
+                value = getattr(translator, method)(*args)
+            send(("result", request_id, value, None))
+        except Exception as e:
+            logger.error(f"Chyba v překladovém procesu ({method}): {e}", exc_info=True)
+            send(("result", request_id, None, f"{type(e).__name__}: {e}"))
+
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="translate") as executor:
+        while True:
+            try:
+                message = conn.recv()
+            except (EOFError, OSError):
+                break
+            if message[0] == "close":
+                break
+
+            _, request_id, method, args = message
+            if method not in ALLOWED_METHODS:
+                send(("result", request_id, None, f"Nepovolená metoda '{method}'"))
+                continue
+            executor.submit(handle, request_id, method, args)
+        # Rozpracované požadavky se dokončí (ukončení executoru na ně čeká)
+
+    # Router "auto" si statistiky ukládá sám - v tomto procesu
+    save_stats = getattr(translator, "save_stats", None)
+    if callable(save_stats):
+        save_stats()
+
+
+class ProcessTranslator(BaseTranslator):
+    """
+    Překladač, jehož backend běží ve worker procesu
+
+    Navenek plné rozhraní BaseTranslator - middleware pipeline (cache,
+    retry, metriky) zůstává v hlavním procesu, přes pipe jdou jen volání
+    backendu. Souběžné požadavky z více vláken se multiplexují přes jednu
+    pipe (request_id → Future). Při pádu procesu dostanou rozpracované
+    požadavky dočasnou chybu a spustí se nový proces.
+
+    Start procesu (import backendu) nikoho neblokuje - is_configured() a
+    service_name vrací lokální kopii stavu, po zprávě "ready" se zavolá
+    on_ready (z čtecího vlákna), aby si UI stav obnovilo.
+    """
+
+    def __init__(
+        self,
+        service: str,
+        snapshot: Dict[str, Any],
+        api_key: str,
+        workers: int = 4,
+        timeout: float = 60.0,
+        on_ready: Optional[Callable[[], None]] = None
+    ):
+        """
+        Inicializuje ProcessTranslator a spustí worker proces (neblokuje)
+
+        Args:
+            service: Název backendu (translator_service)
+            snapshot: Konfigurace (dict) pro sestavení backendu v procesu
+            api_key: API klíč
+            workers: Počet souběžných požadavků ve worker procesu
+            timeout: Max doba čekání na odpověď (s)
+            on_ready: Callback po nastartování procesu (i po restartu) - volá se z čtecího vlákna
+        """
+        self.service = service
+        self.snapshot = dict(snapshot)
+        self.api_key = api_key
+        self.workers = workers
+        self.timeout = timeout
+        self.on_ready = on_ready
+
+        self._context = multiprocessing.get_context("spawn")
+        self._pending: Dict[int, Future] = {}
+        self._request_ids = itertools.count(1)
+        self._send_lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._conn = None
+        self._process = None
+        self._closing = False
+        self._restarts = 0
+        self._ready = threading.Event()
+        # Do zprávy "ready" optimisticky nakonfigurován - nenakonfigurovaný backend
+        # vrátí chybu z worker procesu, UI se po "ready" obnoví přes on_ready
+        self._info: Dict[str, Any] = {"configured": True, "service_name": service.capitalize()}
+
+        self._ensure_started()
+
+    @classmethod
+    def from_config(cls, config, on_ready: Optional[Callable[[], None]] = None) -> "ProcessTranslator":
+        """Vytvoří worker pro backend z konfigurace (translator_service)"""
+        return cls(
+            config.translator_service,
+            dict(config.config),
+            config.api_key,
+            workers=config.translator_process_workers,
+            timeout=config.translator_process_timeout,
+            on_ready=on_ready
+        )
+
+    @property
+    def ready(self) -> bool:
+        """Worker proces nahlásil stav backendu (is_configured/service_name jsou platné)"""
+        return self._ready.is_set()
+
+    # --- Proces ---
+
+    def _ensure_started(self) -> bool:
+        """Spustí worker proces a čtecí vlákno, pokud neběží (False = vzdáno po opakovaných pádech)"""
+        with self._start_lock:
+            if self._process is not None and self._process.is_alive():
+                return True
+            if self._closing or self._restarts > MAX_RESTARTS:
+                return False
+
+            parent_conn, child_conn = self._context.Pipe()
+            process = self._context.Process(
+                target=_worker_main,
+                args=(
+                    child_conn,
+                    self.service,
+                    self.snapshot,
+                    self.api_key,
+                    self.workers,
+                    logging.getLogger().getEffectiveLevel()
+                ),
+                name="transka-translator",
+                daemon=True
+            )
+            process.start()
+            child_conn.close()
+            self._conn = parent_conn
+            self._process = process
+
+            threading.Thread(
+                target=self._read_loop,
+                args=(parent_conn,),
+                name="translator-ipc",
+                daemon=True
+            ).start()
+            logger.info(f"Překladač {self.service} spuštěn v procesu PID {process.pid}")
+            return True
+
+    def _read_loop(self, conn) -> None:
+        """Čte odpovědi worker procesu a předává je čekajícím požadavkům"""
+        while True:
+            try:
+                message = conn.recv()
+            except (EOFError, OSError):
+                break
+
+            kind = message[0]
+            if kind == "result":
+                _, request_id, value, error = message
+                future = self._pending.pop(request_id, None)
+                if future is not None:
+                    future.set_result((value, error))
+            elif kind == "log":
+                record = message[1]
+                logging.getLogger(record.name).handle(record)
+            elif kind == "ready":
+                self._info = message[1]
+                self._ready.set()
+                self._notify_ready()
+
+        with self._start_lock:
+            if self._conn is conn:
+                self._conn = None
+                self._process = None
+                if not self._closing:
+                    self._restarts += 1
+
+            # Rozpracované požadavky dostanou dočasnou chybu (retry / offline fronta)
+            error = "Překladový proces ukončen" if self._closing else "Překladový proces spadl (connection lost)"
+            for request_id in list(self._pending):
+                future = self._pending.pop(request_id, None)
+                if future is not None:
+                    future.set_result((None, error))
+        conn.close()
+
+        if not self._closing:
+            if self._restarts > MAX_RESTARTS:
+                logger.error("Překladový proces opakovaně padá, překlady jsou nedostupné")
+            else:
+                logger.warning("Překladový proces skončil, spouštím znovu")
+                self._ensure_started()
+
+    def _call(self, method: str, *args) -> Tuple[Any, Optional[str]]:
+        """
+        Zavolá metodu backendu ve worker procesu
+
+        Returns:
+            Tuple (návratová hodnota, chyba volání - pád procesu, timeout, výjimka)
+        """
+        if not self._ensure_started():
+            return None, "Překladový proces není dostupný"
+
+        request_id = next(self._request_ids)
+        future: Future = Future()
+        self._pending[request_id] = future
+        try:
+            with self._send_lock:
+                self._conn.send(("call", request_id, method, args))
+        except (AttributeError, OSError, ValueError) as e:
+            self._pending.pop(request_id, None)
+            return None, f"Překladový proces nedostupný (connection): {e}"
+
+        try:
+            return future.result(self.timeout)
+        except FutureTimeout:
+            self._pending.pop(request_id, None)
+            return None, f"Překladový proces neodpověděl (timeout {self.timeout:.0f} s)"
+
+    def _notify_ready(self) -> None:
+        """Ohlásí nový stav backendu (start, restart, změna klíče)"""
+        if self.on_ready is None:
+            return
+        try:
+            self.on_ready()
+        except Exception as e:
+            logger.error(f"Chyba v callbacku startu překladového procesu: {e}", exc_info=True)
+
+    def close(self, timeout: float = 1.0) -> None:
+        """
+        Ukončí worker proces
+
+        Args:
+            timeout: Jak dlouho nechat doběhnout rozpracované požadavky, pak se proces ukončí násilně
+        """
+        with self._start_lock:
+            self._closing = True
+            conn, process = self._conn, self._process
+        if conn is not None:
+            try:
+                with self._send_lock:
+                    conn.send(("close",))
+            except (OSError, ValueError):
+                pass
+        if process is not None:
+            process.join(timeout=timeout)
+            if process.is_alive():
+                logger.warning("Překladový proces neodpovídá, ukončuji ho")
+                process.terminate()
+                process.join(timeout=1.0)
+
+    # --- BaseTranslator ---
+
+    def is_configured(self) -> bool:
+        """Stav backendu z worker procesu (lokální kopie, nečeká na start procesu)"""
+        return bool(self._info.get("configured"))
+
+    def translate(
+        self,
+        text: str,
+        source_lang: str = "CS",
+        target_lang: str = "EN-US"
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """Přeloží text ve worker procesu"""
+        value, error = self._call("translate", text, source_lang, target_lang)
+        return (None, error) if error else value
+
+    def translate_batch(
+        self,
+        texts: List[str],
+        source_lang: str = "CS",
+        target_lang: str = "EN-US"
+    ) -> Tuple[Optional[List[str]], Optional[str]]:
+        """Přeloží dávku ve worker procesu (jedno volání přes pipe)"""
+        value, error = self._call("translate_batch", texts, source_lang, target_lang)
+        return (None, error) if error else value
+
+    def get_usage(self) -> Tuple[Optional[UsageInfo], Optional[str]]:
+        """Spotřeba API z worker procesu"""
+        value, error = self._call("get_usage")
+        return (None, error) if error else value
+
+    def get_available_languages(self) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]:
+        """Seznam jazyků z worker procesu"""
+        value, error = self._call("get_available_languages")
+        if error:
+            logger.error(f"Chyba při získávání jazyků: {error}")
+            return [], []
+        return value
+
+    def update_api_key(self, api_key: str) -> None:
+        """Předá nový klíč backendu (i pro případný restart procesu)"""
+        self.api_key = api_key
+        self._call("update_api_key", api_key)
+        info, error = self._call("describe")
+        if not error:
+            self._info = info
+            self._notify_ready()
+
+    @property
+    def service_name(self) -> str:
+        """Název služby backendu (lokální kopie, nečeká na start procesu)"""
+        return self._info.get("service_name", self.service)
@@ -4,10 +4,14 @@ System Tray Manager pro aplikaci Transka
 Spravuje system tray ikonu a menu
 """
 import threading
-from typing import Callable, Optional
+import logging
+from typing import Callable, List, Optional, Tuple, Union
 import pystray
 from PIL import Image, ImageDraw
 
+# Logging setup
+logger = logging.getLogger(__name__)
+
 
 class TrayManager:
     """Správce system tray ikony"""
@@ -16,7 +20,8 @@ class TrayManager:
         self,
         app_name: str,
         on_show: Callable[[], None],
-        on_quit: Callable[[], None]
+        on_quit: Callable[[], None],
+        extra_items: Optional[List[Tuple[Union[str, Callable[[], str]], Callable[[], None]]]] = None
     ):
         """
         Inicializuje TrayManager
@@ -25,10 +30,12 @@ class TrayManager:
             app_name: Název aplikace pro tooltip
             on_show: Callback pro zobrazení hlavního okna
             on_quit: Callback pro ukončení aplikace
+            extra_items: Další položky menu (text nebo funkce vracející text, callback)
         """
         self.app_name = app_name
         self.on_show = on_show
         self.on_quit = on_quit
+        self.extra_items = extra_items or []
         self.tray_icon: Optional[pystray.Icon] = None
 
     def _create_icon_image(self) -> Image.Image:
@@ -46,10 +53,16 @@ class TrayManager:
     def start(self):
         """Spustí system tray ikonu v separátním vlákně"""
         # Menu pro tray (Nastavení jsou teď v tabech, není třeba separátní položka)
-        menu = pystray.Menu(
-            pystray.MenuItem("Zobrazit", self.on_show),
-            pystray.MenuItem("Ukončit", self.on_quit)
-        )
+        items = [pystray.MenuItem("Zobrazit", self.on_show)]
+        if self.extra_items:
+            items.append(pystray.Menu.SEPARATOR)
+            for text, callback in self.extra_items:
+                # Dynamický text (např. Spustit/Zastavit) se vyhodnotí při otevření menu
+                label = (lambda item, text=text: text()) if callable(text) else text
+                items.append(pystray.MenuItem(label, callback))
+            items.append(pystray.Menu.SEPARATOR)
+        items.append(pystray.MenuItem("Ukončit", self.on_quit))
+        menu = pystray.Menu(*items)
 
         self.tray_icon = pystray.Icon(
             self.app_name.lower(),
@@ -62,6 +75,24 @@ class TrayManager:
         tray_thread = threading.Thread(target=self.tray_icon.run, daemon=True)
         tray_thread.start()
 
+    def notify(self, title: str, message: str):
+        """Zobrazí systémovou notifikaci (pokud ji backend podporuje)"""
+        if not self.tray_icon:
+            return
+        try:
+            self.tray_icon.notify(message, title)
+        except Exception as e:
+            logger.warning(f"Nelze zobrazit notifikaci: {e}")
+
+    def refresh_menu(self):
+        """Přegeneruje menu (dynamické texty položek)"""
+        if not self.tray_icon:
+            return
+        try:
+            self.tray_icon.update_menu()
+        except Exception as e:
+            logger.warning(f"Nelze aktualizovat menu: {e}")
+
     def stop(self):
         """Zastaví system tray ikonu"""
         if self.tray_icon:
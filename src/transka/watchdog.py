@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""
+UI Watchdog pro aplikaci Transka
+Měří odezvu Tk mainloopu přes heartbeat a při zaseknutí zaloguje
+stack hlavního vlákna - tedy volání, které mainloop blokuje
+"""
+from __future__ import annotations
+
+import sys
+import threading
+import time
+import traceback
+import logging
+from typing import Optional
+
+import tkinter as tk
+
+from transka.metrics import Metrics
+
+# Logging setup
+logger = logging.getLogger(__name__)
+
+
+class UIWatchdog:
+    """
+    Hlídač zaseknutí Tk hlavního vlákna
+
+    Mainloop každých heartbeat_ms spustí heartbeat (root.after). Samostatné
+    vlákno kontroluje stáří posledního heartbeatu - pokud překročí práh,
+    vezme přes sys._current_frames() aktuální stack hlavního vlákna a
+    zaloguje ho. Po obnovení odezvy se zaloguje celková délka zaseknutí.
+    """
+
+    def __init__(
+        self,
+        root: tk.Tk,
+        threshold_ms: int = 200,
+        heartbeat_ms: int = 50,
+        metrics: Optional[Metrics] = None
+    ):
+        """
+        Inicializuje UIWatchdog
+
+        Args:
+            root: Hlavní Tkinter okno
+            threshold_ms: Zaseknutí delší než tento práh se loguje
+            heartbeat_ms: Interval heartbeatu v mainloopu
+            metrics: Volitelné metriky (ui_lag, ui_stall, ui_stalls)
+        """
+        self.root = root
+        self.threshold = threshold_ms / 1000.0
+        self.heartbeat = heartbeat_ms / 1000.0
+        self.heartbeat_ms = heartbeat_ms
+        self.metrics = metrics or Metrics(enabled=False)
+
+        self._ui_thread_id: Optional[int] = None
+        self._last_beat = 0.0
+        self._stall_reported = False
+        self._after_id: Optional[str] = None
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Spustí heartbeat a monitor vlákno (volat z hlavního vlákna)"""
+        if self._thread is not None:
+            return
+        self._ui_thread_id = threading.get_ident()
+        self._last_beat = time.perf_counter()
+        self._stop_event.clear()
+        self._after_id = self.root.after(self.heartbeat_ms, self._beat)
+
+        self._thread = threading.Thread(target=self._monitor, name="ui-watchdog", daemon=True)
+        self._thread.start()
+        logger.info(f"UI watchdog spuštěn (práh {self.threshold * 1000:.0f} ms)")
+
+    def stop(self) -> None:
+        """Zastaví heartbeat a monitor vlákno"""
+        self._stop_event.set()
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except tk.TclError:
+                pass
+            self._after_id = None
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def _beat(self) -> None:
+        """Heartbeat v mainloopu - měří zpoždění oproti plánu"""
+        now = time.perf_counter()
+        elapsed = now - self._last_beat
+        self._last_beat = now
+        self.metrics.observe("ui_lag", max(0.0, elapsed - self.heartbeat))
+
+        if self._stall_reported:
+            self._stall_reported = False
+            self.metrics.observe("ui_stall", elapsed)
+            logger.warning(f"UI vlákno opět reaguje po {elapsed * 1000:.0f} ms")
+
+        if not self._stop_event.is_set():
+            self._after_id = self.root.after(self.heartbeat_ms, self._beat)
+
+    def _monitor(self) -> None:
+        """Monitor vlákno - detekuje chybějící heartbeat"""
+        interval = max(self.heartbeat / 2, 0.01)
+        while not self._stop_event.wait(interval):
+            # Čtení floatu z jiného vlákna je pod GIL atomické
+            silent = time.perf_counter() - self._last_beat
+            if silent < self.threshold + self.heartbeat or self._stall_reported:
+                continue
+
+            self._stall_reported = True
+            self.metrics.inc("ui_stalls")
+            logger.warning(
+                f"UI vlákno neodpovídá {silent * 1000:.0f} ms, aktuální stack:\n"
+                f"{self._format_ui_stack()}"
+            )
+
+    def _format_ui_stack(self) -> str:
+        """Vrátí stack hlavního vlákna jako text"""
+        frame = sys._current_frames().get(self._ui_thread_id)
+        if frame is None:
+            return "  (stack není dostupný)"
+        return "".join(traceback.format_stack(frame))
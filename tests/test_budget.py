@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""Testy BudgetScheduler (limity tříd, rezervace souběžných požadavků)"""
+from transka.budget import BATCH, INTERACTIVE, BudgetScheduler
+
+
+def make_budget(tmp_path, daily=1000):
+    return BudgetScheduler(tmp_path / "budget.json", limits={INTERACTIVE: {"daily": daily}})
+
+
+def test_check_does_not_count_unrecorded_requests(tmp_path):
+    budget = make_budget(tmp_path)
+
+    assert budget.check(INTERACTIVE, 600).allowed
+    assert budget.check(INTERACTIVE, 600).allowed
+    budget.record(INTERACTIVE, 600)
+    assert not budget.check(INTERACTIVE, 600).allowed
+
+
+def test_reservations_add_up(tmp_path):
+    budget = make_budget(tmp_path)
+
+    # Hlavní překlad + dva jazyky fan-outu se stejným textem
+    assert budget.reserve(INTERACTIVE, 400).allowed
+    assert budget.reserve(INTERACTIVE, 400).allowed
+    decision = budget.reserve(INTERACTIVE, 400)
+
+    assert not decision.allowed
+    assert decision.retry_after > 0
+    # Zamítnutá rezervace nic neblokuje
+    assert budget.check(INTERACTIVE, 200).allowed
+
+
+def test_commit_releases_reservation_and_records_sent(tmp_path):
+    budget = make_budget(tmp_path)
+
+    assert budget.reserve(INTERACTIVE, 800).allowed
+    assert not budget.check(INTERACTIVE, 300).allowed
+
+    # Zásah cache - rezervace se uvolní, nic se nezapíše
+    budget.commit(INTERACTIVE, 800, 0)
+    assert budget.check(INTERACTIVE, 1000).allowed
+
+    assert budget.reserve(INTERACTIVE, 800).allowed
+    budget.commit(INTERACTIVE, 800, 800)
+    assert not budget.check(INTERACTIVE, 300).allowed
+    assert budget.check(INTERACTIVE, 200).allowed
+
+
+def test_ledger_survives_restart(tmp_path):
+    budget = make_budget(tmp_path)
+    budget.record(BATCH, 49000)
+
+    restarted = make_budget(tmp_path)
+
+    # Výchozí denní limit BATCH je 50000
+    assert not restarted.check(BATCH, 2000).allowed
+    assert restarted.check(BATCH, 1000).allowed
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""Testy MainThreadDispatcher (buzení mainloopu místo rychlého pollingu)"""
+import threading
+import time
+
+from transka.dispatcher import MainThreadDispatcher
+
+
+class FakeRoot:
+    """Náhrada tk.Tk - zaznamenává naplánované časovače"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.timers = {}
+        self.next_id = 0
+
+    def after(self, ms, callback, *args):
+        with self.lock:
+            self.next_id += 1
+            after_id = f"after#{self.next_id}"
+            self.timers[after_id] = (ms, callback, args)
+        return after_id
+
+    def after_cancel(self, after_id):
+        with self.lock:
+            self.timers.pop(after_id, None)
+
+    def run_due(self, max_ms):
+        """Spustí časovače s prodlevou do max_ms (jeden průchod mainloopu)"""
+        with self.lock:
+            due = [(after_id, timer) for after_id, timer in self.timers.items() if timer[0] <= max_ms]
+            for after_id, _ in due:
+                del self.timers[after_id]
+        for _, (_, callback, args) in due:
+            callback(*args)
+        return len(due)
+
+
+def wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.001)
+    return True
+
+
+def test_idle_dispatcher_only_keeps_slow_timer():
+    root = FakeRoot()
+    dispatcher = MainThreadDispatcher(root, interval_ms=500, wake_from_threads=True)
+    dispatcher.start()
+
+    assert [timer[0] for timer in root.timers.values()] == [500]
+    dispatcher.stop()
+
+
+def test_post_wakes_mainloop_immediately():
+    root = FakeRoot()
+    dispatcher = MainThreadDispatcher(root, interval_ms=500, wake_from_threads=True)
+    dispatcher.start()
+    calls = []
+
+    threading.Thread(target=dispatcher.post, args=(calls.append, "hotovo")).start()
+
+    # Budicí vlákno naplánuje after(0) - nečeká se na záložní interval
+    assert wait_for(lambda: any(timer[0] == 0 for timer in list(root.timers.values())))
+    root.run_due(0)
+    assert calls == ["hotovo"]
+    # Po vyprázdnění zůstane jen záložní časovač
+    assert [timer[0] for timer in root.timers.values()] == [500]
+    dispatcher.stop()
+
+
+def test_coalesced_posts_run_once():
+    root = FakeRoot()
+    dispatcher = MainThreadDispatcher(root, interval_ms=500, wake_from_threads=True)
+    dispatcher.start()
+    calls = []
+
+    dispatcher.post_coalesced("status", calls.append, 1)
+    dispatcher.post_coalesced("status", calls.append, 2)
+
+    assert wait_for(lambda: any(timer[0] == 0 for timer in list(root.timers.values())))
+    root.run_due(0)
+    assert calls == [2]
+    dispatcher.stop()
+
+
+def test_without_thread_support_falls_back_to_polling():
+    root = FakeRoot()
+    dispatcher = MainThreadDispatcher(root, interval_ms=500)
+
+    # FakeRoot nemá Tcl interpret - vláknová podpora nezjištěna
+    assert not dispatcher.wake_from_threads
+    assert dispatcher.interval_ms == 15
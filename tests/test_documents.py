@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""Testy překladu dokumentů (upload → polling → stažení) s falešným DeepL klientem"""
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from transka.budget import BATCH, BudgetScheduler
+from transka.documents import (
+    MAX_POLL_INTERVAL,
+    MIN_POLL_INTERVAL,
+    STATUS_DONE,
+    STATUS_ERROR,
+    DocumentTranslator,
+    next_poll_interval,
+)
+
+
+def status(done=False, ok=True, seconds_remaining=None, billed_characters=None, error_message=None):
+    return SimpleNamespace(
+        done=done,
+        ok=ok,
+        seconds_remaining=seconds_remaining,
+        billed_characters=billed_characters,
+        error_message=error_message,
+    )
+
+
+class FakeClient:
+    """Náhrada DeepLTranslator - stavy dokumentu podle připraveného scénáře"""
+
+    def __init__(self, statuses, content=b"translated", download_error=None):
+        self.statuses = list(statuses)
+        self.content = content
+        self.download_error = download_error
+        self.uploaded = []
+        self.polls = 0
+
+    def upload_document(self, f, filename, source_lang, target_lang):
+        self.uploaded.append((f.read(), filename, source_lang, target_lang))
+        return "handle", None
+
+    def get_document_status(self, handle):
+        self.polls += 1
+        return self.statuses.pop(0) if len(self.statuses) > 1 else self.statuses[0], None
+
+    def download_document(self, handle, f):
+        f.write(self.content)
+        return self.download_error
+
+
+def run_job(client, source, budget=None, timeout=30.0):
+    """Spustí překlad a počká na jeho dokončení"""
+    finished = threading.Event()
+    translator = DocumentTranslator(
+        lambda: client,
+        budget=budget,
+        timeout=timeout,
+        on_update=lambda job: job.finished and finished.set()
+    )
+    job = translator.submit(source, "CS", "EN-US")
+    assert finished.wait(10.0)
+    translator.stop()
+    return job
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "zprava.txt"
+    path.write_text("Ahoj světe", encoding="utf-8")
+    return path
+
+
+def test_next_poll_interval():
+    # Odhad DeepL má přednost, omezený mezemi
+    assert next_poll_interval(1.0, 3) == 3.0
+    assert next_poll_interval(1.0, 0) == MIN_POLL_INTERVAL
+    assert next_poll_interval(1.0, 3600) == MAX_POLL_INTERVAL
+    # Bez odhadu geometrický růst
+    assert next_poll_interval(1.0, None) == 1.5
+    assert next_poll_interval(MAX_POLL_INTERVAL, None) == MAX_POLL_INTERVAL
+
+
+def test_success_downloads_and_records_billed_characters(source, tmp_path):
+    budget = BudgetScheduler(tmp_path / "budget.json", limits={BATCH: {"daily": 1000}})
+    client = FakeClient([status(seconds_remaining=0), status(done=True, billed_characters=900)])
+
+    job = run_job(client, source, budget)
+
+    assert job.status == STATUS_DONE
+    assert job.error is None
+    assert job.billed_characters == 900
+    assert client.polls == 2
+    assert client.uploaded[0][1:] == ("zprava.txt", "CS", "EN-US")
+    assert job.output_path == tmp_path / "zprava.EN-US.txt"
+    assert job.output_path.read_bytes() == b"translated"
+    assert not (tmp_path / "zprava.EN-US.txt.part").exists()
+    # Fakturované znaky jsou v rozpočtu BATCH, rezervace uvolněna
+    assert not budget.check(BATCH, 200).allowed
+    assert budget.check(BATCH, 100).allowed
+
+
+def test_error_status(source):
+    client = FakeClient([status(ok=False, error_message="Nepodporovaný dokument")])
+
+    job = run_job(client, source)
+
+    assert job.status == STATUS_ERROR
+    assert job.error == "Nepodporovaný dokument"
+    assert not job.output_path.exists()
+
+
+def test_timeout(source):
+    client = FakeClient([status(seconds_remaining=60)])
+
+    job = run_job(client, source, timeout=1.0)
+
+    assert job.status == STATUS_ERROR
+    assert "trvá déle" in job.error
+    assert client.polls == 1
+
+
+def test_failed_download_keeps_existing_output(source, tmp_path):
+    output = tmp_path / "zprava.EN-US.txt"
+    output.write_bytes(b"previous")
+    client = FakeClient([status(done=True, billed_characters=10)], content=b"partial", download_error="Spojení přerušeno")
+
+    job = run_job(client, source)
+
+    assert job.status == STATUS_ERROR
+    assert job.error == "Spojení přerušeno"
+    assert output.read_bytes() == b"previous"
+    assert not (tmp_path / "zprava.EN-US.txt.part").exists()
+
+
+def test_budget_refusal_skips_upload(source, tmp_path):
+    budget = BudgetScheduler(tmp_path / "budget.json", limits={BATCH: {"daily": 5}})
+    client = FakeClient([status(done=True)])
+
+    job = run_job(client, source, budget)
+
+    assert job.status == STATUS_ERROR
+    assert "rozpočet" in job.error
+    assert client.uploaded == []
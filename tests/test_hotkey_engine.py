@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""Testy HotkeyEngine (párování podle scan kódů, autorepeat, sekvence)"""
+import sys
+import types
+from collections import namedtuple
+
+import pytest
+
+from transka.hotkey_engine import HotkeyEngine, MOD_CTRL, MOD_SHIFT, parse_hotkey
+
+KeyEvent = namedtuple("KeyEvent", "event_type name scan_code time")
+
+# Scan kódy US rozložení (Windows)
+SCAN_CODES = {"ctrl": 29, "shift": 42, "1": 2, "p": 25, "k": 37, "c": 46}
+
+
+@pytest.fixture
+def fake_keyboard(monkeypatch):
+    """Náhrada knihovny keyboard - bez skutečného hooku"""
+    module = types.ModuleType("keyboard")
+
+    def key_to_scan_codes(name):
+        if name not in SCAN_CODES:
+            raise ValueError(f"Neznámá klávesa {name}")
+        return (SCAN_CODES[name],)
+
+    module.key_to_scan_codes = key_to_scan_codes
+    module.hook = lambda callback: callback
+    module.unhook = lambda hook: None
+    monkeypatch.setitem(sys.modules, "keyboard", module)
+    return module
+
+
+def press(engine, name, scan_code, at, up_name=None):
+    """Stisk a uvolnění klávesy (uvolnění může mít jiný název)"""
+    engine.process_event(KeyEvent("down", name, scan_code, at))
+    engine.process_event(KeyEvent("up", up_name or name, scan_code, at + 0.01))
+
+
+def test_parse_hotkey():
+    assert parse_hotkey("ctrl+shift+1") == [(MOD_CTRL | MOD_SHIFT, "1")]
+    assert parse_hotkey("ctrl+p+p") == [(MOD_CTRL, "p"), (MOD_CTRL, "p")]
+    assert parse_hotkey("ctrl+k, ctrl+c") == [(MOD_CTRL, "k"), (MOD_CTRL, "c")]
+    with pytest.raises(ValueError):
+        parse_hotkey("ctrl+shift")
+
+
+def test_shifted_key_name_matches_scan_code(fake_keyboard):
+    fired = []
+    engine = HotkeyEngine()
+    engine.add("test", "ctrl+shift+1", lambda: fired.append(True))
+
+    # Windows hook hlásí Shift+1 jako "!"
+    engine.process_event(KeyEvent("down", "ctrl", 29, 1.0))
+    engine.process_event(KeyEvent("down", "shift", 42, 1.0))
+    press(engine, "!", 2, 1.1)
+
+    assert fired == [True]
+
+
+def test_release_with_different_name_does_not_block_key(fake_keyboard):
+    fired = []
+    engine = HotkeyEngine()
+    engine.add("test", "ctrl+shift+1", lambda: fired.append(True))
+
+    # Shift puštěn dřív - stisk "!", uvolnění "1"
+    engine.process_event(KeyEvent("down", "ctrl", 29, 1.0))
+    engine.process_event(KeyEvent("down", "shift", 42, 1.0))
+    engine.process_event(KeyEvent("down", "!", 2, 1.1))
+    engine.process_event(KeyEvent("up", "shift", 42, 1.2))
+    engine.process_event(KeyEvent("up", "1", 2, 1.3))
+
+    engine.process_event(KeyEvent("down", "shift", 42, 2.0))
+    press(engine, "!", 2, 2.1)
+
+    assert fired == [True, True]
+
+
+def test_lost_release_is_cleared_with_modifiers(fake_keyboard):
+    fired = []
+    engine = HotkeyEngine()
+    engine.add("test", "ctrl+p", lambda: fired.append(True))
+
+    engine.process_event(KeyEvent("down", "ctrl", 29, 1.0))
+    engine.process_event(KeyEvent("down", "p", 25, 1.1))  # Uvolnění P se ztratí
+    engine.process_event(KeyEvent("up", "ctrl", 29, 1.2))
+
+    engine.process_event(KeyEvent("down", "ctrl", 29, 2.0))
+    press(engine, "p", 25, 2.1)
+
+    assert fired == [True, True]
+
+
+def test_autorepeat_is_not_a_second_press(fake_keyboard):
+    fired = []
+    engine = HotkeyEngine(sequence_timeout=0.5)
+    engine.add("double", "ctrl+p+p", lambda: fired.append(True))
+
+    engine.process_event(KeyEvent("down", "ctrl", 29, 1.0))
+    engine.process_event(KeyEvent("down", "p", 25, 1.1))
+    engine.process_event(KeyEvent("down", "p", 25, 1.15))  # Autorepeat
+    assert fired == []
+
+    engine.process_event(KeyEvent("up", "p", 25, 1.2))
+    press(engine, "p", 25, 1.3)
+    assert fired == [True]
+
+
+def test_sequence_timeout(fake_keyboard):
+    fired = []
+    engine = HotkeyEngine(sequence_timeout=0.5)
+    engine.add("chord", "ctrl+k, ctrl+c", lambda: fired.append(True))
+
+    engine.process_event(KeyEvent("down", "ctrl", 29, 1.0))
+    press(engine, "k", 37, 1.1)
+    press(engine, "c", 46, 2.0)  # Po vypršení okna
+    assert fired == []
+
+    press(engine, "k", 37, 3.0)
+    press(engine, "c", 46, 3.2)
+    assert fired == [True]
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""Testy inkrementálního překladu (diff odstavců, zachování formátování)"""
+from typing import List, Optional, Tuple
+
+from transka.base_translator import BaseTranslator, UsageInfo
+from transka.incremental import IncrementalTranslator, join_paragraphs, split_layout
+
+
+class UpperTranslator(BaseTranslator):
+    """Překlad = velká písmena, zaznamenává odeslané texty"""
+
+    def __init__(self):
+        self.sent: List[str] = []
+
+    def is_configured(self) -> bool:
+        return True
+
+    def translate(self, text: str, source_lang: str = "CS", target_lang: str = "EN-US") -> Tuple[Optional[str], Optional[str]]:
+        self.sent.append(text)
+        return text.upper(), None
+
+    def get_usage(self) -> Tuple[Optional[UsageInfo], Optional[str]]:
+        return None, None
+
+    def get_available_languages(self) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]:
+        return [], []
+
+    def update_api_key(self, api_key: str) -> None:
+        pass
+
+    @property
+    def service_name(self) -> str:
+        return "Upper"
+
+
+def test_split_layout_keeps_separators():
+    text = "první\n\n\n  druhý\n \t\n\ntřetí\nřádek"
+
+    paragraphs, separators = split_layout(text)
+
+    assert paragraphs == ["první", "  druhý", "třetí\nřádek"]
+    assert separators == ["\n\n\n", "\n \t\n\n"]
+    assert join_paragraphs(paragraphs, separators) == text
+
+
+def test_only_changed_paragraphs_are_sent():
+    translator = UpperTranslator()
+    incremental = IncrementalTranslator()
+    incremental.translate(translator, "jedna\n\ndva\n\ntři", "CS", "EN-US")
+    translator.sent.clear()
+
+    outcome = incremental.translate(translator, "jedna\n\nDVA změněno\n\ntři", "CS", "EN-US")
+
+    assert translator.sent == ["DVA změněno"]
+    assert outcome.text == "JEDNA\n\nDVA ZMĚNĚNO\n\nTŘI"
+    assert outcome.sent_chars == len("DVA změněno")
+    assert outcome.reused_paragraphs == 2
+
+
+def test_splice_uses_separators_of_new_input():
+    translator = UpperTranslator()
+    incremental = IncrementalTranslator()
+    incremental.translate(translator, "jedna\n\ndva\n\ntři", "CS", "EN-US")
+
+    outcome = incremental.translate(translator, "jedna\n\n\n\ndva\n\nčtyři\n \ntři", "CS", "EN-US")
+
+    assert outcome.text == "JEDNA\n\n\n\nDVA\n\nČTYŘI\n \nTŘI"
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""Testy LibreTranslate backendu proti lokálnímu zástupnému serveru"""
+import json
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+from transka.backends import DEFAULT_BACKEND, create_backend, load_backend
+from transka.base_translator import is_transient_error
+from transka.config import Config
+from transka.libretranslate_translator import LibreTranslateTranslator
+
+LANGUAGES = [{"code": "en", "name": "English"}, {"code": "cs", "name": "Czech"}]
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Minimální LibreTranslate API (POST /translate, GET /languages)"""
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.server.requests.append(payload)
+        if self.server.fail_status:
+            self._reply(self.server.fail_status, {"error": "Server přetížen"})
+            return
+        q = payload["q"]
+        translated = [f"[{payload['target']}] {text}" for text in q] if isinstance(q, list) else f"[{payload['target']}] {q}"
+        self._reply(200, {"translatedText": translated})
+
+    def do_GET(self):
+        if self.path == "/languages":
+            self._reply(200, LANGUAGES)
+        else:
+            self._reply(404, {"error": "Not found"})
+
+    def _reply(self, status, data):
+        body = json.dumps(data).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = HTTPServer(("127.0.0.1", 0), StandInHandler)
+    httpd.requests = []
+    httpd.fail_status = 0
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def make_translator(httpd, api_key=""):
+    host, port = httpd.server_address
+    return LibreTranslateTranslator(f"http://{host}:{port}/", api_key=api_key, timeout=5.0)
+
+
+def test_translate_sends_single_q(server):
+    translator = make_translator(server, api_key="tajne")
+
+    result, error = translator.translate("Ahoj", "CS", "EN-US")
+
+    assert (result, error) == ("[en] Ahoj", None)
+    assert server.requests == [{"q": "Ahoj", "source": "cs", "target": "en", "format": "text", "api_key": "tajne"}]
+
+
+def test_translate_batch_sends_q_list(server):
+    translator = make_translator(server)
+
+    results, error = translator.translate_batch(["Ahoj", "Světe"], "AUTO", "DE")
+
+    assert error is None
+    assert results == ["[de] Ahoj", "[de] Světe"]
+    assert server.requests[0]["q"] == ["Ahoj", "Světe"]
+    assert server.requests[0]["source"] == "auto"
+    assert "api_key" not in server.requests[0]
+    assert translator.get_usage()[0].character_count == len("Ahoj") + len("Světe")
+
+
+def test_http_error_is_transient_for_5xx(server):
+    server.fail_status = 503
+    translator = make_translator(server)
+
+    result, error = translator.translate("Ahoj")
+
+    assert result is None
+    assert "503" in error and "Server přetížen" in error
+    assert is_transient_error(error)
+
+
+def test_http_error_is_not_transient_for_4xx(server):
+    server.fail_status = 403
+    translator = make_translator(server)
+
+    _, error = translator.translate("Ahoj")
+
+    assert "403" in error
+    assert not is_transient_error(error)
+
+
+def test_connection_refused_is_transient():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    translator = LibreTranslateTranslator(f"http://127.0.0.1:{port}", timeout=2.0)
+
+    result, error = translator.translate("Ahoj")
+
+    assert result is None
+    assert "connection" in error
+    assert is_transient_error(error)
+
+
+def test_languages(server):
+    translator = make_translator(server)
+
+    source, target = translator.get_available_languages()
+
+    assert source == [("AUTO", "Automatická detekce"), ("en", "English"), ("cs", "Czech")]
+    assert target == [("en", "English"), ("cs", "Czech")]
+
+
+def test_backend_registry():
+    assert load_backend("libretranslate") is LibreTranslateTranslator
+    with pytest.raises(KeyError):
+        load_backend("neexistuje")
+
+    config = Config()
+    assert isinstance(create_backend("libretranslate", config), LibreTranslateTranslator)
+    # Překlep v config.json - aplikace nastartuje s výchozím backendem
+    fallback = create_backend("neexistuje", config)
+    assert isinstance(fallback, load_backend(DEFAULT_BACKEND))
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""Testy routeru překladačů (výběr backendu podle statistik)"""
+from typing import List, Optional, Tuple
+
+from transka.base_translator import BaseTranslator, UsageInfo
+from transka.router import MIN_SAMPLES, RoutingTranslator
+
+
+class StubTranslator(BaseTranslator):
+    """Backend, který vždy uspěje, nebo vždy vrátí danou chybu"""
+
+    def __init__(self, error: Optional[str] = None):
+        self.error = error
+        self.calls = 0
+
+    def is_configured(self) -> bool:
+        return True
+
+    def translate(self, text: str, source_lang: str = "CS", target_lang: str = "EN-US") -> Tuple[Optional[str], Optional[str]]:
+        self.calls += 1
+        if self.error:
+            return None, self.error
+        return text.upper(), None
+
+    def get_usage(self) -> Tuple[Optional[UsageInfo], Optional[str]]:
+        return None, None
+
+    def get_available_languages(self) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]:
+        return [], []
+
+    def update_api_key(self, api_key: str) -> None:
+        pass
+
+    @property
+    def service_name(self) -> str:
+        return "Stub"
+
+
+class FakeClock:
+    """Každé volání posune čas o pevný krok"""
+
+    def __init__(self, step: float):
+        self.now = 0.0
+        self.step = step
+
+    def __call__(self) -> float:
+        self.now += self.step / 2
+        return self.now
+
+
+def test_failing_backend_is_not_preferred():
+    # Neplatný klíč selže okamžitě a není dočasná chyba - router nezkusí další backend
+    broken = StubTranslator(error="Neplatný API klíč")
+    working = StubTranslator()
+    router = RoutingTranslator(
+        {"broken": broken, "working": working},
+        explore=0.0,
+        clock=FakeClock(step=0.3)
+    )
+
+    # Zahřátí - oba backendy nasbírají MIN_SAMPLES vzorků
+    for _ in range(MIN_SAMPLES * 2):
+        router.translate("ahoj")
+    broken.calls = working.calls = 0
+
+    results = [router.translate("ahoj") for _ in range(20)]
+
+    assert broken.calls == 0
+    assert working.calls == 20
+    assert all(result == ("AHOJ", None) for result in results)
+
+
+def test_failure_is_charged_latency_budget():
+    router = RoutingTranslator({"broken": StubTranslator(error="Neplatný API klíč")}, latency_budget=5.0)
+
+    router._record("broken", "short", 0.001, "Neplatný API klíč", True)
+
+    stats = router._stats[("broken", "short")]
+    assert stats.latency == 5.0
+    assert stats.expected_latency > router.latency_budget
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+"""Testy ProcessTranslator (backend ve worker procesu, neblokující start)"""
+import threading
+import time
+
+from transka.config import Config
+from transka.translator_process import ProcessTranslator
+
+
+def test_state_queries_do_not_wait_for_worker_start():
+    ready = threading.Event()
+    config = Config()
+    config.config["libretranslate_url"] = "http://127.0.0.1:9"
+
+    started = time.perf_counter()
+    translator = ProcessTranslator("libretranslate", dict(config.config), "", on_ready=ready.set)
+    try:
+        # Dotazy z UI vlákna vrací lokální kopii stavu hned, bez čekání na import backendu
+        configured = translator.is_configured()
+        name = translator.service_name
+        elapsed = time.perf_counter() - started
+
+        assert configured
+        assert name
+        if not translator.ready:
+            assert elapsed < 1.0
+
+        # Po startu procesu přijde callback a stav je z backendu
+        assert ready.wait(30.0)
+        assert translator.ready
+        assert translator.service_name == "LibreTranslate"
+    finally:
+        translator.close()